@@ -1,4 +1,5 @@
 from aflow.control import search
+from aflow.downloads import download
 
 _keywords = []
 """list of `str` keyword names available in AFLOW.
@@ -9,14 +10,21 @@ def list_keywords():
     """
     global _keywords
     if len(_keywords) == 0:
-        from aflow.keywords import Keyword
-        import aflow.keywords as kw
-        from inspect import getmembers
-        
-        for name, o in getmembers(kw):
-            if isinstance(o, Keyword):
-                _keywords.append(name)
+        from aflow.schema import keywords
+        _keywords.extend(sorted(keywords))
 
     return _keywords
 
-import aflow.keywords as K
+def __getattr__(name):
+    """Imports the keywords module the first time that `aflow.K` is accessed,
+    so that `import aflow` stays fast for scripts that don't need it.
+    """
+    if name == "K":
+        import aflow.keywords as K
+        return K
+    raise AttributeError("module 'aflow' has no attribute '{}'".format(name))
+
+from sys import version_info as _version
+if _version < (3, 7): # pragma: no cover
+    #Module-level `__getattr__` isn't supported; import the keywords eagerly.
+    import aflow.keywords as K
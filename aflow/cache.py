@@ -0,0 +1,251 @@
+"""Process-wide caches that allow data fetched for one query to be re-used
+by all the others in the same session.
+"""
+from collections import OrderedDict
+from threading import Lock
+from aflow import caster
+
+class LRUCache(object):
+    """Bounded key-value store that evicts the least recently used items once
+    it is full. Access is thread-safe.
+
+    Args:
+        maxsize (int): maximum number of items to keep.
+
+    Attributes:
+        maxsize (int): maximum number of items to keep.
+        hits (int): number of successful lookups.
+        misses (int): number of lookups for keys that weren't present.
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        """Returns the value for the specified key and marks it as recently
+        used.
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+            return default
+
+    def setdefault(self, key, value):
+        """Returns the value for the specified key; if it isn't present, the
+        given value is inserted first (evicting old items if necessary).
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+
+            self.misses += 1
+            self._items[key] = value
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+            return value
+
+    def clear(self):
+        """Removes all items from the cache.
+        """
+        with self._lock:
+            self._items.clear()
+
+identity = None
+""":class:`LRUCache`: identity map of the attribute dictionaries of all
+entries in the session, keyed by `auid` and dtype policy; `None` if it isn't
+enabled.
+"""
+
+_identity_lock = Lock()
+"""threading.Lock: serializes merging new attributes into the shared
+dictionaries of the identity map.
+"""
+
+def enable_identity_map(maxsize=100000):
+    """Enables the process-wide identity map. Once enabled, all
+    :class:`~aflow.entries.Entry` objects with the same `auid` (and dtype
+    policy) share a single attributes dictionary: values from all queries
+    are merged, and a keyword that was lazily loaded for one of them is never
+    requested again.
+
+    Args:
+        maxsize (int): maximum number of materials to track; the least
+          recently used ones are evicted first. Entries that still exist keep
+          their attributes after eviction.
+    """
+    global identity
+    identity = LRUCache(maxsize)
+
+def disable_identity_map():
+    """Disables the process-wide identity map and discards its contents.
+    """
+    global identity
+    identity = None
+
+def shared_attributes(attributes, policy=None):
+    """Returns the attributes dictionary shared by all entries for the same
+    material, merged with the specified attributes.
+
+    Args:
+        attributes (dict): cast key-value pairs of a new entry.
+        policy (aflow.caster.DtypePolicy): dtype policy that the values were
+          cast with; entries with different policies don't share their
+          attributes, since the values have different types.
+
+    Returns:
+        dict: the shared dictionary, or `attributes` itself if the identity map
+        isn't enabled or the entry has no `auid`.
+    """
+    if identity is None or "auid" not in attributes:
+        return attributes
+
+    if policy is None:
+        policy = caster.dtypes
+    with _identity_lock:
+        shared = identity.setdefault((attributes["auid"], policy), attributes)
+        if shared is not attributes:
+            shared.update(attributes)
+    return shared
+
+cachedir = None
+"""str: root folder for the persistent caches that are shared between
+sessions; `None` if they aren't enabled.
+"""
+
+def set_cachedir(folder):
+    """Enables the persistent caches in the specified folder.
+
+    Args:
+        folder (str): path to the root folder for the caches; it is created if
+          it doesn't exist. `None` disables the persistent caches.
+    """
+    global cachedir
+    if folder is None:
+        cachedir = None
+        return
+
+    from os import path, makedirs
+    folder = path.abspath(path.expanduser(folder))
+    if not path.isdir(folder):
+        makedirs(folder)
+    cachedir = folder
+
+def _path(kind, auid, filename, folder=None):
+    """Returns the path to a file in the persistent cache, or `None` if the
+    cache isn't enabled or the material has no `auid`.
+    """
+    from os import path
+    folder = folder if folder is not None else cachedir
+    if folder is None or auid is None:
+        return None
+    return path.join(folder, kind, auid.replace(':', '_'), filename)
+
+def _write(target, writer):
+    """Writes a cache file atomically using the specified `writer(file)`
+    function, so that concurrent readers never see partial files.
+    """
+    import os
+    from tempfile import NamedTemporaryFile
+    folder = os.path.dirname(target)
+    if not os.path.isdir(folder):
+        try:
+            os.makedirs(folder)
+        except OSError:# pragma: no cover
+            #Another process or thread created the folder in the meantime.
+            pass
+
+    with NamedTemporaryFile(dir=folder, delete=False) as f:
+        writer(f)
+    os.replace(f.name, target)
+
+def load_structure(auid, filename, folder=None):
+    """Loads a parsed structure from the persistent cache.
+
+    Args:
+        auid (str): AFLOW unique identifier of the material.
+        filename (str): name of the structure file (e.g. `CONTCAR.relax2`).
+        folder (str): root folder of the caches; defaults to :data:`cachedir`.
+
+    Returns:
+        tuple: `(lattice, positions, symbols)` as returned by
+        :func:`aflow.structure.read_poscar`, or `None` if it isn't cached.
+    """
+    from os import path
+    target = _path("structures", auid, filename + ".npz", folder)
+    if target is None or not path.isfile(target):
+        return None
+
+    import numpy as np
+    with np.load(target) as data:
+        return data["lattice"], data["positions"], data["symbols"].tolist()
+
+def save_structure(auid, filename, structure, folder=None):
+    """Saves a parsed structure to the persistent cache, if it is enabled.
+
+    Args:
+        auid (str): AFLOW unique identifier of the material.
+        filename (str): name of the structure file (e.g. `CONTCAR.relax2`).
+        structure (tuple): `(lattice, positions, symbols)` to save.
+        folder (str): root folder of the caches; defaults to :data:`cachedir`.
+    """
+    target = _path("structures", auid, filename + ".npz", folder)
+    if target is None:
+        return
+
+    import numpy as np
+    lattice, positions, symbols = structure
+    _write(target, lambda f: np.savez(f, lattice=lattice, positions=positions,
+                                      symbols=np.array(symbols)))
+
+def load_listing(auid, folder=None):
+    """Loads the list of files for a material from the persistent cache.
+
+    Args:
+        auid (str): AFLOW unique identifier of the material.
+        folder (str): root folder of the caches; defaults to :data:`cachedir`.
+
+    Returns:
+        tuple: `(aurl, files)` where `files` is a `list` of file names, or
+        `None` if it isn't cached.
+    """
+    from os import path
+    target = _path("listings", auid, "files.json", folder)
+    if target is None or not path.isfile(target):
+        return None
+
+    import json
+    with open(target) as f:
+        listing = json.load(f)
+    return listing["aurl"], listing["files"]
+
+def save_listing(auid, aurl, files, folder=None):
+    """Saves the list of files for a material to the persistent cache, if it
+    is enabled.
+
+    Args:
+        auid (str): AFLOW unique identifier of the material.
+        aurl (str): URL of the material in AFLOW.
+        files (list): of `str` file names.
+        folder (str): root folder of the caches; defaults to :data:`cachedir`.
+    """
+    target = _path("listings", auid, "files.json", folder)
+    if target is None:
+        return
+
+    import json
+    contents = json.dumps({"aurl": aurl, "files": files}).encode("utf-8")
+    _write(target, lambda f: f.write(contents))
@@ -2,14 +2,18 @@
 creates :class:`numpy.ndarray` for vector or tensor-valued properties.
 """
 import re
-import numpy as np
+from six.moves import intern
 from aflow import msg
+from aflow.schema import columns as _columns
 
 _rx_int = re.compile(r"^\d+$")
 
 def _strings(value):
     return list(value.split(','))
 
+def _interned(value):
+    return list(map(intern, value.split(',')))
+
 def _number(value):
     if _rx_int.match(value):
         return int(value)
@@ -17,16 +21,75 @@ def _number(value):
         return float(value)
 
 def _numbers(value):
+    import numpy as np
     svals = list(value.split(','))
     vals = list(map(_number, svals))
     return np.array(vals)
 
-def _forces(value):
-    atoms = value.split(';')
-    forces = [list(map(float, a.split(','))) for a in atoms]
-    return np.array(forces)
+def _integer(value):
+    """Parses the value of a keyword whose values are integers according to
+    the schema, falling back to :func:`_number` if it isn't one.
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return _number(value)
+
+def _vector(value, dtype):
+    """Parses a `,`-separated list of numbers into an array with the dtype
+    from the schema, without deciding between `int` and `float` one value at
+    a time. Falls back to :func:`_numbers` if the values don't have that type.
+    """
+    import numpy as np
+    try:
+        return np.array(value.split(','), dtype=dtype)
+    except ValueError:
+        return _numbers(value)
+
+def _fixed(value, dtype, shape):
+    """Parses a `,`-separated list of numbers that always has the same number
+    of values into an array with the specified dtype and shape.
+
+    Raises:
+        ValueError: if the string is malformed or has the wrong number of
+          values.
+    """
+    import numpy as np
+    result = np.array(value.split(','), dtype=dtype)
+    return result.reshape(shape)
+
+def _forces(value, natoms=None):
+    """Parses a `;`-separated list of `,`-separated 3-vectors (one per atom)
+    into a :class:`numpy.ndarray` with shape `(natoms, 3)`.
+
+    .. note:: The string is parsed in a single pass by numpy without building
+      intermediate lists of python floats; this path dominates the casting
+      time for large cells.
+
+    Args:
+        value (str): of the form `"x,y,z;x,y,z;..."`.
+        natoms (int): expected number of atoms in the cell; if specified, the
+          number of parsed vectors is validated against it.
+
+    Raises:
+        ValueError: if the string is malformed or the number of vectors does
+          not match `natoms`.
+    """
+    import numpy as np
+    flat = value.replace(';', ',')
+    result = np.fromstring(flat, dtype=np.float64, sep=',')
+    #`fromstring` stops silently at the first token it can't parse, so we have
+    #to check that everything was consumed.
+    if result.size != flat.count(',') + 1 or result.size % 3 != 0:
+        raise ValueError("Malformed vector string: {}".format(value))
+    result = result.reshape(-1, 3)
+    if natoms is not None and len(result) != int(natoms):
+        raise ValueError("Expected {} vectors; found {}.".format(natoms,
+                                                                 len(result)))
+    return result
 
 def _kpoints(value):
+    import numpy as np
     parts = value.split(';')
     relaxation = np.array(list(map(_number, parts[0].split(','))))
     if len(parts) == 1:
@@ -95,6 +158,135 @@ exceptions = ["forces", "kpoints", "positions_cartesian",
 way.
 """
 
+categorical = ["Bravais_lattice_orig", "Bravais_lattice_relax", "Egap_type",
+               "Pearson_symbol_orig", "Pearson_symbol_relax", "aflow_version",
+               "aflowlib_version", "code", "data_api", "data_source",
+               "dft_type", "lattice_system_orig", "lattice_system_relax",
+               "lattice_variation_orig", "lattice_variation_relax", "loop",
+               "node_CPU_Model", "prototype", "sg", "sg2", "species",
+               "species_pp", "species_pp_version"]
+"""list: of AFLOW keywords with only a handful of distinct values across the
+whole database. Their strings are interned when cast, and they are encoded as
+:class:`aflow.columns.Categorical` in columnar outputs.
+"""
+
+def intern_value(keyword, value):
+    """Interns the specified raw value if the keyword is :data:`categorical`
+    so that all entries share a single copy of the string.
+
+    Args:
+        keyword (str): name of the keyword that the value belongs to.
+        value: raw value returned by AFLUX.
+    """
+    if keyword in categorical and isinstance(value, str):
+        return intern(value)
+    return value
+
+class DtypePolicy(object):
+    """Describes the :mod:`numpy` data types that numeric values are cast
+    to. The default casting produces `float64` (or `int64`) arrays; a policy
+    allows smaller types to be used when the full precision isn't needed.
+
+    Args:
+        float (str): dtype for floating point arrays, e.g. `"float32"`.
+        int (str): dtype for integer arrays, e.g. `"int32"`.
+        keywords (dict): keys are keyword names; values are dtypes that
+          override the defaults for that keyword. Overrides also apply to
+          scalar values (like `natoms`).
+
+    Examples:
+        Keep vectors in single precision and counts as 32-bit integers for all
+        subsequent queries.
+
+        >>> from aflow.caster import DtypePolicy, set_dtypes
+        >>> set_dtypes(DtypePolicy(float="float32", int="int32",
+        ...                        keywords={"natoms": "int32"}))
+    """
+    def __init__(self, float=None, int=None, keywords=None):
+        import numpy as np
+        self.float = None if float is None else np.dtype(float)
+        self.int = None if int is None else np.dtype(int)
+        self.keywords = {}
+        if keywords is not None:
+            self.keywords = {k: np.dtype(v) for k, v in keywords.items()}
+
+    def __repr__(self):
+        return "DtypePolicy(float={0}, int={1}, keywords={2})".format(
+            self.float, self.int, self.keywords)
+
+    def _settings(self):
+        return (self.float, self.int, tuple(sorted(self.keywords.items())))
+
+    def __eq__(self, other):
+        if not isinstance(other, DtypePolicy):
+            return NotImplemented
+        return self._settings() == other._settings()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(self._settings())
+
+    def dtype(self, keyword, kind):
+        """Returns the dtype that values of the specified keyword should be
+        stored as.
+
+        Args:
+            keyword (str): name of the keyword.
+            kind (str): :attr:`numpy.dtype.kind` of the value in its default
+              representation ('f' for floats, 'i' for integers).
+
+        Returns:
+            numpy.dtype: or `None` if the default representation should be
+            kept.
+        """
+        if keyword in self.keywords:
+            return self.keywords[keyword]
+        if kind == 'f':
+            return self.float
+        elif kind == 'i':
+            return self.int
+
+    def apply(self, keyword, value):
+        """Converts the numeric parts of a cast value to the dtypes in this
+        policy. Arrays (including those inside `dict` values) are converted
+        using the per-kind defaults; scalars are only converted if the keyword
+        has an explicit override.
+
+        Args:
+            keyword (str): name of the keyword that the value belongs to.
+            value: cast python value for the keyword.
+        """
+        import numpy as np
+        if isinstance(value, np.ndarray):
+            dtype = self.dtype(keyword, value.dtype.kind)
+            if dtype is not None and dtype != value.dtype:
+                return value.astype(dtype)
+        elif isinstance(value, dict):
+            return {k: self.apply(keyword, v) for k, v in value.items()}
+        elif (keyword in self.keywords and
+              isinstance(value, (int, float)) and
+              not isinstance(value, bool)):
+            return self.keywords[keyword].type(value)
+        return value
+
+dtypes = None
+""":class:`DtypePolicy`: global policy for the numeric types of cast
+values. If `None`, values keep their default `float64`/`int64` types.
+"""
+
+def set_dtypes(policy):
+    """Sets the global dtype policy used when casting values.
+
+    Args:
+        policy (DtypePolicy): policy to apply to all cast values; `None`
+          restores the default types.
+    """
+    global dtypes
+    dtypes = policy
+
 def ptype(atype, keyword):
     """Returns a `str` representing the *python* type for the
     specified AFLOW type and keyword.
@@ -124,10 +316,57 @@ def ptype(atype, keyword):
     else:
         return castmap[keyword]
 
-def cast(atype, keyword, value):
+_parsers = None
+"""dict: the generated parsers in :data:`aflow.parsers.parsers`; they are
+imported the first time that :func:`parse` is called.
+"""
+
+def parse(keyword, value, natoms=None, policy=None):
+    """Casts the value of a keyword in the schema using the parser that was
+    generated for it in :mod:`aflow.parsers`.
+
+    Args:
+        keyword (str): name of the keyword that the value is associated with.
+        value (str): raw value returned by AFLUX.
+        natoms (int): number of atoms in the cell; if specified, per-atom
+          vector values (forces and positions) are validated against it.
+        policy (DtypePolicy): dtype policy for numeric values; overrides the
+          global :data:`dtypes` policy.
+
+    Returns:
+        The cast value, or `None` if the value is malformed.
+
+    Raises:
+        KeyError: if the keyword isn't in the schema; use :func:`cast` for
+          those.
+    """
+    global _parsers
+    if value is None:
+        return
+    if _parsers is None:
+        from aflow.parsers import parsers
+        _parsers = parsers
+
+    try:
+        result = _parsers[keyword](value, natoms)
+    except (ValueError, TypeError, AttributeError):
+        msg.err("Cannot cast {0} for {1}; unknown format.".format(value,
+                                                                 keyword))
+        return
+
+    if policy is None:
+        policy = dtypes
+    if policy is not None:
+        result = policy.apply(keyword, result)
+    return result
+
+def cast(atype, keyword, value, natoms=None, policy=None):
     """Casts the specified value to a python type, using the AFLOW type as a
     reference.
 
+    .. note:: Values of keywords in the schema are cast faster (and more
+      strictly) by :func:`parse`.
+
     .. note:: Unfortunately, some of the AFLOW type names are not descriptive or
       unique enough to make general rule casting possible. Instead, we have to
       encode some exceptions directly in this module.
@@ -136,6 +375,10 @@ def cast(atype, keyword, value):
         atype (str): name of the AFLOW type.
         keyword (str): name of the keyword that the value is associated with.
         value: object (usually a string) to cast into python types.
+        natoms (int): number of atoms in the cell; if specified, per-atom
+          vector values (forces and positions) are validated against it.
+        policy (DtypePolicy): dtype policy for numeric values; overrides the
+          global :data:`dtypes` policy.
     """
     if value is None:
         return
@@ -145,10 +388,10 @@ def cast(atype, keyword, value):
         "strings": _strings,
         "number": _number,
         "numbers": _numbers,
-        "forces": _forces,
+        "forces": lambda v: _forces(v, natoms),
         "kpoints": _kpoints,
-        "positions_cartesian": _forces,
-        "positions_fractional": _forces,
+        "positions_cartesian": lambda v: _forces(v, natoms),
+        "positions_fractional": lambda v: _forces(v, natoms),
         "spind": _numbers,
         "stoich": _stoich,
         "ldau_TLUJ": _ldau_TLUJ,
@@ -156,11 +399,33 @@ def cast(atype, keyword, value):
         None: lambda v: v,
     }
 
+    if policy is None:
+        policy = dtypes
+
+    if keyword in categorical:
+        castmap["string"] = intern
+        castmap["strings"] = _interned
+    elif keyword in _columns:
+        #The schema tells us the type of the numbers, so we don't have to
+        #inspect every value.
+        dtype, shape = _columns[keyword][0:2]
+        castmap["number"] = float if dtype == "float64" else _integer
+        if shape and None not in shape:
+            #Same shape as the generated parser, e.g. (3, 3) for tensors.
+            castmap["numbers"] = lambda v: _fixed(v, dtype, shape)
+        else:
+            castmap["numbers"] = lambda v: _vector(v, dtype)
+
     try:
         if keyword not in exceptions:
-            return castmap[atype](value)
+            result = castmap[atype](value)
         else:
-            return castmap[keyword](value)
-    except:
+            result = castmap[keyword](value)
+    except (ValueError, TypeError, AttributeError, IndexError, KeyError):
         msg.err("Cannot cast {}; unknown format.".format(value))
+        return
+
+    if policy is not None:
+        result = policy.apply(keyword, result)
+    return result
 
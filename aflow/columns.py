@@ -0,0 +1,231 @@
+"""Functions for materializing the values of many database entries as
+columns (one array per keyword) instead of one python object per entry.
+"""
+import numpy as np
+from collections import namedtuple
+from six import string_types
+from aflow.caster import categorical
+
+ColumnType = namedtuple("ColumnType", ["dtype", "shape", "nullable", "units"])
+"""Typed column definition of a keyword; see :data:`aflow.schema.columns`.
+"""
+
+def column_type(keyword):
+    """Returns the typed column definition for the specified keyword, so
+    that storage for its values can be allocated before they are parsed.
+
+    Args:
+        keyword: :class:`aflow.keywords.Keyword` or `str` keyword name.
+
+    Returns:
+        ColumnType: or `None` if the keyword isn't in the schema.
+    """
+    from aflow import schema
+    name = keyword if isinstance(keyword, string_types) else keyword.name
+    if name not in schema.columns:
+        return None
+    return ColumnType(*(schema.columns[name] + schema.keywords[name][2:]))
+
+class Categorical(object):
+    """Represents a column of low-cardinality values as integer codes into a
+    dictionary of categories. Missing values have code `-1`.
+
+    Args:
+        codes (numpy.ndarray): of integer codes into `categories`.
+        categories (list): of the distinct values in the column.
+        offsets (numpy.ndarray): for columns whose values are lists (like
+          `species`), the codes are flattened and the values for row `i` are
+          `codes[offsets[i]:offsets[i+1]]`; missing rows are empty. `None`
+          for scalar columns.
+
+    Attributes:
+        codes (numpy.ndarray): of integer codes into `categories`.
+        categories (list): of the distinct values in the column.
+        offsets (numpy.ndarray): row boundaries for list-valued columns.
+    """
+    def __init__(self, codes, categories, offsets=None):
+        self.codes = codes
+        self.categories = categories
+        self.offsets = offsets
+
+    def __repr__(self):
+        return "Categorical({0:d} rows, {1:d} categories)".format(
+            len(self), len(self.categories))
+
+    def __len__(self):
+        if self.offsets is not None:
+            return len(self.offsets) - 1
+        return len(self.codes)
+
+    def _decode(self, code):
+        return self.categories[code] if code >= 0 else None
+
+    def __getitem__(self, i):
+        if self.offsets is None:
+            return self._decode(self.codes[i])
+        else:
+            codes = self.codes[self.offsets[i]:self.offsets[i+1]]
+            return [self._decode(c) for c in codes]
+
+    def tolist(self):
+        """Decodes the column back into a list of values.
+        """
+        return [self[i] for i in range(len(self))]
+
+    @classmethod
+    def from_values(cls, values, dtype=np.int32):
+        """Encodes a sequence of values as a categorical column.
+
+        Args:
+            values (list): of `str` values (or `list` of `str` for list-valued
+              keywords); `None` marks a missing value.
+            dtype (numpy.dtype): integer type for the codes.
+        """
+        lookup = {}
+        categories = []
+        def encode(value):
+            if value not in lookup:
+                lookup[value] = len(categories)
+                categories.append(value)
+            return lookup[value]
+
+        ragged = any(isinstance(v, (list, tuple)) for v in values)
+        if not ragged:
+            codes = [-1 if v is None else encode(v) for v in values]
+            return cls(np.array(codes, dtype=dtype), categories)
+
+        codes = []
+        offsets = [0]
+        for v in values:
+            if v is not None:
+                codes.extend(encode(x) for x in v)
+            offsets.append(len(codes))
+        return cls(np.array(codes, dtype=dtype), categories,
+                   np.array(offsets, dtype=np.int64))
+
+def _is_scalar(value):
+    return (isinstance(value, (int, float, np.number)) and
+            not isinstance(value, bool))
+
+def _typed(keyword, values, policy):
+    """Packs the values of a keyword into a preallocated array with the dtype
+    and shape from the schema. Returns `None` if the schema doesn't define a
+    fixed numeric shape for the keyword, or if the values don't fit it.
+    """
+    column = column_type(keyword)
+    if (column is None or column.dtype == "object" or column.shape is None or
+        None in column.shape):
+        return None
+
+    dtype = np.dtype(column.dtype)
+    missing = any(v is None for v in values)
+    if missing and dtype.kind == 'i':
+        #Missing values are `nan`, which forces a floating point type.
+        dtype = np.dtype(np.float64)
+    result = np.empty((len(values),) + column.shape, dtype=dtype)
+    if missing:
+        result.fill(np.nan)
+    try:
+        for i, value in enumerate(values):
+            if value is not None:
+                result[i] = value
+    except (ValueError, TypeError):
+        return None
+
+    if policy is not None:
+        override = policy.dtype(keyword, dtype.kind)
+        if override is not None and not (dtype.kind == 'f' and
+                                         override.kind == 'i'):
+            result = result.astype(override)
+    return result
+
+def _numeric(keyword, values, policy):
+    """Packs the numeric values of a single keyword into an array, or returns
+    `None` if the values can't be represented as a regular array.
+    """
+    present = [v for v in values if v is not None]
+    if len(present) == 0:
+        return None
+
+    if all(_is_scalar(v) for v in present):
+        ints = all(isinstance(v, (int, np.integer)) for v in present)
+        kind = 'i' if ints and len(present) == len(values) else 'f'
+        dtype = policy.dtype(keyword, kind) if policy is not None else None
+        if dtype is None or (kind == 'f' and dtype.kind == 'i'):
+            dtype = np.int64 if kind == 'i' else np.float64
+        return np.array([np.nan if v is None else v for v in values],
+                        dtype=dtype)
+
+    if len(present) < len(values):
+        return None
+    try:
+        arrays = [np.asarray(v) for v in values]
+    except ValueError:# pragma: no cover
+        return None
+    shape = arrays[0].shape
+    if (any(a.dtype.kind not in "if" for a in arrays) or
+        any(a.shape != shape for a in arrays)):
+        return None
+
+    result = np.stack(arrays)
+    dtype = None
+    if policy is not None:
+        dtype = policy.dtype(keyword, result.dtype.kind)
+    return result if dtype is None else result.astype(dtype)
+
+def columns(entries, keywords, dtypes=None, lazy=False):
+    """Materializes the values of the specified keywords for a collection of
+    entries as columns.
+
+    - :data:`~aflow.caster.categorical` keywords become :class:`Categorical`
+      columns.
+    - Numeric scalars become 1D arrays; missing values are `nan` (which forces
+      a floating point type).
+    - Numeric vectors with a common shape are stacked into a single array with
+      one row per entry.
+    - Keywords with a fixed numeric shape in the typed column schema (see
+      :func:`column_type`) are written to a preallocated array of that dtype
+      and shape, without inspecting the type of each value.
+    - Anything else is returned as a `list` of the cast values.
+
+    Args:
+        entries: iterable of :class:`aflow.entries.Entry`, for example a
+          :class:`aflow.control.Query`.
+        keywords (list): of :class:`aflow.keywords.Keyword` or `str` keyword
+          names to include.
+        dtypes (aflow.caster.DtypePolicy): dtype policy for the numeric
+          columns; if `None`, the global policy in :data:`aflow.caster.dtypes`
+          is used.
+        lazy (bool): when True, values that weren't part of the original query
+          are requested from the server (one HTTP request *per entry*);
+          otherwise they are treated as missing.
+
+    Returns:
+        collections.OrderedDict: keys are keyword names; values are the
+        columns.
+    """
+    from collections import OrderedDict
+    from aflow import caster
+    policy = dtypes if dtypes is not None else caster.dtypes
+
+    names = [k if isinstance(k, string_types) else k.name for k in keywords]
+    values = OrderedDict((name, []) for name in names)
+    for entry in entries:
+        for name in names:
+            if lazy:
+                value = entry._lazy_load(name)
+            else:
+                value = entry.attributes.get(name)
+            values[name].append(value)
+
+    result = OrderedDict()
+    for name, vals in values.items():
+        if name in categorical:
+            result[name] = Categorical.from_values(vals)
+            continue
+
+        packed = _typed(name, vals, policy)
+        if packed is None:
+            packed = _numeric(name, vals, policy)
+        result[name] = packed if packed is not None else vals
+    return result
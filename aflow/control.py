@@ -6,7 +6,7 @@ server = "http://aflowlib.duke.edu/search/API/?"
 """
 
 from aflow import msg
-def search(catalog=None, batch_size=100):
+def search(catalog=None, batch_size=100, dtypes=None, keep_raw=True):
     """Returns a :class:`aflow.control.Query` to help construct the search
     query.
 
@@ -14,8 +14,12 @@ def search(catalog=None, batch_size=100):
         catalog (str): one of the catalogs supported on AFLOW: ['icsd', 'lib1',
           'lib2', 'lib3']. Also supports a `list` of catalog names.
         batch_size (int): number of data entries to return per HTTP request.
+        dtypes (aflow.caster.DtypePolicy): dtype policy for the numeric values
+          of the entries in the query.
+        keep_raw (bool): when False, entries don't keep a copy of the raw
+          response dictionary; see :class:`aflow.entries.Entry`.
     """
-    return Query(catalog, batch_size)
+    return Query(catalog, batch_size, dtypes=dtypes, keep_raw=keep_raw)
 
 class Query(object):
     """Represents a search againts the AFLUX API.
@@ -25,6 +29,11 @@ class Query(object):
           'lib2', 'lib3']. Also supports a `list` of catalog names.
         batch_size (int): number of data entries to return per HTTP request.
         step (int): step size over entries.
+        dtypes (aflow.caster.DtypePolicy): dtype policy for the numeric values
+          of the entries in the query; if `None`, the global policy in
+          :data:`aflow.caster.dtypes` is used.
+        keep_raw (bool): when False, entries don't keep a copy of the raw
+          response dictionary, which roughly halves their memory footprint.
 
     Attributes:
         filters (list): of `str` filter arguments to pass to the matchbook
@@ -43,8 +52,14 @@ class Query(object):
         responses (dict): keys are (n,k) tuples from the pagination; values are
           the corresponding JSON dictionaries.
         step (int): step size over entries.
+        errors (dict): keys are entry indices for which the last bulk
+          operation failed; values are the exceptions that were raised.
+        dtypes (aflow.caster.DtypePolicy): dtype policy for the numeric values
+          of the entries in the query.
+        keep_raw (bool): when False, entries don't keep the raw response.
     """
-    def __init__(self, catalog=None, batch_size=100, step=1):
+    def __init__(self, catalog=None, batch_size=100, step=1, dtypes=None,
+                 keep_raw=True):
         self.filters = []
         self.selects = []
         self.excludes = []
@@ -56,7 +71,13 @@ class Query(object):
         self._n = 1
         self.k = batch_size
         self.step = step
+        self.dtypes = dtypes
+        self.keep_raw = keep_raw
         self.responses = {}
+        self.errors = {}
+        """dict: keys are the integer indices of entries for which the last
+        bulk operation (like :meth:`atoms`) failed; values are the exceptions.
+        """
         self._iter = 0
         """int: current integer id of the iterator in the *whole* dataset; this
         means it can have a value greater than :attr:`k`.
@@ -141,17 +162,26 @@ class Query(object):
             self.finalize()
         
         import json
-        from six.moves import urllib
-        urlopen = urllib.request.urlopen
+        from aflow import metrics, transport
         url = "{0}{1},{2}".format(server, self.matchbook(),
                                   self._directives(n, k))
-        rawresp = urlopen(url).read().decode("utf-8")
+        event = metrics.start("page", url)
+        try:
+            rawresp = transport.read(url, event).decode("utf-8")
+        except Exception as error:
+            metrics.finish(event, error)
+            raise
         try:
+            start = metrics.timer()
             response = json.loads(rawresp)
+            if event is not None:
+                event.decode = metrics.timer() - start
         except:# pragma: no cover
             #We can't easily simulate network failure...
+            metrics.finish(event, ValueError("Invalid JSON response."))
             msg.err("{}\n\n{}".format(url, rawresp))
             return
+        metrics.finish(event)
 
         if not response:
             self._N = 0
@@ -170,6 +200,11 @@ class Query(object):
         *reset*. Re-executing the search query will reconstruct the same object
         and request, but any cached responses will be lost.
         """
+        #Entries are hashed and compared using `auid`, so it is always part of
+        #the response (AFLUX returns it unless it is excluded).
+        self.excludes = [x for x in self.excludes
+                         if getattr(x, "name", x) != "auid"]
+
         #Generate the matchbook query, this has all the filters, selects and
         #ordering information.
         self.matchbook()
@@ -254,12 +289,17 @@ class Query(object):
 
         assert len(self.responses) > 0
 
+        from aflow import metrics
         from aflow.entries import Entry
         if self._iter < self.max_N:
             index = self.k*(abs(n)-1) + i + 1
             key = "{} of {}".format(index, self.N)
             raw = self.responses[n][key]
-            result = Entry(**raw)
+            event = metrics.start("entry")
+            result = Entry(dtypes=self.dtypes, keep_raw=self.keep_raw, **raw)
+            if event is not None:
+                event.cast = metrics.timer() - event.start
+                metrics.finish(event)
 
             #Increment the iterator right before we return the entry.
             self._iter += 1
@@ -267,6 +307,117 @@ class Query(object):
         else:
             raise StopIteration()
 
+    def columns(self, *keywords, **kwargs):
+        """Materializes the values of the specified keywords for all the
+        entries in this query as columns; see :func:`aflow.columns.columns`.
+
+        Args:
+            keywords (list): of :class:`aflow.keywords.Keyword` to include;
+              these should be part of the query's :meth:`select`.
+            kwargs (dict): additional arguments passed to
+              :func:`aflow.columns.columns`.
+        """
+        from copy import copy
+        from aflow.columns import columns
+        entries = copy(self)
+        entries.reset_iter()
+        kwargs.setdefault("dtypes", self.dtypes)
+        return columns(entries, keywords, **kwargs)
+
+    def atoms(self, pattern="CONTCAR.relax*", keywords=None,
+              from_keywords=False, workers=8, processes=None):
+        """Returns the :class:`ase.atoms.Atoms` objects for all the entries in
+        this query, in order. Structure files are downloaded concurrently (and
+        parsed as soon as they arrive); with `from_keywords`, entries whose
+        structure can be built from the query keywords don't need any
+        downloads at all. See
+        :meth:`aflow.entries.Entry.atoms`.
+
+        .. note:: Failures don't abort the whole batch. The corresponding
+          result is `None` and the exception is stored in :attr:`errors`.
+
+        Args:
+            pattern (str): pattern for choosing the structure file of each
+              entry.
+            keywords (dict): keys are keyword obects accessible from `aflow.K`;
+              values are desired `str` names in the results of the atoms
+              objects.
+            from_keywords (bool): when True, build the relaxed structures from
+              the keyword values where possible; their lattice vectors are
+              rotated with respect to the AFLOW structure files (see
+              :meth:`aflow.entries.Entry.atoms`).
+            workers (int): number of concurrent downloads.
+            processes (int): number of worker processes for parsing the
+              structure files; if `None`, they are parsed in the download
+              threads.
+
+        Returns:
+            list: of :class:`ase.atoms.Atoms` (or `None` for failures).
+        """
+        from copy import copy
+        from concurrent.futures import (ThreadPoolExecutor, ProcessPoolExecutor,
+                                        Future)
+        from aflow.structure import to_atoms
+        entries = copy(self)
+        entries.reset_iter()
+        entries = list(entries)
+
+        #The worker processes only parse the files into arrays so that they
+        #don't need to import ASE; the atoms objects are built in this process.
+        parsers = ProcessPoolExecutor(processes) if processes else None
+        def fetch(entry):
+            if pattern in entry._atoms:
+                return entry._atoms[pattern]
+            atoms = (entry._keyword_atoms(pattern, keywords)
+                     if from_keywords else None)
+            if atoms is not None:
+                return atoms
+            return entry._structure(entry._structure_file(pattern), parsers)
+
+        self.errors = {}
+        result = []
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as threads:
+                fetched = [threads.submit(fetch, e) for e in entries]
+                for i, (entry, future) in enumerate(zip(entries, fetched)):
+                    try:
+                        atoms = future.result()
+                        if isinstance(atoms, Future):
+                            atoms = atoms.result()
+                        if isinstance(atoms, tuple):
+                            atoms = to_atoms(*atoms)
+                        result.append(entry._set_atoms(pattern, atoms,
+                                                       keywords))
+                    except Exception as e:
+                        self.errors[i] = e
+                        msg.err("Cannot create atoms for {}: {}".format(
+                            entry.attributes.get("aurl"), e))
+                        result.append(None)
+        finally:
+            if parsers is not None:
+                parsers.shutdown()
+
+        return result
+
+    def structures(self, scaled=True):
+        """Packs the structures of all the entries in this query into
+        contiguous arrays; see :func:`aflow.structure.pack`. The query should
+        select `geometry`, `positions_fractional`, `species` and
+        `composition`.
+
+        Args:
+            scaled (bool): when True, store fractional coordinates; otherwise,
+              cartesian positions.
+
+        Returns:
+            aflow.structure.PackedStructures: with one structure per entry.
+        """
+        from copy import copy
+        from aflow.structure import pack
+        entries = copy(self)
+        entries.reset_iter()
+        return pack(entries, scaled, self.dtypes)
+
     def _final_check(self):
         """Checks whether this object is finalized; if it is, print a friendly
         message and return False, otherwise True.
@@ -321,6 +472,9 @@ class Query(object):
     def exclude(self, *keywords):
         """Sets a keyword to be *excluded* from the response.
 
+        .. note:: `auid` is never excluded, since entries are hashed and
+          compared by it.
+
         Args:
             keywords (list): of :class:`aflow.keywords.Keyword` that
               encapsulates the AFLUX request language logic.
@@ -0,0 +1,227 @@
+"""Functions for downloading the files of many database entries at once.
+"""
+from threading import BoundedSemaphore, Lock
+from aflow import msg
+
+connections = 4
+"""int: default maximum number of simultaneous connections to each server.
+"""
+
+class _HostLimits(object):
+    """Bounds the number of simultaneous connections to each server.
+
+    Args:
+        limit (int): maximum number of connections per server.
+    """
+    def __init__(self, limit):
+        self.limit = limit
+        self._semaphores = {}
+        self._lock = Lock()
+
+    def __call__(self, url):
+        """Returns the semaphore for the server of the specified URL.
+        """
+        from six.moves.urllib.parse import urlparse
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = BoundedSemaphore(self.limit)
+            return self._semaphores[host]
+
+def _folder(entry, aurl):
+    """Returns the name of the folder for the files of an entry: its `auid`
+    if the query included it, otherwise the path of its `aurl`, so that no
+    request is needed.
+    """
+    auid = entry.attributes.get("auid")
+    if auid is not None:
+        return auid.replace(':', '_')
+    return aurl.split(':', 1)[1].strip('/').replace('/', '_')
+
+def _matches(entry, patterns):
+    """Returns the AFLOW URL of an entry and the names of its files that match
+    any of the patterns.
+    """
+    files = entry.files
+    names = []
+    for pattern in patterns:
+        for name in files.matches(pattern):
+            if name not in names:
+                names.append(name)
+    return files.aurl, names
+
+def _open(url, offset, event):
+    """Opens the URL for a download that resumes at the specified offset.
+
+    Returns:
+        The response object, or `None` if the server answered the range
+        request with 416 (Range Not Satisfiable) because the partial file is
+        already complete.
+    """
+    from six.moves import urllib
+    from aflow import transport
+    if offset == 0:
+        return transport.urlopen(url, None, event)
+
+    headers = {"Range": "bytes={0:d}-".format(offset)}
+    try:
+        return transport.urlopen(url, headers, event)
+    except urllib.error.HTTPError as error:
+        if error.code != 416:
+            raise
+        #The total size is in `Content-Range: bytes */<size>`.
+        size = (error.headers.get("Content-Range") or '').rpartition('/')[2]
+        if size == str(offset):
+            return None
+    #The partial file doesn't match the file on the server; start over.
+    return transport.urlopen(url, None, event)
+
+def _fetch(aurl, filename, target, limits, decompress):
+    """Downloads a single file to the specified target. The contents are
+    written to `target.part` first; if it already exists, only the remaining
+    bytes are requested (unless the file is decompressed while it streams).
+
+    Returns:
+        int: number of bytes written in this call.
+    """
+    import os
+    from aflow import metrics, transport
+    ext = transport.compression(filename) if decompress else None
+    url = transport.url(aurl, '/' + filename)
+    partial = target + ".part"
+    offset = 0
+    if ext is None and os.path.isfile(partial):
+        offset = os.path.getsize(partial)
+
+    written = 0
+    with limits(url):
+        event = metrics.start("file", url)
+        try:
+            response = _open(url, offset, event)
+            if response is not None:
+                try:
+                    #Servers that ignore the range request (or reject it)
+                    #send the whole file.
+                    resumed = offset > 0 and response.getcode() == 206
+                    mode = 'ab' if resumed else 'wb'
+                    with open(partial, mode) as f:
+                        for chunk in transport.chunks(response, ext):
+                            f.write(chunk)
+                            written += len(chunk)
+                finally:
+                    response.close()
+        except Exception as error:
+            metrics.finish(event, error)
+            raise
+        if event is not None:
+            event.bytes = written
+            metrics.finish(event)
+
+    os.replace(partial, target)
+    return written
+
+def download(entries, patterns, dest, workers=8, per_host=None,
+             overwrite=False, decompress=False, manifest="manifest.json"):
+    """Downloads the files that match the specified patterns for many entries
+    concurrently. The files for each entry are saved in a folder named after
+    its `auid` (with `:` replaced by `_`), or after the path of its `aurl` (with
+    `/` replaced by `_`) if the query didn't include the `auid`.
+
+    .. note:: Interrupted downloads leave a `.part` file behind; the next call
+      resumes them from where they stopped if the server supports range
+      requests.
+
+    Args:
+        entries: iterable of :class:`aflow.entries.Entry`, for example a
+          :class:`aflow.control.Query`.
+        patterns (list): of `str` patterns (see :mod:`fnmatch`) for the names
+          of the files to download, e.g. `OUTCAR.relax*`. A single `str` is
+          also accepted.
+        dest (str): root folder for the downloaded files.
+        workers (int): number of threads for the downloads.
+        per_host (int): maximum number of simultaneous connections to each
+          server; defaults to :data:`connections`.
+        overwrite (bool): when False, files that already exist in `dest` are
+          skipped.
+        decompress (bool): when True, compressed files are decompressed while
+          they are downloaded; the extension is dropped from the file name.
+        manifest (str): name of the JSON file in `dest` that the results are
+          written to; `None` to skip it.
+
+    Returns:
+        list: of `dict` with one item per file, in the order of the entries:
+        `auid`, `aurl`, `filename`, `path`, `status` (one of `downloaded`,
+        `skipped` or `failed`), `bytes` written and `error` message (if it
+        failed). Entries whose file listing could not be retrieved have a
+        single item with `filename` set to `None`.
+    """
+    import os
+    import json
+    from six import string_types
+    from concurrent.futures import ThreadPoolExecutor
+    from aflow import transport
+    if isinstance(patterns, string_types):
+        patterns = [patterns]
+    dest = os.path.abspath(os.path.expanduser(dest))
+    limits = _HostLimits(per_host or connections)
+
+    def listing(entry):
+        try:
+            aurl, names = _matches(entry, patterns)
+            return entry, aurl, names, _folder(entry, aurl), None
+        except Exception as e:
+            return entry, entry.attributes.get("aurl"), [], None, e
+
+    def fetch(record):
+        target = record["path"]
+        if not overwrite and os.path.isfile(target):
+            record["status"] = "skipped"
+            return record
+        try:
+            record["bytes"] = _fetch(record["aurl"], record["filename"],
+                                     target, limits, decompress)
+            record["status"] = "downloaded"
+        except Exception as e:
+            record["status"] = "failed"
+            record["error"] = str(e)
+        return record
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        records = []
+        for entry, aurl, names, folder, error in executor.map(listing,
+                                                             entries):
+            auid = entry.attributes.get("auid")
+            if error is None and len(names) > 0:
+                folder = os.path.join(dest, folder)
+                try:
+                    if not os.path.isdir(folder):
+                        os.makedirs(folder)
+                except OSError as e:
+                    error = e
+            if error is not None:
+                records.append({"auid": auid, "aurl": aurl, "filename": None,
+                                "path": None, "status": "failed", "bytes": 0,
+                                "error": str(error)})
+                continue
+
+            for name in names:
+                ext = transport.compression(name) if decompress else None
+                local = name[:-len(ext)] if ext else name
+                records.append({"auid": auid, "aurl": aurl, "filename": name,
+                                "path": os.path.join(folder, local),
+                                "status": None, "bytes": 0, "error": None})
+
+        pending = [r for r in records if r["status"] is None]
+        list(executor.map(fetch, pending))
+
+    failed = sum(1 for r in records if r["status"] == "failed")
+    if failed > 0:
+        msg.warn("{0:d} of {1:d} downloads failed; see the manifest for "
+                 "details.".format(failed, len(records)))
+
+    if manifest is not None:
+        if not os.path.isdir(dest):
+            os.makedirs(dest)
+        with open(os.path.join(dest, manifest), 'w') as f:
+            json.dump(records, f, indent=1)
+    return records
@@ -51,45 +51,315 @@ def _set_defaults(d):
     d.setdefault("status", "unknown")
     d.setdefault("description", "No description was returned from AFLUX.")
     d.setdefault("type")
+    d.setdefault("units", "")
 
-def keywords(root=None):
-    """Generates a python module file for the :class:`~aflow.entries.Entry` that
-    has documented methods for lazy loading of properties from AFLOW database.
+docfields = ["title", "inclusion", "status", "description", "example",
+             "verification", "customdoc"]
+"""list: of `str` metadata keys that are written to the documentation file
+of the schema; they are only loaded when a docstring is requested.
+"""
+
+snapshot = "schema_snapshot.json"
+"""str: name of the file (in the package folder) with the local snapshot of
+the AFLUX schema that the keyword table was last generated from.
+"""
+
+def load_snapshot(target=None):
+    """Loads the local snapshot of the AFLUX schema.
 
     Args:
-        root (str): path in which to generate the module files.
+        target (str): path to the snapshot file; defaults to :data:`snapshot`
+          in the package folder.
+
+    Returns:
+        dict: with keys `version` (incremented each time the snapshot changes)
+        and `keywords` (the schema as returned by AFLUX). If the file doesn't
+        exist, the version is 0 and there are no keywords.
     """
+    import json
     from os import path
-    from aflow.utility import reporoot
-    if root is None: # pragma: no cover
-        entries = path.join(reporoot, "aflow", "entries.py")
-        keyword = path.join(reporoot, "aflow", "keywords.py")
+    from collections import OrderedDict
+    if target is None:
+        target = path.join(path.dirname(__file__), snapshot)
+    if not path.isfile(target):
+        return {"version": 0, "keywords": OrderedDict()}
+    with open(target) as f:
+        return json.load(f, object_pairs_hook=OrderedDict)
+
+def save_snapshot(data, target=None):
+    """Saves the local snapshot of the AFLUX schema; see
+    :func:`load_snapshot`.
+    """
+    import json
+    from os import path
+    if target is None:
+        target = path.join(path.dirname(__file__), snapshot)
+    with open(target, 'w') as f:
+        json.dump(data, f, indent=1, separators=(',', ': '), sort_keys=True)
+        f.write('\n')
+
+def diff(old, new):
+    """Compares two versions of the AFLUX schema.
+
+    Args:
+        old (dict): keys are keyword names; values are the metadata from the
+          schema, e.g. the `keywords` in :func:`load_snapshot`.
+        new (dict): same as `old`, for example the live schema from
+          :func:`_get_keywords`.
+
+    Returns:
+        dict: with keys `added`, `removed` and `changed`; values are sorted
+        lists of keyword names. Internal keys (starting with `__`) are
+        ignored.
+    """
+    import json
+    oldkw = set(k for k in old if k[0:2] != "__")
+    newkw = set(k for k in new if k[0:2] != "__")
+    #Ordered dictionaries only compare equal if their keys are in the same
+    #order, so we compare the canonical JSON instead.
+    canonical = lambda v: json.dumps(v, sort_keys=True)
+    return {
+        "added": sorted(newkw - oldkw),
+        "removed": sorted(oldkw - newkw),
+        "changed": sorted(k for k in oldkw & newkw
+                          if canonical(old[k]) != canonical(new[k]))
+    }
+
+def _casters(kwdata):
+    """Returns the derived table that maps each keyword to the name of the
+    function in :mod:`aflow.caster` that casts its values.
+    """
+    from collections import OrderedDict
+    from aflow.caster import exceptions
+    return OrderedDict((k, k if k in exceptions else m["type"])
+                       for k, m in kwdata.items())
+
+integers = ["calculation_cores", "composition", "natoms", "node_CPU_Cores",
+            "nspecies", "spacegroup_orig", "spacegroup_relax",
+            "valence_cell_iupac", "valence_cell_std"]
+"""list: of keywords whose values are integers; AFLUX only reports them as
+`number` or `numbers`.
+"""
+
+shapes = {"geometry": (6,), "stress_tensor": (3, 3)}
+"""dict: keys are `numbers` keywords that always have the same number of
+values; values are the shapes of their arrays.
+"""
+
+def _column(keyword, metadata):
+    """Returns the typed column definition `(dtype, shape, nullable)` for a
+    keyword; see :data:`aflow.schema.columns`.
+    """
+    from aflow.caster import exceptions
+    caster = keyword if keyword in exceptions else metadata["type"]
+    nullable = metadata.get("inclusion") != "mandatory"
+    numeric = "int64" if keyword in integers else "float64"
+    if caster == "number":
+        return (numeric, (), nullable)
+    elif caster in ("numbers", "spind", "stoich"):
+        return (numeric, shapes.get(keyword, (None,)), nullable)
+    elif caster in ("forces", "positions_cartesian", "positions_fractional"):
+        return ("float64", (None, 3), nullable)
+    elif caster in ("kpoints", "ldau_TLUJ"):
+        return ("object", None, nullable)
+    elif caster == "strings" or metadata.get("ptype") == "list":
+        return ("object", (None,), nullable)
     else:
-        entries = path.join(root, "entries.py")
-        keyword = path.join(root, "keywords.py")
+        return ("object", (), nullable)
 
-    #Compile a dictionary of all the keywords and their corresponding
-    #dictionaries.
+def _columns(kwdata):
+    """Returns the derived table of typed column definitions for all the
+    keywords.
+    """
+    from collections import OrderedDict
+    return OrderedDict((k, _column(k, m)) for k, m in kwdata.items())
+
+def _parser(keyword, metadata):
+    """Returns the python expression that parses the raw `value` of a keyword
+    in its generated parser; see :mod:`aflow.parsers`.
+    """
+    from aflow.caster import exceptions, categorical
+    caster = keyword if keyword in exceptions else metadata["type"]
+    dtype, shape, nullable = _column(keyword, metadata)
+    if caster == "string":
+        return "intern(value)" if keyword in categorical else "str(value)"
+    elif caster == "strings":
+        return ("_interned(value)" if keyword in categorical
+                else "_strings(value)")
+    elif caster == "number":
+        return "float(value)" if dtype == "float64" else "_integer(value)"
+    elif caster in ("numbers", "spind"):
+        if None not in shape:
+            return "_fixed(value, {0!r}, {1!r})".format(dtype, shape)
+        return "_vector(value, {0!r})".format(dtype)
+    elif caster in ("forces", "positions_cartesian", "positions_fractional"):
+        return "_forces(value, natoms)"
+    elif caster in ("kpoints", "stoich", "ldau_TLUJ"):
+        return "_{0}(value)".format(caster)
+    else:
+        return "value"
+
+def _parsers(kwdata):
+    """Returns the derived table that maps each keyword to the expression that
+    parses its values.
+    """
+    from collections import OrderedDict
+    return OrderedDict((k, _parser(k, m)) for k, m in kwdata.items())
+
+def _read_schema(root=None):
+    """Reads the keyword metadata back from a generated keyword table and its
+    documentation; see :func:`_write_schema`.
+
+    Returns:
+        tuple: `(kwdata, derived)` where `kwdata` has keyword names as keys and
+        metadata dictionaries (as returned by :func:`_get_kw_help`) as values
+        and `derived` has the derived tables by name. Both are empty if the
+        files don't exist.
+    """
+    import json
+    from os import path
     from collections import OrderedDict
-    kws = _get_keywords()
+    from aflow.utility import load_module
+    if root is None:
+        root = path.dirname(__file__)
+    modpath = path.join(root, "schema.py")
+    docpath = path.join(root, "schema.json")
     kwdata = OrderedDict()
-    for kw in sorted(kws.keys()):
-        metadata = kws[kw]
-        if kw[0:2] != "__":
-            kwdata[kw] = _get_kw_help(kw, metadata)
-        
-    settings = {
-        "keywords": kwdata
-    }
+    if not (path.isfile(modpath) and path.isfile(docpath)):
+        return kwdata, {}
+
+    module = load_module("_generated_schema", modpath)
+    table = module.keywords
+    derived = {"casters": getattr(module, "casters", None),
+               "columns": getattr(module, "columns", None), "parsers": None}
+    parpath = path.join(root, "parsers.py")
+    if path.isfile(parpath):
+        derived["parsers"] = load_module("_generated_parsers", parpath).sources
+    with open(docpath) as f:
+        docs = json.load(f, object_pairs_hook=OrderedDict)
+    for keyword in sorted(table):
+        atype, ptype, units = table[keyword]
+        metadata = OrderedDict(docs.get(keyword, {}))
+        metadata.update(type=atype, ptype=ptype, units=units)
+        kwdata[keyword] = metadata
+    return kwdata, derived
+
+def _derived(kwdata):
+    """Returns the tables that are derived from the keyword metadata and the
+    casting rules in :mod:`aflow.caster`, by name.
+    """
+    return {"casters": _casters(kwdata), "columns": _columns(kwdata),
+            "parsers": _parsers(kwdata)}
+
+def _write_schema(kwdata, root=None, version=0):
+    """Writes the compact keyword table (`schema.py`), the keyword
+    documentation (`schema.json`) and the keyword parsers (`parsers.py`) for
+    the specified keyword metadata. The derived tables are always recomputed.
+
+    Args:
+        kwdata (dict): keys are keyword names; values are the metadata
+          dictionaries returned by :func:`_get_kw_help`.
+        root (str): path in which to generate the files; defaults to the
+          `aflow` package folder.
+        version (int): version of the schema snapshot that the files were
+          generated from.
+    """
+    import json
+    from os import path
+    from collections import OrderedDict
+    if root is None: # pragma: no cover
+        root = path.dirname(__file__)
 
     from jinja2 import Environment, PackageLoader
     env = Environment(loader=PackageLoader('aflow', 'templates'),
                       keep_trailing_newline=True)
-    
-    tentry = env.get_template("entry.py")
-    with open(entries, 'w') as f:
-        f.write(tentry.render(**settings))
+    env.filters["repr"] = repr
+    derived = _derived(kwdata)
+    for name in ("schema.py", "parsers.py"):
+        template = env.get_template(name)
+        with open(path.join(root, name), 'w') as f:
+            f.write(template.render(keywords=kwdata, version=version,
+                                    **derived))
+
+    docs = OrderedDict()
+    for keyword, metadata in kwdata.items():
+        docs[keyword] = OrderedDict((k, metadata[k]) for k in docfields
+                                    if k in metadata)
+    with open(path.join(root, "schema.json"), 'w') as f:
+        json.dump(docs, f, indent=1, separators=(',', ': '))
+        f.write('\n')
+
+def keywords(root=None, schema=None, force=False):
+    """Generates the table of keywords (and their documentation) from which
+    the :class:`~aflow.keywords.Keyword` objects and the lazily loaded
+    properties of :class:`~aflow.entries.Entry` are built.
+
+    Only the keywords that changed since the local schema snapshot are
+    regenerated; the metadata of the others is read back from the existing
+    files in `root`. If nothing changed, the files aren't touched.
+
+    Args:
+        root (str): path in which to generate the module files; defaults to
+          the package folder. The snapshot is always kept in the package
+          folder when `root` is `None`, and in `root` otherwise.
+        schema (dict): AFLUX schema to generate the table from; if `None`, the
+          live schema is requested from the server. Pass the `keywords` from
+          :func:`load_snapshot` to regenerate the files offline.
+        force (bool): when True, all keywords are regenerated.
+
+    Returns:
+        dict: differences between the snapshot and `schema`; see
+        :func:`diff`.
+    """
+    from os import path
+    from copy import deepcopy
+    from collections import OrderedDict
+    target = None if root is None else path.join(root, snapshot)
+    local = load_snapshot(target)
+    if schema is None:
+        schema = _get_keywords()
+
+    changes = diff(local["keywords"], schema)
+    changed = any(len(v) > 0 for v in changes.values())
+    existing, derived = _read_schema(root)
+    if force:
+        existing = OrderedDict()
+    elif (not changed and derived == _derived(existing) and
+          all(k in existing for k in schema if k[0:2] != "__")):
+        #The derived tables are compared as well so that changes to the
+        #casting rules are picked up even if the schema is the same.
+        return changes
+
+    stale = set(changes["added"]) | set(changes["changed"])
+
+    #Compile a dictionary of all the keywords and their corresponding
+    #dictionaries.
+    kwdata = OrderedDict()
+    for kw in sorted(schema.keys()):
+        if kw[0:2] == "__":
+            continue
+        if kw in existing and kw not in stale:
+            kwdata[kw] = existing[kw]
+        else:
+            kwdata[kw] = _get_kw_help(kw, deepcopy(schema[kw]))
+
+    version = local["version"] + (1 if changed or local["version"] == 0 else 0)
+    _write_schema(kwdata, root, version)
+    save_snapshot({"version": version, "keywords": schema}, target)
+    return changes
 
-    tkeyword = env.get_template("keywords.py")
-    with open(keyword, 'w') as f:
-        f.write(tkeyword.render(**settings))
+if __name__ == '__main__': # pragma: no cover
+    import argparse
+    parser = argparse.ArgumentParser(description="Regenerates the table of "
+                                     "AFLUX keywords.")
+    parser.add_argument("--offline", action="store_true",
+                        help="Use the local schema snapshot instead of the "
+                        "live schema.")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate all keywords, not only those that "
+                        "changed.")
+    args = parser.parse_args()
+    schema = load_snapshot()["keywords"] if args.offline else None
+    changes = keywords(schema=schema, force=args.force)
+    for kind in ("added", "removed", "changed"):
+        print("{0}: {1}".format(kind, ', '.join(changes[kind]) or "-"))
@@ -0,0 +1,198 @@
+"""Instrumentation of the requests that `aflow` makes. Registered hooks are
+called with an :class:`Event` for every query page, lazily loaded keyword and
+file, and for the entries that are built from each page. When no hooks are
+registered, nothing is timed.
+
+Examples:
+    Print a summary of where the time went at the end of a scan.
+
+    >>> from aflow.metrics import Summary
+    >>> with Summary():
+    ...     for entry in aflow.search(batch_size=1000).filter(K.Egap > 6):
+    ...         entry.natoms
+"""
+from collections import OrderedDict
+from timeit import default_timer as timer
+
+kinds = ["page", "lazy", "file", "entry"]
+"""list: of the kinds of events: `page` for pages of query results, `lazy`
+for lazily loaded keywords, `file` for structure files and file downloads and
+`entry` for building the entries of a page.
+"""
+
+hooks = []
+"""list: of functions that are called with each :class:`Event`.
+"""
+
+class Event(object):
+    """Measurements for a single request. Times are in seconds; values that
+    weren't measured are `None`.
+
+    Args:
+        kind (str): one of :data:`kinds`.
+        url (str): URL of the request.
+
+    Attributes:
+        kind (str): one of :data:`kinds`.
+        url (str): URL of the request.
+        bytes (int): size of the response body.
+        dns (float): time to resolve the host name.
+        connect (float): time to open the connection.
+        ttfb (float): time until the response headers arrived (including name
+          resolution and connection).
+        total (float): time from the start of the request until the response
+          was processed.
+        decode (float): time to decode the JSON of a page.
+        cast (float): time to cast the values into python types.
+        cache (str): `hit` if the response came from a local cache (the
+          attributes of the entry, the file store or a replay archive), `miss`
+          if a cache was consulted but the server had to be asked; `None` if
+          no cache was involved.
+        error (str): description of the exception that the request raised.
+    """
+    __slots__ = ("kind", "url", "bytes", "dns", "connect", "ttfb", "total",
+                 "decode", "cast", "cache", "error", "start")
+
+    def __init__(self, kind, url=None):
+        self.kind = kind
+        self.url = url
+        self.bytes = None
+        self.dns = None
+        self.connect = None
+        self.ttfb = None
+        self.total = None
+        self.decode = None
+        self.cast = None
+        self.cache = None
+        self.error = None
+        self.start = timer()
+
+    def __repr__(self):
+        fields = ("{0}={1!r}".format(k, getattr(self, k))
+                  for k in self.__slots__[:-1] if getattr(self, k) is not None)
+        return "Event({0})".format(", ".join(fields))
+
+def register(hook):
+    """Registers a function to call with each :class:`Event`.
+
+    Args:
+        hook: function that takes an :class:`Event`; for example a
+          :class:`Summary`.
+
+    Returns:
+        The hook, so that this can be used as a decorator.
+    """
+    hooks.append(hook)
+    return hook
+
+def unregister(hook):
+    """Removes a function that was registered with :func:`register`.
+    """
+    if hook in hooks:
+        hooks.remove(hook)
+
+def start(kind, url=None):
+    """Returns a new :class:`Event` for a request that is starting, or `None`
+    if there are no hooks to report it to.
+    """
+    if len(hooks) == 0:
+        return None
+    return Event(kind, url)
+
+def finish(event, error=None):
+    """Sets the total time of an event (if it isn't set yet) and reports it to
+    all the hooks.
+
+    Args:
+        event (Event): event returned by :func:`start`; `None` is ignored.
+        error (Exception): exception that the request raised, if any.
+    """
+    if event is None:
+        return
+    if event.total is None:
+        event.total = timer() - event.start
+    if error is not None:
+        event.error = repr(error)
+    for hook in list(hooks):
+        hook(event)
+
+timings = ["dns", "connect", "ttfb", "decode", "cast", "total"]
+"""list: of the names of the :class:`Event` attributes with times.
+"""
+
+class Summary(object):
+    """Aggregates the events of each kind: number of requests, errors,
+    cache hits and misses, bytes and the total, mean and maximum of each of
+    the :data:`timings`. Used as a context manager, it registers itself and
+    prints the summary when the block exits.
+
+    Attributes:
+        stats (dict): keys are event kinds; values are `dict` with `count`,
+          `errors`, `hits`, `misses`, `bytes` and, for each timing, the
+          `dict` of its `sum`, `count` and `max`.
+    """
+    def __init__(self):
+        from threading import Lock
+        self.stats = OrderedDict()
+        self._lock = Lock()
+        self._start = None
+        self.elapsed = None
+
+    def __call__(self, event):
+        with self._lock:
+            if event.kind not in self.stats:
+                self.stats[event.kind] = dict(
+                    count=0, errors=0, hits=0, misses=0, bytes=0,
+                    **dict((t, dict(sum=0., count=0, max=0.))
+                           for t in timings))
+            stats = self.stats[event.kind]
+            stats["count"] += 1
+            stats["errors"] += event.error is not None
+            stats["hits"] += event.cache == "hit"
+            stats["misses"] += event.cache == "miss"
+            stats["bytes"] += event.bytes or 0
+            for name in timings:
+                value = getattr(event, name)
+                if value is not None:
+                    timing = stats[name]
+                    timing["sum"] += value
+                    timing["count"] += 1
+                    timing["max"] = max(timing["max"], value)
+
+    def __enter__(self):
+        self._start = timer()
+        register(self)
+        return self
+
+    def __exit__(self, *args):
+        unregister(self)
+        self.elapsed = timer() - self._start
+        from aflow import msg
+        msg.info(self.report())
+
+    def report(self):
+        """Returns the summary as a table with one row per event kind. Times
+        are the totals in seconds, with the mean per event in milliseconds in
+        parentheses.
+        """
+        header = ("{0:<6} {1:>7} {2:>6} {3:>6} {4:>6} {5:>11}".format(
+            "kind", "count", "errors", "hits", "misses", "bytes") +
+                  ''.join(" {0:>17}".format(t) for t in timings))
+        lines = [header]
+        for kind in sorted(self.stats, key=lambda k: (kinds + [k]).index(k)):
+            stats = self.stats[kind]
+            line = "{0:<6} {1:>7d} {2:>6d} {3:>6d} {4:>6d} {5:>11d}".format(
+                kind, stats["count"], stats["errors"], stats["hits"],
+                stats["misses"], stats["bytes"])
+            for name in timings:
+                timing = stats[name]
+                if timing["count"] == 0:
+                    line += " {0:>17}".format('-')
+                else:
+                    mean = 1000*timing["sum"]/timing["count"]
+                    line += " {0:>17}".format("{0:.3f} ({1:.2f})".format(
+                        timing["sum"], mean))
+            lines.append(line)
+        if self.elapsed is not None:
+            lines.append("Elapsed: {0:.3f} s".format(self.elapsed))
+        return '\n'.join(lines)
@@ -0,0 +1,522 @@
+"""Specialized parsers for the values of each AFLUX keyword. Each parser
+takes the raw `value` string (and the number of atoms in the cell, for
+per-atom vectors) and returns the cast python value; malformed values raise
+:class:`ValueError`. Use :func:`aflow.caster.parse` to apply them.
+
+.. warning:: This module is generated from the AFLUX schema by
+  :func:`aflow.generators.keywords`; don't edit it by hand.
+"""
+from six.moves import intern
+from aflow.caster import (_strings, _interned, _integer, _vector, _fixed,
+                          _forces, _kpoints, _stoich, _ldau_TLUJ)
+
+def parse_Bravais_lattice_orig(value, natoms=None):
+    return intern(value)
+
+def parse_Bravais_lattice_relax(value, natoms=None):
+    return intern(value)
+
+def parse_Egap(value, natoms=None):
+    return float(value)
+
+def parse_Egap_fit(value, natoms=None):
+    return float(value)
+
+def parse_Egap_type(value, natoms=None):
+    return intern(value)
+
+def parse_PV_atom(value, natoms=None):
+    return float(value)
+
+def parse_PV_cell(value, natoms=None):
+    return float(value)
+
+def parse_Pearson_symbol_orig(value, natoms=None):
+    return intern(value)
+
+def parse_Pearson_symbol_relax(value, natoms=None):
+    return intern(value)
+
+def parse_Pulay_stress(value, natoms=None):
+    return float(value)
+
+def parse_ael_bulk_modulus_reuss(value, natoms=None):
+    return float(value)
+
+def parse_ael_bulk_modulus_voigt(value, natoms=None):
+    return float(value)
+
+def parse_ael_bulk_modulus_vrh(value, natoms=None):
+    return float(value)
+
+def parse_ael_elastic_anisotropy(value, natoms=None):
+    return float(value)
+
+def parse_ael_poisson_ratio(value, natoms=None):
+    return float(value)
+
+def parse_ael_shear_modulus_reuss(value, natoms=None):
+    return float(value)
+
+def parse_ael_shear_modulus_voigt(value, natoms=None):
+    return float(value)
+
+def parse_ael_shear_modulus_vrh(value, natoms=None):
+    return float(value)
+
+def parse_aflow_version(value, natoms=None):
+    return intern(value)
+
+def parse_aflowlib_date(value, natoms=None):
+    return str(value)
+
+def parse_aflowlib_version(value, natoms=None):
+    return intern(value)
+
+def parse_agl_acoustic_debye(value, natoms=None):
+    return float(value)
+
+def parse_agl_bulk_modulus_isothermal_300K(value, natoms=None):
+    return float(value)
+
+def parse_agl_bulk_modulus_static_300K(value, natoms=None):
+    return float(value)
+
+def parse_agl_debye(value, natoms=None):
+    return float(value)
+
+def parse_agl_gruneisen(value, natoms=None):
+    return float(value)
+
+def parse_agl_heat_capacity_Cp_300K(value, natoms=None):
+    return float(value)
+
+def parse_agl_heat_capacity_Cv_300K(value, natoms=None):
+    return float(value)
+
+def parse_agl_thermal_conductivity_300K(value, natoms=None):
+    return float(value)
+
+def parse_agl_thermal_expansion_300K(value, natoms=None):
+    return float(value)
+
+def parse_auid(value, natoms=None):
+    return str(value)
+
+def parse_aurl(value, natoms=None):
+    return str(value)
+
+def parse_bader_atomic_volumes(value, natoms=None):
+    return _vector(value, 'float64')
+
+def parse_bader_net_charges(value, natoms=None):
+    return _vector(value, 'float64')
+
+def parse_calculation_cores(value, natoms=None):
+    return _integer(value)
+
+def parse_calculation_memory(value, natoms=None):
+    return float(value)
+
+def parse_calculation_time(value, natoms=None):
+    return float(value)
+
+def parse_catalog(value, natoms=None):
+    return value
+
+def parse_code(value, natoms=None):
+    return intern(value)
+
+def parse_composition(value, natoms=None):
+    return _vector(value, 'int64')
+
+def parse_compound(value, natoms=None):
+    return str(value)
+
+def parse_data_api(value, natoms=None):
+    return intern(value)
+
+def parse_data_source(value, natoms=None):
+    return _interned(value)
+
+def parse_delta_electronic_energy_convergence(value, natoms=None):
+    return float(value)
+
+def parse_delta_electronic_energy_threshold(value, natoms=None):
+    return float(value)
+
+def parse_density(value, natoms=None):
+    return float(value)
+
+def parse_dft_type(value, natoms=None):
+    return _interned(value)
+
+def parse_eentropy_atom(value, natoms=None):
+    return float(value)
+
+def parse_eentropy_cell(value, natoms=None):
+    return float(value)
+
+def parse_energy_atom(value, natoms=None):
+    return float(value)
+
+def parse_energy_cell(value, natoms=None):
+    return float(value)
+
+def parse_energy_cutoff(value, natoms=None):
+    return _vector(value, 'float64')
+
+def parse_enthalpy_atom(value, natoms=None):
+    return float(value)
+
+def parse_enthalpy_cell(value, natoms=None):
+    return float(value)
+
+def parse_enthalpy_formation_atom(value, natoms=None):
+    return float(value)
+
+def parse_enthalpy_formation_cell(value, natoms=None):
+    return float(value)
+
+def parse_entropic_temperature(value, natoms=None):
+    return float(value)
+
+def parse_files(value, natoms=None):
+    return _strings(value)
+
+def parse_forces(value, natoms=None):
+    return _forces(value, natoms)
+
+def parse_geometry(value, natoms=None):
+    return _fixed(value, 'float64', (6,))
+
+def parse_keywords(value, natoms=None):
+    return value
+
+def parse_kpoints(value, natoms=None):
+    return _kpoints(value)
+
+def parse_lattice_system_orig(value, natoms=None):
+    return intern(value)
+
+def parse_lattice_system_relax(value, natoms=None):
+    return intern(value)
+
+def parse_lattice_variation_orig(value, natoms=None):
+    return intern(value)
+
+def parse_lattice_variation_relax(value, natoms=None):
+    return intern(value)
+
+def parse_ldau_TLUJ(value, natoms=None):
+    return _ldau_TLUJ(value)
+
+def parse_loop(value, natoms=None):
+    return _interned(value)
+
+def parse_natoms(value, natoms=None):
+    return _integer(value)
+
+def parse_nbondxx(value, natoms=None):
+    return _vector(value, 'float64')
+
+def parse_node_CPU_Cores(value, natoms=None):
+    return _integer(value)
+
+def parse_node_CPU_MHz(value, natoms=None):
+    return float(value)
+
+def parse_node_CPU_Model(value, natoms=None):
+    return intern(value)
+
+def parse_node_RAM_GB(value, natoms=None):
+    return float(value)
+
+def parse_nspecies(value, natoms=None):
+    return _integer(value)
+
+def parse_positions_cartesian(value, natoms=None):
+    return _forces(value, natoms)
+
+def parse_positions_fractional(value, natoms=None):
+    return _forces(value, natoms)
+
+def parse_pressure(value, natoms=None):
+    return float(value)
+
+def parse_pressure_residual(value, natoms=None):
+    return float(value)
+
+def parse_prototype(value, natoms=None):
+    return intern(value)
+
+def parse_scintillation_attenuation_length(value, natoms=None):
+    return float(value)
+
+def parse_sg(value, natoms=None):
+    return _interned(value)
+
+def parse_sg2(value, natoms=None):
+    return _interned(value)
+
+def parse_spacegroup_orig(value, natoms=None):
+    return _integer(value)
+
+def parse_spacegroup_relax(value, natoms=None):
+    return _integer(value)
+
+def parse_species(value, natoms=None):
+    return _interned(value)
+
+def parse_species_pp(value, natoms=None):
+    return _interned(value)
+
+def parse_species_pp_ZVAL(value, natoms=None):
+    return _vector(value, 'float64')
+
+def parse_species_pp_version(value, natoms=None):
+    return _interned(value)
+
+def parse_spinD(value, natoms=None):
+    return _vector(value, 'float64')
+
+def parse_spinF(value, natoms=None):
+    return float(value)
+
+def parse_spin_atom(value, natoms=None):
+    return float(value)
+
+def parse_spin_cell(value, natoms=None):
+    return float(value)
+
+def parse_stoich(value, natoms=None):
+    return _stoich(value)
+
+def parse_stoichiometry(value, natoms=None):
+    return _vector(value, 'float64')
+
+def parse_stress_tensor(value, natoms=None):
+    return _fixed(value, 'float64', (3, 3))
+
+def parse_valence_cell_iupac(value, natoms=None):
+    return _integer(value)
+
+def parse_valence_cell_std(value, natoms=None):
+    return _integer(value)
+
+def parse_volume_atom(value, natoms=None):
+    return float(value)
+
+def parse_volume_cell(value, natoms=None):
+    return float(value)
+
+parsers = {
+    "Bravais_lattice_orig": parse_Bravais_lattice_orig,
+    "Bravais_lattice_relax": parse_Bravais_lattice_relax,
+    "Egap": parse_Egap,
+    "Egap_fit": parse_Egap_fit,
+    "Egap_type": parse_Egap_type,
+    "PV_atom": parse_PV_atom,
+    "PV_cell": parse_PV_cell,
+    "Pearson_symbol_orig": parse_Pearson_symbol_orig,
+    "Pearson_symbol_relax": parse_Pearson_symbol_relax,
+    "Pulay_stress": parse_Pulay_stress,
+    "ael_bulk_modulus_reuss": parse_ael_bulk_modulus_reuss,
+    "ael_bulk_modulus_voigt": parse_ael_bulk_modulus_voigt,
+    "ael_bulk_modulus_vrh": parse_ael_bulk_modulus_vrh,
+    "ael_elastic_anisotropy": parse_ael_elastic_anisotropy,
+    "ael_poisson_ratio": parse_ael_poisson_ratio,
+    "ael_shear_modulus_reuss": parse_ael_shear_modulus_reuss,
+    "ael_shear_modulus_voigt": parse_ael_shear_modulus_voigt,
+    "ael_shear_modulus_vrh": parse_ael_shear_modulus_vrh,
+    "aflow_version": parse_aflow_version,
+    "aflowlib_date": parse_aflowlib_date,
+    "aflowlib_version": parse_aflowlib_version,
+    "agl_acoustic_debye": parse_agl_acoustic_debye,
+    "agl_bulk_modulus_isothermal_300K": parse_agl_bulk_modulus_isothermal_300K,
+    "agl_bulk_modulus_static_300K": parse_agl_bulk_modulus_static_300K,
+    "agl_debye": parse_agl_debye,
+    "agl_gruneisen": parse_agl_gruneisen,
+    "agl_heat_capacity_Cp_300K": parse_agl_heat_capacity_Cp_300K,
+    "agl_heat_capacity_Cv_300K": parse_agl_heat_capacity_Cv_300K,
+    "agl_thermal_conductivity_300K": parse_agl_thermal_conductivity_300K,
+    "agl_thermal_expansion_300K": parse_agl_thermal_expansion_300K,
+    "auid": parse_auid,
+    "aurl": parse_aurl,
+    "bader_atomic_volumes": parse_bader_atomic_volumes,
+    "bader_net_charges": parse_bader_net_charges,
+    "calculation_cores": parse_calculation_cores,
+    "calculation_memory": parse_calculation_memory,
+    "calculation_time": parse_calculation_time,
+    "catalog": parse_catalog,
+    "code": parse_code,
+    "composition": parse_composition,
+    "compound": parse_compound,
+    "data_api": parse_data_api,
+    "data_source": parse_data_source,
+    "delta_electronic_energy_convergence": parse_delta_electronic_energy_convergence,
+    "delta_electronic_energy_threshold": parse_delta_electronic_energy_threshold,
+    "density": parse_density,
+    "dft_type": parse_dft_type,
+    "eentropy_atom": parse_eentropy_atom,
+    "eentropy_cell": parse_eentropy_cell,
+    "energy_atom": parse_energy_atom,
+    "energy_cell": parse_energy_cell,
+    "energy_cutoff": parse_energy_cutoff,
+    "enthalpy_atom": parse_enthalpy_atom,
+    "enthalpy_cell": parse_enthalpy_cell,
+    "enthalpy_formation_atom": parse_enthalpy_formation_atom,
+    "enthalpy_formation_cell": parse_enthalpy_formation_cell,
+    "entropic_temperature": parse_entropic_temperature,
+    "files": parse_files,
+    "forces": parse_forces,
+    "geometry": parse_geometry,
+    "keywords": parse_keywords,
+    "kpoints": parse_kpoints,
+    "lattice_system_orig": parse_lattice_system_orig,
+    "lattice_system_relax": parse_lattice_system_relax,
+    "lattice_variation_orig": parse_lattice_variation_orig,
+    "lattice_variation_relax": parse_lattice_variation_relax,
+    "ldau_TLUJ": parse_ldau_TLUJ,
+    "loop": parse_loop,
+    "natoms": parse_natoms,
+    "nbondxx": parse_nbondxx,
+    "node_CPU_Cores": parse_node_CPU_Cores,
+    "node_CPU_MHz": parse_node_CPU_MHz,
+    "node_CPU_Model": parse_node_CPU_Model,
+    "node_RAM_GB": parse_node_RAM_GB,
+    "nspecies": parse_nspecies,
+    "positions_cartesian": parse_positions_cartesian,
+    "positions_fractional": parse_positions_fractional,
+    "pressure": parse_pressure,
+    "pressure_residual": parse_pressure_residual,
+    "prototype": parse_prototype,
+    "scintillation_attenuation_length": parse_scintillation_attenuation_length,
+    "sg": parse_sg,
+    "sg2": parse_sg2,
+    "spacegroup_orig": parse_spacegroup_orig,
+    "spacegroup_relax": parse_spacegroup_relax,
+    "species": parse_species,
+    "species_pp": parse_species_pp,
+    "species_pp_ZVAL": parse_species_pp_ZVAL,
+    "species_pp_version": parse_species_pp_version,
+    "spinD": parse_spinD,
+    "spinF": parse_spinF,
+    "spin_atom": parse_spin_atom,
+    "spin_cell": parse_spin_cell,
+    "stoich": parse_stoich,
+    "stoichiometry": parse_stoichiometry,
+    "stress_tensor": parse_stress_tensor,
+    "valence_cell_iupac": parse_valence_cell_iupac,
+    "valence_cell_std": parse_valence_cell_std,
+    "volume_atom": parse_volume_atom,
+    "volume_cell": parse_volume_cell,
+}
+"""dict: keys are keyword names; values are their parser functions.
+"""
+
+sources = {
+    "Bravais_lattice_orig": 'intern(value)',
+    "Bravais_lattice_relax": 'intern(value)',
+    "Egap": 'float(value)',
+    "Egap_fit": 'float(value)',
+    "Egap_type": 'intern(value)',
+    "PV_atom": 'float(value)',
+    "PV_cell": 'float(value)',
+    "Pearson_symbol_orig": 'intern(value)',
+    "Pearson_symbol_relax": 'intern(value)',
+    "Pulay_stress": 'float(value)',
+    "ael_bulk_modulus_reuss": 'float(value)',
+    "ael_bulk_modulus_voigt": 'float(value)',
+    "ael_bulk_modulus_vrh": 'float(value)',
+    "ael_elastic_anisotropy": 'float(value)',
+    "ael_poisson_ratio": 'float(value)',
+    "ael_shear_modulus_reuss": 'float(value)',
+    "ael_shear_modulus_voigt": 'float(value)',
+    "ael_shear_modulus_vrh": 'float(value)',
+    "aflow_version": 'intern(value)',
+    "aflowlib_date": 'str(value)',
+    "aflowlib_version": 'intern(value)',
+    "agl_acoustic_debye": 'float(value)',
+    "agl_bulk_modulus_isothermal_300K": 'float(value)',
+    "agl_bulk_modulus_static_300K": 'float(value)',
+    "agl_debye": 'float(value)',
+    "agl_gruneisen": 'float(value)',
+    "agl_heat_capacity_Cp_300K": 'float(value)',
+    "agl_heat_capacity_Cv_300K": 'float(value)',
+    "agl_thermal_conductivity_300K": 'float(value)',
+    "agl_thermal_expansion_300K": 'float(value)',
+    "auid": 'str(value)',
+    "aurl": 'str(value)',
+    "bader_atomic_volumes": "_vector(value, 'float64')",
+    "bader_net_charges": "_vector(value, 'float64')",
+    "calculation_cores": '_integer(value)',
+    "calculation_memory": 'float(value)',
+    "calculation_time": 'float(value)',
+    "catalog": 'value',
+    "code": 'intern(value)',
+    "composition": "_vector(value, 'int64')",
+    "compound": 'str(value)',
+    "data_api": 'intern(value)',
+    "data_source": '_interned(value)',
+    "delta_electronic_energy_convergence": 'float(value)',
+    "delta_electronic_energy_threshold": 'float(value)',
+    "density": 'float(value)',
+    "dft_type": '_interned(value)',
+    "eentropy_atom": 'float(value)',
+    "eentropy_cell": 'float(value)',
+    "energy_atom": 'float(value)',
+    "energy_cell": 'float(value)',
+    "energy_cutoff": "_vector(value, 'float64')",
+    "enthalpy_atom": 'float(value)',
+    "enthalpy_cell": 'float(value)',
+    "enthalpy_formation_atom": 'float(value)',
+    "enthalpy_formation_cell": 'float(value)',
+    "entropic_temperature": 'float(value)',
+    "files": '_strings(value)',
+    "forces": '_forces(value, natoms)',
+    "geometry": "_fixed(value, 'float64', (6,))",
+    "keywords": 'value',
+    "kpoints": '_kpoints(value)',
+    "lattice_system_orig": 'intern(value)',
+    "lattice_system_relax": 'intern(value)',
+    "lattice_variation_orig": 'intern(value)',
+    "lattice_variation_relax": 'intern(value)',
+    "ldau_TLUJ": '_ldau_TLUJ(value)',
+    "loop": '_interned(value)',
+    "natoms": '_integer(value)',
+    "nbondxx": "_vector(value, 'float64')",
+    "node_CPU_Cores": '_integer(value)',
+    "node_CPU_MHz": 'float(value)',
+    "node_CPU_Model": 'intern(value)',
+    "node_RAM_GB": 'float(value)',
+    "nspecies": '_integer(value)',
+    "positions_cartesian": '_forces(value, natoms)',
+    "positions_fractional": '_forces(value, natoms)',
+    "pressure": 'float(value)',
+    "pressure_residual": 'float(value)',
+    "prototype": 'intern(value)',
+    "scintillation_attenuation_length": 'float(value)',
+    "sg": '_interned(value)',
+    "sg2": '_interned(value)',
+    "spacegroup_orig": '_integer(value)',
+    "spacegroup_relax": '_integer(value)',
+    "species": '_interned(value)',
+    "species_pp": '_interned(value)',
+    "species_pp_ZVAL": "_vector(value, 'float64')",
+    "species_pp_version": '_interned(value)',
+    "spinD": "_vector(value, 'float64')",
+    "spinF": 'float(value)',
+    "spin_atom": 'float(value)',
+    "spin_cell": 'float(value)',
+    "stoich": '_stoich(value)',
+    "stoichiometry": "_vector(value, 'float64')",
+    "stress_tensor": "_fixed(value, 'float64', (3, 3))",
+    "valence_cell_iupac": '_integer(value)',
+    "valence_cell_std": '_integer(value)',
+    "volume_atom": 'float(value)',
+    "volume_cell": 'float(value)',
+}
+"""dict: keys are keyword names; values are the python expressions that their
+parsers evaluate.
+"""
@@ -0,0 +1,334 @@
+"""Table of the keywords supported by AFLUX.
+
+.. warning:: This module is generated from the AFLUX schema by
+  :func:`aflow.generators.keywords`; don't edit it by hand. The documentation
+  for each keyword is in `schema.json` and is only loaded when needed.
+"""
+version = 1
+"""int: version of the local schema snapshot that this module was generated
+from.
+"""
+
+keywords = {
+    "Bravais_lattice_orig": ('string', 'str', ''),
+    "Bravais_lattice_relax": ('string', 'str', ''),
+    "Egap": ('number', 'float', 'eV'),
+    "Egap_fit": ('number', 'float', 'eV'),
+    "Egap_type": ('string', 'str', ''),
+    "PV_atom": ('number', 'float', 'eV/atom'),
+    "PV_cell": ('number', 'float', 'eV'),
+    "Pearson_symbol_orig": ('string', 'str', ''),
+    "Pearson_symbol_relax": ('string', 'str', ''),
+    "Pulay_stress": ('number', 'float', 'kbar'),
+    "ael_bulk_modulus_reuss": ('number', 'float', 'GPa'),
+    "ael_bulk_modulus_voigt": ('number', 'float', 'GPa'),
+    "ael_bulk_modulus_vrh": ('number', 'float', 'GPa'),
+    "ael_elastic_anisotropy": ('number', 'float', ''),
+    "ael_poisson_ratio": ('number', 'float', ''),
+    "ael_shear_modulus_reuss": ('number', 'float', 'GPa'),
+    "ael_shear_modulus_voigt": ('number', 'float', 'GPa'),
+    "ael_shear_modulus_vrh": ('number', 'float', 'GPa'),
+    "aflow_version": ('string', 'str', ''),
+    "aflowlib_date": ('string', 'str', ''),
+    "aflowlib_version": ('string', 'str', ''),
+    "agl_acoustic_debye": ('number', 'float', 'K'),
+    "agl_bulk_modulus_isothermal_300K": ('number', 'float', 'GPa'),
+    "agl_bulk_modulus_static_300K": ('number', 'float', 'GPa'),
+    "agl_debye": ('number', 'float', 'K'),
+    "agl_gruneisen": ('number', 'float', ''),
+    "agl_heat_capacity_Cp_300K": ('number', 'float', 'kB/cell'),
+    "agl_heat_capacity_Cv_300K": ('number', 'float', 'kB/cell'),
+    "agl_thermal_conductivity_300K": ('number', 'float', 'W/m*K'),
+    "agl_thermal_expansion_300K": ('number', 'float', '1/K'),
+    "auid": ('string', 'str', ''),
+    "aurl": ('string', 'str', ''),
+    "bader_atomic_volumes": ('numbers', 'list', '&Aring;<sup>3</sup>'),
+    "bader_net_charges": ('numbers', 'list', 'electrons'),
+    "calculation_cores": ('number', 'float', ''),
+    "calculation_memory": ('number', 'float', 'Megabytes'),
+    "calculation_time": ('number', 'float', 'seconds'),
+    "catalog": (None, None, ''),
+    "code": ('string', 'str', ''),
+    "composition": ('numbers', 'list', ''),
+    "compound": ('string', 'str', ''),
+    "data_api": ('string', 'str', ''),
+    "data_source": ('strings', 'list', ''),
+    "delta_electronic_energy_convergence": ('number', 'float', ''),
+    "delta_electronic_energy_threshold": ('number', 'float', ''),
+    "density": ('number', 'float', 'grams/cm<sup>3</sup>'),
+    "dft_type": ('strings', 'list', ''),
+    "eentropy_atom": ('number', 'float', 'eV/atom'),
+    "eentropy_cell": ('number', 'float', 'eV/atom'),
+    "energy_atom": ('number', 'float', 'eV/atom'),
+    "energy_cell": ('number', 'float', 'eV'),
+    "energy_cutoff": ('numbers', 'list', 'eV'),
+    "enthalpy_atom": ('number', 'float', 'eV/atom'),
+    "enthalpy_cell": ('number', 'float', 'eV'),
+    "enthalpy_formation_atom": ('number', 'float', 'eV/atom'),
+    "enthalpy_formation_cell": ('number', 'float', 'eV'),
+    "entropic_temperature": ('number', 'float', 'Kelvin'),
+    "files": ('strings', 'list', ''),
+    "forces": ('numbers', 'numpy.ndarray', 'eV/&Aring;'),
+    "geometry": ('numbers', 'list', '&Aring;'),
+    "keywords": (None, None, ''),
+    "kpoints": ('numbers', 'dict', ''),
+    "lattice_system_orig": ('string', 'str', ''),
+    "lattice_system_relax": ('string', 'str', ''),
+    "lattice_variation_orig": ('string', 'str', ''),
+    "lattice_variation_relax": ('string', 'str', ''),
+    "ldau_TLUJ": ('numbers', 'dict', ''),
+    "loop": ('strings', 'list', ''),
+    "natoms": ('number', 'float', ''),
+    "nbondxx": ('numbers', 'list', '&Aring;'),
+    "node_CPU_Cores": ('number', 'float', ''),
+    "node_CPU_MHz": ('number', 'float', 'Megahertz'),
+    "node_CPU_Model": ('string', 'str', ''),
+    "node_RAM_GB": ('number', 'float', 'Gigabytes'),
+    "nspecies": ('number', 'float', ''),
+    "positions_cartesian": ('numbers', 'numpy.ndarray', '&Aring;'),
+    "positions_fractional": ('numbers', 'numpy.ndarray', ''),
+    "pressure": ('number', 'float', 'kbar'),
+    "pressure_residual": ('number', 'float', 'kbar'),
+    "prototype": ('string', 'str', ''),
+    "scintillation_attenuation_length": ('number', 'float', 'cm'),
+    "sg": ('strings', 'list', ''),
+    "sg2": ('strings', 'list', ''),
+    "spacegroup_orig": ('number', 'float', ''),
+    "spacegroup_relax": ('number', 'float', ''),
+    "species": ('strings', 'list', ''),
+    "species_pp": ('strings', 'list', ''),
+    "species_pp_ZVAL": ('numbers', 'list', 'electrons'),
+    "species_pp_version": ('strings', 'list', ''),
+    "spinD": ('numbers', 'list', '&mu;<sub>B</sub>'),
+    "spinF": ('number', 'float', '&mu;<sub>B</sub>'),
+    "spin_atom": ('number', 'float', '&mu;<sub>B</sub>/atom'),
+    "spin_cell": ('number', 'float', '&mu;<sub>B</sub>'),
+    "stoich": ('numbers', 'list', ''),
+    "stoichiometry": ('numbers', 'list', ''),
+    "stress_tensor": ('numbers', 'list', ''),
+    "valence_cell_iupac": ('number', 'float', ''),
+    "valence_cell_std": ('number', 'float', ''),
+    "volume_atom": ('number', 'float', '&Aring;<sup>3</sup>/atom'),
+    "volume_cell": ('number', 'float', '&Aring;<sup>3</sup>'),
+}
+"""dict: keys are keyword names; values are `(atype, ptype, units)` with the
+name of the AFLOW type, the name of the python type that values are cast to and
+the units of the values.
+"""
+
+casters = {
+    "Bravais_lattice_orig": 'string',
+    "Bravais_lattice_relax": 'string',
+    "Egap": 'number',
+    "Egap_fit": 'number',
+    "Egap_type": 'string',
+    "PV_atom": 'number',
+    "PV_cell": 'number',
+    "Pearson_symbol_orig": 'string',
+    "Pearson_symbol_relax": 'string',
+    "Pulay_stress": 'number',
+    "ael_bulk_modulus_reuss": 'number',
+    "ael_bulk_modulus_voigt": 'number',
+    "ael_bulk_modulus_vrh": 'number',
+    "ael_elastic_anisotropy": 'number',
+    "ael_poisson_ratio": 'number',
+    "ael_shear_modulus_reuss": 'number',
+    "ael_shear_modulus_voigt": 'number',
+    "ael_shear_modulus_vrh": 'number',
+    "aflow_version": 'string',
+    "aflowlib_date": 'string',
+    "aflowlib_version": 'string',
+    "agl_acoustic_debye": 'number',
+    "agl_bulk_modulus_isothermal_300K": 'number',
+    "agl_bulk_modulus_static_300K": 'number',
+    "agl_debye": 'number',
+    "agl_gruneisen": 'number',
+    "agl_heat_capacity_Cp_300K": 'number',
+    "agl_heat_capacity_Cv_300K": 'number',
+    "agl_thermal_conductivity_300K": 'number',
+    "agl_thermal_expansion_300K": 'number',
+    "auid": 'string',
+    "aurl": 'string',
+    "bader_atomic_volumes": 'numbers',
+    "bader_net_charges": 'numbers',
+    "calculation_cores": 'number',
+    "calculation_memory": 'number',
+    "calculation_time": 'number',
+    "catalog": None,
+    "code": 'string',
+    "composition": 'numbers',
+    "compound": 'string',
+    "data_api": 'string',
+    "data_source": 'strings',
+    "delta_electronic_energy_convergence": 'number',
+    "delta_electronic_energy_threshold": 'number',
+    "density": 'number',
+    "dft_type": 'strings',
+    "eentropy_atom": 'number',
+    "eentropy_cell": 'number',
+    "energy_atom": 'number',
+    "energy_cell": 'number',
+    "energy_cutoff": 'numbers',
+    "enthalpy_atom": 'number',
+    "enthalpy_cell": 'number',
+    "enthalpy_formation_atom": 'number',
+    "enthalpy_formation_cell": 'number',
+    "entropic_temperature": 'number',
+    "files": 'strings',
+    "forces": 'forces',
+    "geometry": 'numbers',
+    "keywords": None,
+    "kpoints": 'kpoints',
+    "lattice_system_orig": 'string',
+    "lattice_system_relax": 'string',
+    "lattice_variation_orig": 'string',
+    "lattice_variation_relax": 'string',
+    "ldau_TLUJ": 'ldau_TLUJ',
+    "loop": 'strings',
+    "natoms": 'number',
+    "nbondxx": 'numbers',
+    "node_CPU_Cores": 'number',
+    "node_CPU_MHz": 'number',
+    "node_CPU_Model": 'string',
+    "node_RAM_GB": 'number',
+    "nspecies": 'number',
+    "positions_cartesian": 'positions_cartesian',
+    "positions_fractional": 'positions_fractional',
+    "pressure": 'number',
+    "pressure_residual": 'number',
+    "prototype": 'string',
+    "scintillation_attenuation_length": 'number',
+    "sg": 'strings',
+    "sg2": 'strings',
+    "spacegroup_orig": 'number',
+    "spacegroup_relax": 'number',
+    "species": 'strings',
+    "species_pp": 'strings',
+    "species_pp_ZVAL": 'numbers',
+    "species_pp_version": 'strings',
+    "spinD": 'numbers',
+    "spinF": 'number',
+    "spin_atom": 'number',
+    "spin_cell": 'number',
+    "stoich": 'stoich',
+    "stoichiometry": 'numbers',
+    "stress_tensor": 'numbers',
+    "valence_cell_iupac": 'number',
+    "valence_cell_std": 'number',
+    "volume_atom": 'number',
+    "volume_cell": 'number',
+}
+"""dict: keys are keyword names; values are the names of the casting rules in
+:func:`aflow.caster.cast` that apply to their values.
+"""
+
+columns = {
+    "Bravais_lattice_orig": ('object', (), True),
+    "Bravais_lattice_relax": ('object', (), True),
+    "Egap": ('float64', (), False),
+    "Egap_fit": ('float64', (), False),
+    "Egap_type": ('object', (), False),
+    "PV_atom": ('float64', (), False),
+    "PV_cell": ('float64', (), False),
+    "Pearson_symbol_orig": ('object', (), False),
+    "Pearson_symbol_relax": ('object', (), False),
+    "Pulay_stress": ('float64', (), False),
+    "ael_bulk_modulus_reuss": ('float64', (), True),
+    "ael_bulk_modulus_voigt": ('float64', (), True),
+    "ael_bulk_modulus_vrh": ('float64', (), True),
+    "ael_elastic_anisotropy": ('float64', (), True),
+    "ael_poisson_ratio": ('float64', (), True),
+    "ael_shear_modulus_reuss": ('float64', (), True),
+    "ael_shear_modulus_voigt": ('float64', (), True),
+    "ael_shear_modulus_vrh": ('float64', (), True),
+    "aflow_version": ('object', (), True),
+    "aflowlib_date": ('object', (), True),
+    "aflowlib_version": ('object', (), True),
+    "agl_acoustic_debye": ('float64', (), True),
+    "agl_bulk_modulus_isothermal_300K": ('float64', (), True),
+    "agl_bulk_modulus_static_300K": ('float64', (), True),
+    "agl_debye": ('float64', (), True),
+    "agl_gruneisen": ('float64', (), True),
+    "agl_heat_capacity_Cp_300K": ('float64', (), True),
+    "agl_heat_capacity_Cv_300K": ('float64', (), True),
+    "agl_thermal_conductivity_300K": ('float64', (), True),
+    "agl_thermal_expansion_300K": ('float64', (), True),
+    "auid": ('object', (), False),
+    "aurl": ('object', (), False),
+    "bader_atomic_volumes": ('float64', (None,), True),
+    "bader_net_charges": ('float64', (None,), True),
+    "calculation_cores": ('int64', (), True),
+    "calculation_memory": ('float64', (), True),
+    "calculation_time": ('float64', (), True),
+    "catalog": ('object', (), True),
+    "code": ('object', (), True),
+    "composition": ('int64', (None,), True),
+    "compound": ('object', (), False),
+    "data_api": ('object', (), False),
+    "data_source": ('object', (None,), True),
+    "delta_electronic_energy_convergence": ('float64', (), True),
+    "delta_electronic_energy_threshold": ('float64', (), True),
+    "density": ('float64', (), True),
+    "dft_type": ('object', (None,), True),
+    "eentropy_atom": ('float64', (), True),
+    "eentropy_cell": ('float64', (), True),
+    "energy_atom": ('float64', (), False),
+    "energy_cell": ('float64', (), False),
+    "energy_cutoff": ('float64', (None,), True),
+    "enthalpy_atom": ('float64', (), False),
+    "enthalpy_cell": ('float64', (), False),
+    "enthalpy_formation_atom": ('float64', (), False),
+    "enthalpy_formation_cell": ('float64', (), False),
+    "entropic_temperature": ('float64', (), False),
+    "files": ('object', (None,), True),
+    "forces": ('float64', (None, 3), True),
+    "geometry": ('float64', (6,), False),
+    "keywords": ('object', (), False),
+    "kpoints": ('object', None, True),
+    "lattice_system_orig": ('object', (), False),
+    "lattice_system_relax": ('object', (), False),
+    "lattice_variation_orig": ('object', (), False),
+    "lattice_variation_relax": ('object', (), False),
+    "ldau_TLUJ": ('object', None, False),
+    "loop": ('object', (None,), True),
+    "natoms": ('int64', (), False),
+    "nbondxx": ('float64', (None,), True),
+    "node_CPU_Cores": ('int64', (), True),
+    "node_CPU_MHz": ('float64', (), True),
+    "node_CPU_Model": ('object', (), True),
+    "node_RAM_GB": ('float64', (), True),
+    "nspecies": ('int64', (), False),
+    "positions_cartesian": ('float64', (None, 3), False),
+    "positions_fractional": ('float64', (None, 3), False),
+    "pressure": ('float64', (), False),
+    "pressure_residual": ('float64', (), False),
+    "prototype": ('object', (), False),
+    "scintillation_attenuation_length": ('float64', (), False),
+    "sg": ('object', (None,), False),
+    "sg2": ('object', (None,), False),
+    "spacegroup_orig": ('int64', (), False),
+    "spacegroup_relax": ('int64', (), False),
+    "species": ('object', (None,), False),
+    "species_pp": ('object', (None,), False),
+    "species_pp_ZVAL": ('float64', (None,), True),
+    "species_pp_version": ('object', (None,), False),
+    "spinD": ('float64', (None,), False),
+    "spinF": ('float64', (), False),
+    "spin_atom": ('float64', (), False),
+    "spin_cell": ('float64', (), False),
+    "stoich": ('float64', (None,), True),
+    "stoichiometry": ('float64', (None,), False),
+    "stress_tensor": ('float64', (3, 3), False),
+    "valence_cell_iupac": ('int64', (), False),
+    "valence_cell_std": ('int64', (), False),
+    "volume_atom": ('float64', (), False),
+    "volume_cell": ('float64', (), False),
+}
+"""dict: keys are keyword names; values are the typed column definitions
+`(dtype, shape, nullable)`. `dtype` is the name of the :mod:`numpy` type of the
+values (`object` for strings and dictionaries); `shape` is the shape of a
+single value: `()` for scalars, `None` for a dimension whose size varies
+between entries (e.g. `(None, 3)` for per-atom vectors) or `None` for values
+that aren't arrays. `nullable` is False for keywords that AFLUX lists as
+mandatory.
+"""
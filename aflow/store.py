@@ -0,0 +1,381 @@
+"""Content-addressed local store for the files of AFLOW entries. Once a file
+has been downloaded, any later request for it (from the same session or
+another one) is served from disk.
+"""
+import atexit
+from threading import Lock
+
+class FileStore(object):
+    """Stores downloaded files under the SHA-256 checksum of their contents,
+    so that identical files are only kept once. An index maps the AFLOW URL
+    and file name of each download to its checksum.
+
+    .. note:: The index is written to disk after every :attr:`batch` changes
+      and by :meth:`flush` (which also runs when the interpreter exits for the
+      store enabled with :func:`set_store`). Each
+      write merges the changes with the index on disk under a file lock, so
+      several processes can share the same folder.
+
+    Args:
+        folder (str): root folder of the store; it is created if it doesn't
+          exist.
+        maxsize (int): maximum number of bytes to keep on disk; the least
+          recently used files are evicted first. `None` for no limit.
+        compress (bool): when True, files are gzip-compressed on disk.
+        batch (int): number of changes (new files and reads) after which the
+          index is written to disk.
+
+    Attributes:
+        folder (str): root folder of the store.
+        maxsize (int): maximum number of bytes to keep on disk.
+        compress (bool): whether new files are compressed on disk.
+        batch (int): number of changes after which the index is written.
+        index (OrderedDict): keys are `aurl/filename`, from the least to the
+          most recently used; values are `dict` with the `sha256` checksum,
+          uncompressed `size`, number of `stored` bytes, whether the file is
+          `compressed` and its last access `time`.
+    """
+    def __init__(self, folder, maxsize=None, compress=False, batch=100):
+        from collections import OrderedDict
+        from os import path, makedirs
+        self.folder = path.abspath(path.expanduser(folder))
+        self.maxsize = maxsize
+        self.compress = compress
+        self.batch = batch
+        self._lock = Lock()
+        if not path.isdir(self.folder):
+            makedirs(self.folder)
+
+        self.index = OrderedDict()
+        self._blobs = {}
+        self._total = 0
+        self._changed = set()
+        self._removed = set()
+        self._pending = 0
+        self._reindex(self._load())
+
+    @property
+    def _index(self):
+        from os import path
+        return path.join(self.folder, "index.json")
+
+    def _blob(self, sha):
+        from os import path
+        return path.join(self.folder, "objects", sha[0:2], sha)
+
+    @staticmethod
+    def _key(aurl, filename):
+        return "{0}/{1}".format(aurl, filename)
+
+    def __contains__(self, key):
+        return self._key(*key) in self.index
+
+    @property
+    def size(self):
+        """int: number of bytes that the stored files take up on disk.
+        """
+        return self._total
+
+    def _load(self):
+        """Returns the index that is saved on disk.
+        """
+        import json
+        from os import path
+        if not path.isfile(self._index):
+            return {}
+        with open(self._index) as f:
+            return json.load(f)
+
+    def _reindex(self, index):
+        """Replaces the index and recomputes the reference counts and total
+        size of the blobs.
+        """
+        from collections import OrderedDict
+        self.index = OrderedDict(sorted(index.items(),
+                                        key=lambda kv: kv[1]["time"]))
+        self._blobs = {}
+        self._total = 0
+        for item in self.index.values():
+            self._count(item)
+
+    def _count(self, item):
+        """Adds the reference of an index item to its blob.
+        """
+        sha = item["sha256"]
+        if sha in self._blobs:
+            self._blobs[sha][0] += 1
+        else:
+            self._blobs[sha] = [1, item["stored"], item["compressed"]]
+            self._total += item["stored"]
+
+    def _remove(self, key):
+        """Removes a file from the index, and its blob from disk if no other
+        file refers to it.
+        """
+        import os
+        item = self.index.pop(key, None)
+        if item is None:
+            return
+        self._changed.discard(key)
+        self._removed.add(key)
+        self._pending += 1
+        blob = self._blobs[item["sha256"]]
+        blob[0] -= 1
+        if blob[0] == 0:
+            del self._blobs[item["sha256"]]
+            self._total -= blob[1]
+            try:
+                os.remove(self._blob(item["sha256"]))
+            except OSError:
+                pass
+
+    def open(self, aurl, filename):
+        """Opens a stored file for reading.
+
+        Args:
+            aurl (str): URL of the entry that the file belongs to.
+            filename (str): name of the file.
+
+        Returns:
+            file: binary file object with the original contents, or `None` if
+            the file isn't in the store.
+        """
+        import time
+        key = self._key(aurl, filename)
+        with self._lock:
+            item = self.index.get(key)
+            if item is None:
+                return None
+            item["time"] = time.time()
+            self.index.move_to_end(key)
+            self._changed.add(key)
+            self._pending += 1
+
+        try:
+            if item["compressed"]:
+                import gzip
+                return gzip.open(self._blob(item["sha256"]), 'rb')
+            return open(self._blob(item["sha256"]), 'rb')
+        except IOError:
+            #The file was removed from disk behind our back.
+            with self._lock:
+                self._remove(key)
+            return None
+
+    def get(self, aurl, filename, verify=True):
+        """Returns the contents of a stored file.
+
+        Args:
+            aurl (str): URL of the entry that the file belongs to.
+            filename (str): name of the file.
+            verify (bool): when True, the contents are checked against the
+              checksum in the index; corrupted files are discarded.
+
+        Returns:
+            bytes: contents of the file, or `None` if it isn't in the store.
+        """
+        key = self._key(aurl, filename)
+        item = self.index.get(key)
+        f = self.open(aurl, filename)
+        if f is None:
+            return None
+
+        try:
+            with f:
+                contents = f.read()
+        except (IOError, OSError, EOFError):
+            #Compressed files that were corrupted can't be read at all.
+            contents = None
+
+        if contents is not None and verify:
+            from hashlib import sha256
+            if sha256(contents).hexdigest() != item["sha256"]:
+                contents = None
+        if contents is None:
+            with self._lock:
+                self._remove(key)
+        return contents
+
+    def put(self, aurl, filename, chunks):
+        """Adds a file to the store.
+
+        Args:
+            aurl (str): URL of the entry that the file belongs to.
+            filename (str): name of the file.
+            chunks: `bytes` contents of the file, or an iterable of `bytes`
+              chunks (like :func:`aflow.transport.chunks`), which are written
+              to disk as they arrive.
+
+        Returns:
+            str: SHA-256 checksum of the contents.
+        """
+        import os
+        import time
+        import zlib
+        from hashlib import sha256
+        from tempfile import NamedTemporaryFile
+        if isinstance(chunks, bytes):
+            chunks = [chunks]
+
+        checksum = sha256()
+        size = 0
+        compressor = None
+        if self.compress:
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + 15)
+        with NamedTemporaryFile(dir=self.folder, delete=False) as f:
+            for chunk in chunks:
+                checksum.update(chunk)
+                size += len(chunk)
+                f.write(compressor.compress(chunk) if compressor else chunk)
+            if compressor is not None:
+                f.write(compressor.flush())
+        sha = checksum.hexdigest()
+        stored = os.path.getsize(f.name)
+
+        target = self._blob(sha)
+        key = self._key(aurl, filename)
+        with self._lock:
+            if not os.path.isdir(os.path.dirname(target)):
+                os.makedirs(os.path.dirname(target))
+            #Replacing a file releases the reference to its old contents.
+            self._remove(key)
+            blob = self._blobs.get(sha)
+            if blob is not None and os.path.isfile(target):
+                os.remove(f.name)
+                stored, compressed = blob[1], blob[2]
+            else:
+                os.replace(f.name, target)
+                compressed = self.compress
+                if blob is not None:
+                    #The blob was missing from disk; the files that refer to
+                    #it now get the new copy.
+                    self._total += stored - blob[1]
+                    blob[1:] = [stored, compressed]
+                    for v in self.index.values():
+                        if v["sha256"] == sha:
+                            v["stored"], v["compressed"] = stored, compressed
+
+            item = {"sha256": sha, "size": size, "stored": stored,
+                    "compressed": compressed, "time": time.time()}
+            self.index[key] = item
+            self._count(item)
+            self._removed.discard(key)
+            self._changed.add(key)
+            self._pending += 1
+            self._evict(keep=key)
+            if self._pending >= self.batch:
+                self._save()
+        return sha
+
+    def _evict(self, keep=None):
+        """Removes the least recently used files until the store is smaller
+        than :attr:`maxsize`.
+
+        Args:
+            keep (str): key of a file that is never evicted, so that a file
+              that was just added can be read even when it is larger than
+              :attr:`maxsize` by itself.
+        """
+        if self.maxsize is None:
+            return
+
+        while self._total > self.maxsize:
+            key = next((k for k in self.index if k != keep), None)
+            if key is None:
+                break
+            self._remove(key)
+
+    def _locked(self):
+        """Returns a context manager that holds an exclusive lock on the index
+        file between processes, where the platform supports it.
+        """
+        from contextlib import contextmanager
+        from os import path
+
+        @contextmanager
+        def locked():
+            try:
+                import fcntl
+            except ImportError:# pragma: no cover
+                yield
+                return
+            with open(path.join(self.folder, "index.lock"), 'a') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+        return locked()
+
+    def _save(self):
+        """Merges the changes since the last save with the index on disk
+        (which other processes may have changed) and writes the result.
+        """
+        import json
+        from aflow.cache import _write
+        with self._locked():
+            merged = self._load()
+            for key in self._removed:
+                merged.pop(key, None)
+            for key, item in self.index.items():
+                #Files that are neither new here nor on disk anymore were
+                #evicted by another process.
+                if key in self._changed or (key in merged and
+                                            item["time"] >= merged[key]["time"]):
+                    merged[key] = item
+
+            self._reindex(merged)
+            self._evict()
+            contents = json.dumps(self.index).encode("utf-8")
+            _write(self._index, lambda f: f.write(contents))
+            self._changed, self._removed = set(), set()
+            self._pending = 0
+
+    def flush(self):
+        """Writes the index (including the access times of the files that
+        were read since the last change) to disk, and picks up the files that
+        other processes added to the store in the meantime.
+        """
+        with self._lock:
+            self._save()
+
+files = None
+""":class:`FileStore`: store that :class:`~aflow.entries.AflowFile` and
+:meth:`~aflow.entries.Entry.atoms` consult before downloading files; `None` if
+it isn't enabled.
+"""
+
+def set_store(folder, maxsize=None, compress=False):
+    """Enables the local file store in the specified folder.
+
+    Args:
+        folder (str): root folder of the store. `None` disables the store.
+        maxsize (int): maximum number of bytes to keep on disk.
+        compress (bool): when True, files are gzip-compressed on disk.
+    """
+    global files
+    if files is not None:
+        files.flush()
+    files = FileStore(folder, maxsize, compress) if folder is not None else None
+
+def _flush():
+    """Writes the index of the enabled store when the interpreter exits.
+    """
+    if files is not None:
+        files.flush()
+
+atexit.register(_flush)
+
+def get(aurl, filename):
+    """Returns the contents of a file from the local store, or `None` if the
+    store isn't enabled or doesn't have the file.
+    """
+    if files is None:
+        return None
+    return files.get(aurl, filename)
+
+def put(aurl, filename, contents):
+    """Adds a file to the local store, if it is enabled.
+    """
+    if files is not None:
+        files.put(aurl, filename, contents)
@@ -0,0 +1,362 @@
+"""Functions for constructing atomic structures directly from the values
+of AFLOW keywords (like `geometry` and `positions_fractional`), so that no
+structure files have to be downloaded.
+"""
+import numpy as np
+
+def lattice(geometry):
+    """Returns the lattice vectors for the specified lattice parameters. The
+    first vector is along *x* and the second lies in the *xy* plane (the same
+    convention as :func:`ase.geometry.cellpar_to_cell`). This is not
+    necessarily the orientation of the lattice vectors that AFLOW used for
+    the calculation.
+
+    Args:
+        geometry (numpy.ndarray): value of the `geometry` keyword, `[a, b, c,
+          alpha, beta, gamma]` with lengths in Angstrom and angles in
+          degrees. An array of shape `(N, 6)` is also supported.
+
+    Returns:
+        numpy.ndarray: with shape `(3, 3)` (or `(N, 3, 3)`) where each *row* is
+        a lattice vector.
+    """
+    geometry = np.asarray(geometry, dtype=np.float64)
+    a, b, c = geometry[..., 0], geometry[..., 1], geometry[..., 2]
+    angles = geometry[..., 3:6]
+    #Make sure that right angles give exact zeros in the lattice vectors.
+    cosines = np.where(angles == 90., 0., np.cos(np.radians(angles)))
+    cos_a, cos_b, cos_g = cosines[..., 0], cosines[..., 1], cosines[..., 2]
+    sin_g = np.where(angles[..., 2] == 90., 1.,
+                     np.sin(np.radians(angles[..., 2])))
+
+    cy = (cos_a - cos_b*cos_g)/sin_g
+    cz = np.sqrt(np.maximum(1. - cos_b**2 - cy**2, 0.))
+    zeros = np.zeros_like(a)
+
+    result = np.empty(geometry.shape[:-1] + (3, 3))
+    result[..., 0, :] = np.stack([a, zeros, zeros], axis=-1)
+    result[..., 1, :] = np.stack([b*cos_g, b*sin_g, zeros], axis=-1)
+    result[..., 2, :] = np.stack([c*cos_b, c*cy, c*cz], axis=-1)
+    return result
+
+def counts(attributes):
+    """Returns the number of atoms of each species for an entry.
+
+    Args:
+        attributes (dict): cast keyword values of the entry.
+
+    Returns:
+        list: of `int` counts in the same order as the `species` keyword, or
+        `None` if neither `composition` nor `stoichiometry` and `natoms` are
+        available.
+    """
+    if attributes.get("composition") is not None:
+        return [int(n) for n in attributes["composition"]]
+
+    stoich = attributes.get("stoichiometry")
+    natoms = attributes.get("natoms")
+    if stoich is not None and natoms is not None:
+        return [int(round(x*natoms)) for x in stoich]
+
+def symbols(attributes):
+    """Returns the chemical symbol of every atom in an entry.
+
+    Args:
+        attributes (dict): cast keyword values of the entry.
+
+    Returns:
+        list: of `str` symbols, or `None` if the species or their counts are
+        not available.
+    """
+    species = attributes.get("species")
+    ncounts = counts(attributes)
+    if species is None or ncounts is None or len(species) != len(ncounts):
+        return None
+
+    result = []
+    for element, n in zip(species, ncounts):
+        result.extend([element.strip()]*n)
+    return result
+
+oriented = ["forces", "positions_cartesian", "stress_tensor"]
+"""list: of keywords whose values are cartesian vectors or tensors in the
+frame of the AFLOW lattice vectors. They don't match the rotated lattice that
+:func:`from_keywords` reconstructs.
+"""
+
+def from_keywords(attributes):
+    """Constructs the relaxed structure of an entry from its keyword values.
+
+    .. note:: The `geometry` keyword only fixes the lattice up to a rotation,
+      so `positions_fractional` is required; cartesian positions can't be
+      combined with the lattice reconstructed from `geometry`. The lattice
+      vectors follow the orientation of :func:`lattice`, which generally
+      differs from the one in the AFLOW structure files, so cartesian
+      keywords (see :data:`oriented`) don't apply to it.
+
+    Args:
+        attributes (dict): cast keyword values of the entry; needs `geometry`,
+          `positions_fractional`, `species` and either `composition` or
+          `stoichiometry` with `natoms`.
+
+    Returns:
+        tuple: `(lattice, positions, symbols)` where `lattice` is a `(3, 3)`
+        array of row vectors, `positions` is the `(natoms, 3)` array of
+        fractional coordinates and `symbols` is a `list` of the chemical
+        symbols for each atom. `None` is returned if any of the required
+        keywords are missing.
+    """
+    geometry = attributes.get("geometry")
+    positions = attributes.get("positions_fractional")
+    if geometry is None or positions is None or len(geometry) != 6:
+        return None
+
+    elements = symbols(attributes)
+    if elements is None or len(elements) != len(positions):
+        return None
+
+    return lattice(geometry), np.asarray(positions), elements
+
+def to_atoms(cell, positions, elements, scaled=True):
+    """Creates a :class:`ase.atoms.Atoms` object for a periodic structure.
+
+    Args:
+        cell (numpy.ndarray): `(3, 3)` array of lattice row vectors.
+        positions (numpy.ndarray): `(natoms, 3)` array of atomic positions.
+        elements (list): of `str` chemical symbols for each atom.
+        scaled (bool): when True, `positions` are fractional coordinates;
+          otherwise they are cartesian.
+    """
+    from ase.atoms import Atoms
+    if scaled:
+        return Atoms(elements, scaled_positions=positions, cell=cell,
+                     pbc=True)
+    else:
+        return Atoms(elements, positions=positions, cell=cell, pbc=True)
+
+class PackedStructures(object):
+    """Represents the structures of many entries as a few contiguous arrays
+    (in the style of a CSR sparse matrix) instead of one python object per
+    structure. The arrays can be saved to disk and memory-mapped, or shared
+    between processes without copies.
+
+    Args:
+        positions (numpy.ndarray): `(total_atoms, 3)` array with the positions
+          of the atoms in *all* the structures.
+        offsets (numpy.ndarray): `(N+1,)` array; the atoms of structure `i` are
+          `positions[offsets[i]:offsets[i+1]]`.
+        lattices (numpy.ndarray): `(N, 3, 3)` array of lattice row vectors.
+        species (numpy.ndarray): `(total_atoms,)` array of integer codes into
+          `elements`.
+        elements (list): of `str` chemical symbols for the species codes.
+        valid (numpy.ndarray): `(N,)` boolean array; False for entries whose
+          structure could not be constructed (they have no atoms).
+        scaled (bool): when True, `positions` are fractional coordinates;
+          otherwise they are cartesian.
+    """
+    arrays = ["positions", "offsets", "lattices", "species", "valid"]
+    """list: of the names of the array attributes saved by :meth:`save`.
+    """
+
+    def __init__(self, positions, offsets, lattices, species, elements,
+                 valid, scaled=True):
+        self.positions = positions
+        self.offsets = offsets
+        self.lattices = lattices
+        self.species = species
+        self.elements = elements
+        self.valid = valid
+        self.scaled = scaled
+
+    def __repr__(self):
+        return "PackedStructures({0:d} structures, {1:d} atoms)".format(
+            len(self), len(self.positions))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        """Returns the `(lattice, positions, symbols)` tuple of a single
+        structure.
+        """
+        start, end = self.offsets[i], self.offsets[i+1]
+        elements = [self.elements[c] for c in self.species[start:end]]
+        return self.lattices[i], self.positions[start:end], elements
+
+    def atoms(self, i):
+        """Returns the :class:`ase.atoms.Atoms` object for a single structure.
+        """
+        return to_atoms(*self[i], scaled=self.scaled)
+
+    def save(self, folder):
+        """Saves the arrays as `.npy` files in the specified folder so that
+        they can be memory-mapped by :meth:`load`.
+
+        Args:
+            folder (str): path to the folder; it is created if it doesn't
+              exist.
+        """
+        import json
+        from os import path, makedirs
+        folder = path.abspath(path.expanduser(folder))
+        if not path.isdir(folder):
+            makedirs(folder)
+
+        for name in self.arrays:
+            np.save(path.join(folder, name + ".npy"), getattr(self, name))
+        with open(path.join(folder, "elements.json"), 'w') as f:
+            json.dump({"elements": self.elements, "scaled": self.scaled}, f)
+        return folder
+
+    @classmethod
+    def load(cls, folder, mmap_mode='r'):
+        """Loads structures saved with :meth:`save`.
+
+        Args:
+            folder (str): path to the folder with the saved arrays.
+            mmap_mode (str): passed to :func:`numpy.load`; the default maps the
+              arrays read-only instead of reading them into memory.
+        """
+        import json
+        from os import path
+        folder = path.abspath(path.expanduser(folder))
+        arrays = {name: np.load(path.join(folder, name + ".npy"),
+                                mmap_mode=mmap_mode)
+                  for name in cls.arrays}
+        with open(path.join(folder, "elements.json")) as f:
+            meta = json.load(f)
+        return cls(elements=meta["elements"], scaled=meta["scaled"], **arrays)
+
+def pack(entries, scaled=True, dtypes=None):
+    """Packs the structures of many entries into contiguous arrays. The
+    structures are constructed from the keyword values of each entry (see
+    :func:`from_keywords`), so the query should select `geometry`,
+    `positions_fractional`, `species` and `composition`.
+
+    Args:
+        entries: iterable of :class:`aflow.entries.Entry`, for example a
+          :class:`aflow.control.Query`.
+        scaled (bool): when True, store fractional coordinates; otherwise,
+          cartesian positions are computed from the lattice.
+        dtypes (aflow.caster.DtypePolicy): dtype policy for the floating point
+          arrays; if `None`, the global policy in :data:`aflow.caster.dtypes`
+          is used.
+
+    Returns:
+        PackedStructures: with one structure per entry.
+    """
+    from aflow import caster
+    policy = dtypes if dtypes is not None else caster.dtypes
+
+    lattices, positions, elements, valid = [], [], [], []
+    for entry in entries:
+        structure = from_keywords(entry.attributes)
+        valid.append(structure is not None)
+        if structure is None:
+            lattices.append(np.zeros((3, 3)))
+            positions.append(np.zeros((0, 3)))
+            elements.append([])
+            continue
+
+        cell, fractional, symbols = structure
+        lattices.append(cell)
+        positions.append(fractional if scaled else np.dot(fractional, cell))
+        elements.append(symbols)
+
+    from aflow.columns import Categorical
+    species = Categorical.from_values(elements)
+    #The offsets are computed from the positions so that they are also valid
+    #when there are no structures at all.
+    offsets = np.cumsum([0] + [len(p) for p in positions], dtype=np.int64)
+
+    ftype = np.float64
+    if policy is not None and policy.float is not None:
+        ftype = policy.float
+    positions = (np.concatenate(positions).astype(ftype, copy=False)
+                 if len(positions) > 0 else np.zeros((0, 3), dtype=ftype))
+    lattices = (np.array(lattices, dtype=ftype) if len(lattices) > 0
+                else np.zeros((0, 3, 3), dtype=ftype))
+    return PackedStructures(positions, offsets, lattices, species.codes,
+                            species.categories, np.array(valid, dtype=bool),
+                            scaled)
+
+def _coordinates(lines, natoms):
+    """Parses the first three columns of the coordinate lines of a VASP
+    structure file into an `(natoms, 3)` array.
+    """
+    #The fast path only works if every line has exactly three numbers; with
+    #selective dynamics flags or trailing symbols, split the columns first.
+    try:
+        values = np.fromstring(' '.join(lines[:natoms]), dtype=np.float64,
+                               sep=' ')
+    except ValueError:
+        values = None
+    if values is None or values.size != 3*natoms:
+        values = np.array([l.split()[:3] for l in lines[:natoms]],
+                          dtype=np.float64)
+    return values.reshape(natoms, 3)
+
+def read_poscar(text, species=None):
+    """Reads the contents of a VASP `POSCAR` or `CONTCAR` file straight into
+    :mod:`numpy` arrays, without importing ASE.
+
+    Args:
+        text (str): contents of the structure file.
+        species (list): of `str` chemical symbols for each species in the
+          file. Required for VASP 4 files (like those in AFLOW) that don't have
+          a line with the symbols; ignored otherwise.
+
+    Returns:
+        tuple: `(lattice, positions, symbols)` where `lattice` is a `(3, 3)`
+        array of row vectors, `positions` is the `(natoms, 3)` array of
+        *fractional* coordinates and `symbols` is a `list` of the chemical
+        symbols for each atom.
+
+    Raises:
+        ValueError: if the file is malformed or the species are unknown.
+    """
+    lines = text.strip('\n').split('\n')
+    if len(lines) < 8:
+        raise ValueError("Structure file is too short.")
+
+    scale = np.array(lines[1].split(), dtype=np.float64)
+    cell = np.array([l.split()[:3] for l in lines[2:5]], dtype=np.float64)
+    if len(scale) == 1 and scale[0] < 0:
+        #A negative scaling factor is the volume of the cell.
+        scale = (-scale[0]/abs(np.linalg.det(cell)))**(1./3)
+    cell *= scale
+
+    def line(i, what):
+        if i >= len(lines) or len(lines[i].strip()) == 0:
+            raise ValueError("Expected the {0} on line {1:d} of the structure "
+                             "file.".format(what, i + 1))
+        return lines[i].strip()
+
+    tokens = line(5, "species or counts").split()
+    if tokens[0].isdigit():
+        symbols = [s.strip() for s in species] if species else None
+        icounts = 5
+    else:
+        symbols = tokens
+        icounts = 6
+    counts = [int(n) for n in line(icounts, "counts").split()]
+    if symbols is None or len(symbols) < len(counts):
+        raise ValueError("Species are needed for each of {} counts."
+                         .format(len(counts)))
+
+    icoords = icounts + 1
+    if line(icoords, "coordinate mode")[0] in "sS":
+        icoords += 1
+    cartesian = line(icoords, "coordinate mode")[0] in "cCkK"
+    natoms = sum(counts)
+    if len(lines) < icoords + 1 + natoms:
+        raise ValueError("Expected {} atomic positions.".format(natoms))
+
+    positions = _coordinates(lines[icoords+1:], natoms)
+    if cartesian:
+        positions = np.linalg.solve(cell.T, (positions*scale).T).T
+
+    elements = []
+    for element, n in zip(symbols, counts):
+        elements.extend([element]*n)
+    return cell, positions, elements
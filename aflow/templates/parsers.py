@@ -0,0 +1,31 @@
+"""Specialized parsers for the values of each AFLUX keyword. Each parser
+takes the raw `value` string (and the number of atoms in the cell, for
+per-atom vectors) and returns the cast python value; malformed values raise
+:class:`ValueError`. Use :func:`aflow.caster.parse` to apply them.
+
+.. warning:: This module is generated from the AFLUX schema by
+  :func:`aflow.generators.keywords`; don't edit it by hand.
+"""
+from six.moves import intern
+from aflow.caster import (_strings, _interned, _integer, _vector, _fixed,
+                          _forces, _kpoints, _stoich, _ldau_TLUJ)
+{% for keyword, source in parsers.items() %}
+def parse_{{keyword}}(value, natoms=None):
+    return {{source}}
+{% endfor %}
+parsers = {
+{%- for keyword in parsers %}
+    "{{keyword}}": parse_{{keyword}},
+{%- endfor %}
+}
+"""dict: keys are keyword names; values are their parser functions.
+"""
+
+sources = {
+{%- for keyword, source in parsers.items() %}
+    "{{keyword}}": {{source|repr}},
+{%- endfor %}
+}
+"""dict: keys are keyword names; values are the python expressions that their
+parsers evaluate.
+"""
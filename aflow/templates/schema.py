@@ -0,0 +1,43 @@
+"""Table of the keywords supported by AFLUX.
+
+.. warning:: This module is generated from the AFLUX schema by
+  :func:`aflow.generators.keywords`; don't edit it by hand. The documentation
+  for each keyword is in `schema.json` and is only loaded when needed.
+"""
+version = {{version}}
+"""int: version of the local schema snapshot that this module was generated
+from.
+"""
+
+keywords = {
+{%- for keyword, metadata in keywords.items() %}
+    "{{keyword}}": ({{metadata.type|repr}}, {{metadata.ptype|repr}}, {{metadata.units|repr}}),
+{%- endfor %}
+}
+"""dict: keys are keyword names; values are `(atype, ptype, units)` with the
+name of the AFLOW type, the name of the python type that values are cast to and
+the units of the values.
+"""
+
+casters = {
+{%- for keyword, caster in casters.items() %}
+    "{{keyword}}": {{caster|repr}},
+{%- endfor %}
+}
+"""dict: keys are keyword names; values are the names of the casting rules in
+:func:`aflow.caster.cast` that apply to their values.
+"""
+
+columns = {
+{%- for keyword, column in columns.items() %}
+    "{{keyword}}": {{column|repr}},
+{%- endfor %}
+}
+"""dict: keys are keyword names; values are the typed column definitions
+`(dtype, shape, nullable)`. `dtype` is the name of the :mod:`numpy` type of the
+values (`object` for strings and dictionaries); `shape` is the shape of a
+single value: `()` for scalars, `None` for a dimension whose size varies
+between entries (e.g. `(None, 3)` for per-atom vectors) or `None` for values
+that aren't arrays. `nullable` is False for keywords that AFLUX lists as
+mandatory.
+"""
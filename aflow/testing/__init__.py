@@ -0,0 +1,3 @@
+"""Tools for testing and benchmarking code that uses the AFLOW API without
+access to the AFLOW servers.
+"""
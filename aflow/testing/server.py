@@ -0,0 +1,573 @@
+"""Local stand-in for the AFLUX API and the AFLOW file servers. It serves the
+paging protocol used by :class:`~aflow.control.Query`, the per-entry keyword
+requests of :class:`~aflow.entries.Entry` and file downloads from a dataset of
+configurable size, with injectable latency, bandwidth caps and error rates.
+Run it with::
+
+    python -m aflow.testing.server --pages tests/data0.json tests/data1.json \\
+        --size 100000 --latency 0.05 --errors 0.01
+
+(or with `--synthetic` instead of `--pages` to serve the entries of
+:class:`aflow.testing.synthetic.Synthetic`)
+and point `aflow` at it with :func:`use`. In tests, :class:`Emulator` can be
+used as a context manager instead.
+
+.. note:: Filters are evaluated for the operators that
+  :class:`~aflow.keywords.Keyword` generates (comparisons, substrings,
+  negation, `,` for and and `:` for or); the first keyword in the matchbook
+  orders the results, as on the real server.
+"""
+from __future__ import print_function
+import re
+import threading
+from collections import OrderedDict
+from six import string_types
+from six.moves import BaseHTTPServer, socketserver, range
+
+api = "/search/API/"
+"""str: path of the AFLUX API on the server.
+"""
+
+defaults = ["aurl", "auid", "compound"]
+"""list: of keywords that are included in every entry of a page, like AFLUX
+does.
+"""
+
+class Recorded(object):
+    """Dataset built from recorded AFLUX pages (like `tests/data0.json`). The
+    recorded entries are repeated to reach the requested size; the copies get
+    unique `auid` and `aurl` values.
+
+    .. note:: Any object with the same methods (`__len__`, `__getitem__`,
+      :meth:`find`, :meth:`file` and :meth:`listing`) can be served by
+      :class:`Emulator`. Entries are identified by the path of their `aurl`
+      (without the host), since that is all the requests contain.
+
+    Args:
+        pages (list): of `str` paths to JSON files with recorded pages, or of
+          the pages themselves as `dict`.
+        size (int): number of entries in the dataset; defaults to the number
+          of recorded entries.
+        files (str): folder with the files of the entries, laid out like the
+          paths in their `aurl` (e.g. `AFLOWDATA/ICSD_WEB/FCC/.../CONTCAR`);
+          copies share the files of their original entry.
+
+    Attributes:
+        raws (list): of recorded raw entry dictionaries, in page order.
+        size (int): number of entries in the dataset.
+        folder (str): folder with the files of the entries.
+    """
+    def __init__(self, pages, size=None, files=None):
+        import json
+        self.raws = []
+        for page in pages:
+            if isinstance(page, string_types):
+                with open(page) as f:
+                    page = json.load(f)
+            keys = sorted(page, key=lambda k: int(k.split()[0]))
+            self.raws.extend(page[k] for k in keys)
+
+        self.size = len(self.raws) if size is None else size
+        self.folder = files
+        self._index = dict((r["aurl"].split(':', 1)[1], i)
+                           for i, r in enumerate(self.raws))
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError("Entry {0:d} is out of range.".format(i))
+
+        copy, j = divmod(i, len(self.raws))
+        raw = self.raws[j]
+        if copy == 0:
+            return raw
+
+        result = dict(raw)
+        result["aurl"] = "{0}_x{1:d}".format(raw["aurl"], copy)
+        if "auid" in raw:
+            auid = int(raw["auid"].split(':')[1], 16)
+            auid = (auid + copy*0x9E3779B97F4A7C15) % (1 << 64)
+            result["auid"] = "aflow:{0:016x}".format(auid)
+        return result
+
+    def find(self, path):
+        """Returns the index of the entry with the specified `aurl` path (e.g.
+        `AFLOWDATA/ICSD_WEB/FCC/Be1O1_ICSD_163467`), or `None` if it isn't in
+        the dataset.
+        """
+        match = re.match(r"^(.*)_x(\d+)$", path)
+        base, copy = (match.group(1), int(match.group(2))) if match else (path, 0)
+        if base not in self._index:
+            return None
+        index = copy*len(self.raws) + self._index[base]
+        return index if index < self.size else None
+
+    def _path(self, entry, filename=''):
+        from os import path
+        if self.folder is None:
+            return None
+        index = self.find(entry)
+        if index is None:
+            return None
+        base = self.raws[index % len(self.raws)]["aurl"]
+        return path.join(self.folder, base.split(':', 1)[1], filename)
+
+    def file(self, path, filename):
+        """Returns the contents of a file of the entry with the specified
+        `aurl` path, or `None` if it doesn't exist.
+        """
+        from os import path as ospath
+        target = self._path(path, filename)
+        if target is None or not ospath.isfile(target):
+            return None
+        with open(target, 'rb') as f:
+            return f.read()
+
+    def listing(self, path):
+        """Returns the names of the files of the entry with the specified
+        `aurl` path.
+        """
+        from os import listdir
+        from os import path as ospath
+        folder = self._path(path)
+        if folder is None or not ospath.isdir(folder):
+            return []
+        return sorted(n for n in listdir(folder)
+                      if ospath.isfile(ospath.join(folder, n)))
+
+def _split(text, sep):
+    """Splits the text at the separators that aren't inside parentheses or
+    quotes.
+    """
+    parts, depth, quoted, start = [], 0, False, 0
+    for i, c in enumerate(text):
+        if c == "'":
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+        elif c == sep and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+def _wrapped(text):
+    """Returns True if the whole text is enclosed in a single pair of
+    parentheses.
+    """
+    if not (text.startswith('(') and text.endswith(')')):
+        return False
+    depth = 0
+    for i, c in enumerate(text):
+        depth += 1 if c == '(' else (-1 if c == ')' else 0)
+        if depth == 0 and i < len(text) - 1:
+            return False
+    return True
+
+def _compare(value, operand, kind):
+    """Compares a single raw value with the operand of a filter.
+
+    Args:
+        kind (str): one of `eq`, `ge`, `le` or `in` (substring).
+    """
+    if operand.startswith("'"):
+        operand = operand.strip("'")
+    else:
+        try:
+            value, operand = float(value), float(operand)
+        except ValueError:
+            return False
+
+    if kind == "in":
+        return operand in value
+    elif kind == "ge":
+        return value >= operand
+    elif kind == "le":
+        return value <= operand
+    return value == operand
+
+def _match(expr, value):
+    """Evaluates the expression inside the parentheses of a keyword filter
+    (e.g. `6*` or `!'Si'`) for the raw value of that keyword.
+    """
+    if len(_split(expr, ':')) > 1:
+        return any(_match(p, value) for p in _split(expr, ':'))
+    if len(_split(expr, ',')) > 1:
+        return all(_match(p, value) for p in _split(expr, ','))
+    if _wrapped(expr):
+        return _match(expr[1:-1], value)
+    if expr.startswith('!'):
+        return not _match(expr[1:], value)
+    if value is None:
+        return False
+
+    if expr.startswith('*') and expr.endswith('*') and len(expr) > 1:
+        kind, operand = "in", expr[1:-1]
+    elif expr.startswith('*'):
+        kind, operand = "le", expr[1:]
+    elif expr.endswith('*'):
+        kind, operand = "ge", expr[:-1]
+    else:
+        kind, operand = "eq", expr
+    #List-valued keywords match if any of their values does.
+    values = value.split(',') if kind != "in" else [value]
+    return any(_compare(v, operand, kind) for v in values)
+
+def _evaluate(item, raw):
+    """Evaluates a filter item of the matchbook (e.g. `Egap(6*)` or
+    `Egap(6*):species('Si')`) for a raw entry.
+    """
+    if len(_split(item, ':')) > 1:
+        return any(_evaluate(p, raw) for p in _split(item, ':'))
+    if len(_split(item, ',')) > 1:
+        return all(_evaluate(p, raw) for p in _split(item, ','))
+    if _wrapped(item):
+        return _evaluate(item[1:-1], raw)
+    if item.startswith('!'):
+        return not _evaluate(item[1:], raw)
+
+    name, expr = item.split('(', 1)
+    return _match(expr[:-1], raw.get(name))
+
+_rx_paging = re.compile(r"^paging\((-?\d+)(?:,(\d+))?\)$")
+_rx_name = re.compile(r"^\$?\w+$")
+
+class Emulator(object):
+    """Serves a dataset over HTTP like the AFLUX API and the AFLOW file
+    servers do.
+
+    Args:
+        dataset: entries to serve, e.g. :class:`Recorded` or
+          :class:`aflow.testing.synthetic.Synthetic`.
+        host (str): address to listen on.
+        port (int): port to listen on; 0 picks a free one.
+        latency (float): seconds to wait before answering each request.
+        jitter (float): maximum number of seconds to add to the latency at
+          random.
+        bandwidth (float): maximum number of bytes per second for each
+          response; `None` for no limit.
+        errors (float): fraction of the requests (between 0 and 1) that fail
+          with a server error.
+        seed (int): seed for the random jitter and errors.
+
+    Attributes:
+        requests (dict): keys are request kinds (`page`, `lazy`, `file`);
+          values are the number of requests of that kind so far. Failed
+          requests are also counted under `error`.
+
+    Examples:
+        Iterate over a query against 1000 copies of the recorded entries.
+
+        >>> from aflow.testing.server import Emulator, Recorded
+        >>> dataset = Recorded(["tests/data0.json"], size=1000)
+        >>> with Emulator(dataset, latency=0.01):
+        ...     entries = list(aflow.search(batch_size=100))
+    """
+    def __init__(self, dataset, host="127.0.0.1", port=0, latency=0.,
+                 jitter=0., bandwidth=None, errors=0., seed=None):
+        import random
+        self.dataset = dataset
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.errors = errors
+        self.requests = dict(page=0, lazy=0, file=0, error=0)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._matches = OrderedDict()
+        self._server = None
+        self._thread = None
+        self._previous = None
+
+    @property
+    def url(self):
+        """str: base URL of the running server.
+        """
+        return "http://{0}:{1:d}".format(self.host, self.port)
+
+    def start(self):
+        """Starts serving requests in a background thread.
+        """
+        self._server = _Server((self.host, self.port), _Handler)
+        self._server.emulator = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the server.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        from aflow import control, transport
+        if self._server is None:
+            self.start()
+        self._previous = control.server, transport.server
+        use(self.url)
+        return self
+
+    def __exit__(self, *args):
+        from aflow import control, transport
+        control.server = self._previous[0]
+        transport.set_server(self._previous[1])
+        self.stop()
+
+    def _delay(self):
+        """Returns the number of seconds to wait before answering a request,
+        and whether the request should fail.
+        """
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter) if self.jitter else 0
+            failed = self.errors > 0 and self._random.random() < self.errors
+        return self.latency + jitter, failed
+
+    def _indices(self, filters, order, reverse):
+        """Returns the indices of the entries that match the filters, sorted by
+        the `order` keyword. Recent results are memoized so that paging over
+        a query only scans the dataset once.
+        """
+        key = (tuple(filters), order, reverse)
+        with self._lock:
+            if key in self._matches:
+                return self._matches[key]
+
+        if len(filters) == 0 and order is None:
+            N = len(self.dataset)
+            indices = range(N - 1, -1, -1) if reverse else range(N)
+        else:
+            indices = [i for i in range(len(self.dataset))
+                       if all(_evaluate(f, self.dataset[i]) for f in filters)]
+            if order is not None:
+                def sortkey(i):
+                    value = self.dataset[i].get(order)
+                    try:
+                        return (0, float(value), '')
+                    except (TypeError, ValueError):
+                        return (0 if value is not None else 1, 0., str(value))
+                indices.sort(key=sortkey, reverse=reverse)
+
+        with self._lock:
+            self._matches[key] = indices
+            while len(self._matches) > 16:
+                self._matches.popitem(last=False)
+        return indices
+
+    def page(self, query):
+        """Answers an AFLUX query (the part of the URL after `?`).
+
+        Returns:
+            dict: page of entries keyed by `i of N`, or `None` if no entries
+            match.
+        """
+        n, k = 1, 64
+        selects, excludes, filters, order = [], [], [], None
+        for item in _split(query, ','):
+            paging = _rx_paging.match(item)
+            if paging:
+                n, k = int(paging.group(1)), int(paging.group(2) or k)
+                continue
+            elif item.startswith("catalog(") or item == '':
+                continue
+
+            if _rx_name.match(item):
+                name = item.lstrip('$')
+                (excludes if item[0] == '$' else selects).append(name)
+            else:
+                filters.append(item)
+                name = re.match(r"^[(!]*(\w+)", item).group(1)
+                selects.extend(re.findall(r"(\w+)\(", item))
+            if order is None:
+                order = name
+
+        indices = self._indices(filters, order, n < 0)
+        N = len(indices)
+        start = k*(abs(n) - 1)
+        if N == 0 or start >= N:
+            return None
+
+        keys = [kw for kw in defaults + selects if kw not in excludes]
+        page = OrderedDict()
+        for index in range(start, min(start + k, N)):
+            raw = self.dataset[indices[index]]
+            entry = OrderedDict((kw, raw[kw]) for kw in keys if kw in raw)
+            page["{0:d} of {1:d}".format(index + 1, N)] = entry
+        return page
+
+    def value(self, path, keyword):
+        """Returns the raw value of a keyword for a single entry, as served by
+        the AFLOW URL of the entry.
+
+        Args:
+            path (str): path of the `aurl` of the entry (without the host).
+            keyword (str): name of the keyword.
+
+        Returns:
+            str: the value; empty if the entry doesn't have the keyword, or
+            `None` if the entry doesn't exist.
+        """
+        index = self.dataset.find(path)
+        if index is None:
+            return None
+        raw = self.dataset[index]
+        if keyword == "files" and "files" not in raw:
+            return ','.join(self.dataset.listing(path))
+        return raw.get(keyword, '')
+
+def use(base):
+    """Sends all the requests of `aflow` (queries, lazily loaded keywords and
+    files) to the specified server, e.g. a running :class:`Emulator`.
+
+    Args:
+        base (str): base URL of the server, e.g. `http://localhost:8000`.
+    """
+    from aflow import control, transport
+    control.server = "{0}{1}?".format(base.rstrip('/'), api)
+    transport.set_server(base)
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Answers the requests for an :class:`Emulator`.
+    """
+    protocol_version = "HTTP/1.0"
+
+    def do_GET(self):
+        import json
+        import time
+        from six.moves.urllib.parse import unquote
+        emulator = self.server.emulator
+        path, _, query = self.path.partition('?')
+        path, query = unquote(path), unquote(query)
+        if path.rstrip('/') == api.rstrip('/'):
+            kind = "page"
+        else:
+            kind = "lazy" if query else "file"
+
+        delay, failed = emulator._delay()
+        with emulator._lock:
+            emulator.requests[kind] += 1
+            if failed:
+                emulator.requests["error"] += 1
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            self.send_error(503, "Injected error")
+            return
+
+        if kind == "page":
+            page = emulator.page(query)
+            body = json.dumps(page if page is not None else []).encode("utf-8")
+            self._send(body, "application/json")
+        elif kind == "lazy":
+            #Requests only contain the path of the AFLOW URL; the host is
+            #replaced by the address of the emulator.
+            value = emulator.value(path.strip('/'), query)
+            if value is None:
+                self.send_error(404)
+                return
+            self._send(value.encode("utf-8"), "text/plain")
+        else:
+            folder, _, filename = path.lstrip('/').rpartition('/')
+            contents = emulator.dataset.file(folder, filename)
+            if contents is None:
+                self.send_error(404)
+                return
+            self._send(contents, "application/octet-stream")
+
+    def _send(self, body, content_type):
+        """Sends the body of a response, honoring range requests and the
+        bandwidth cap of the emulator.
+        """
+        import time
+        start = 0
+        if "Range" in self.headers:
+            start = int(self.headers["Range"].split('=')[1].split('-')[0])
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header("Content-Range",
+                                 "bytes */{0:d}".format(len(body)))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+
+        bandwidth = self.server.emulator.bandwidth
+        if not bandwidth:
+            self.wfile.write(body[start:])
+            return
+        size = max(int(bandwidth)//10, 1)
+        for i in range(start, len(body), size):
+            chunk = body[i:i + size]
+            self.wfile.write(chunk)
+            time.sleep(len(chunk)/float(bandwidth))
+
+    def log_message(self, *args):
+        pass
+
+if __name__ == '__main__': # pragma: no cover
+    import argparse
+    parser = argparse.ArgumentParser(description="Serves a local stand-in "
+                                     "for the AFLUX API.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=8000,
+                        help="Port to listen on.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--pages", nargs="+",
+                        help="JSON files with recorded AFLUX pages.")
+    source.add_argument("--synthetic", action="store_true",
+                        help="Serve synthetic entries for all keywords.")
+    parser.add_argument("--size", type=int,
+                        help="Number of entries to serve.")
+    parser.add_argument("--files",
+                        help="Folder with the files of the entries.")
+    parser.add_argument("--latency", type=float, default=0.,
+                        help="Seconds to wait before each response.")
+    parser.add_argument("--jitter", type=float, default=0.,
+                        help="Maximum random seconds to add to the latency.")
+    parser.add_argument("--bandwidth", type=float,
+                        help="Maximum bytes per second for each response.")
+    parser.add_argument("--errors", type=float, default=0.,
+                        help="Fraction of the requests that fail.")
+    parser.add_argument("--seed", type=int,
+                        help="Seed for the random jitter and errors.")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        from aflow.testing.synthetic import Synthetic
+        dataset = Synthetic(args.size or 10000, seed=args.seed or 0)
+    else:
+        dataset = Recorded(args.pages, args.size, args.files)
+    emulator = Emulator(dataset, args.host, args.port, args.latency,
+                        args.jitter, args.bandwidth, args.errors, args.seed)
+    emulator.start()
+    print("Serving {0:d} entries at {1}; call "
+          "aflow.testing.server.use({1!r}) to use it.".format(len(dataset),
+                                                              emulator.url))
+    try:
+        emulator._thread.join()
+    except KeyboardInterrupt:
+        emulator.stop()
@@ -0,0 +1,345 @@
+"""Synthetic AFLOW entries for scale tests. Each entry is generated on demand
+from its index (and a seed), so that datasets with millions of entries can be
+scanned or served by :class:`aflow.testing.server.Emulator` without
+materializing them. The raw values have the same formats as those returned by
+AFLUX: numbers, `,`-separated lists, `;`-separated vectors, k-point and DFT+U
+strings, etc.
+
+Examples:
+    Scan a million entries one page at a time.
+
+    >>> from aflow.testing.synthetic import Synthetic, pages
+    >>> dataset = Synthetic(10**6, keywords=["Egap", "species", "forces"])
+    >>> for page in pages(dataset, k=1000):
+    ...     entries = [Entry(**raw) for raw in page.values()]
+"""
+from collections import OrderedDict
+from random import Random
+import numpy as np
+from six.moves import range
+
+elements = ["Ag", "Al", "As", "Au", "B", "Ba", "Be", "Bi", "C", "Ca", "Cd",
+            "Co", "Cr", "Cu", "Fe", "Ga", "Ge", "Hf", "In", "Ir", "K", "La",
+            "Li", "Mg", "Mn", "Mo", "N", "Na", "Nb", "Ni", "O", "Os", "P",
+            "Pb", "Pd", "Pt", "Re", "Rh", "Ru", "S", "Sb", "Sc", "Se", "Si",
+            "Sn", "Sr", "Ta", "Te", "Ti", "Tl", "V", "W", "Y", "Zn", "Zr"]
+"""list: of chemical symbols that synthetic compounds are made of.
+"""
+
+_bravais = ["CUB", "FCC", "BCC", "TET", "BCT", "ORC", "ORCF", "ORCI", "ORCC",
+            "HEX", "RHL", "MCL", "MCLC", "TRI"]
+_systems = ["cubic", "hexagonal", "monoclinic", "orthorhombic",
+            "rhombohedral", "tetragonal", "triclinic"]
+
+pools = {
+    "Egap_type": ["metal", "insulator_direct", "insulator_indirect"],
+    "Bravais_lattice_orig": _bravais,
+    "Bravais_lattice_relax": _bravais,
+    "lattice_system_orig": _systems,
+    "lattice_system_relax": _systems,
+    "catalog": ["ICSD", "LIB1", "LIB2", "LIB3"],
+    "code": ["vasp.4.6.35", "vasp.5.4.4"],
+    "data_api": ["aapi1.0", "aapi1.1"],
+    "data_source": ["aflowlib"],
+    "dft_type": ["PAW_PBE", "PAW_LDA", "US"],
+    "loop": ["thermodynamics", "magnetic", "bands", "scf", "agl", "ael"],
+}
+"""dict: keys are string keywords; values are the realistic values that they
+take. Other string keywords get values like `<keyword>_<n>`.
+"""
+
+ranges = {
+    "Egap": (0., 10.), "Egap_fit": (0., 12.), "energy_atom": (-10., 0.),
+    "energy_cell": (-200., 0.), "enthalpy_atom": (-10., 0.),
+    "enthalpy_cell": (-200., 0.), "enthalpy_formation_atom": (-4., 1.),
+    "enthalpy_formation_cell": (-80., 20.), "density": (0.5, 22.),
+    "pressure": (-5., 5.), "spin_atom": (0., 5.), "spin_cell": (0., 40.),
+    "calculation_cores": (1, 64), "node_CPU_Cores": (1, 64),
+    "spacegroup_orig": (1, 230), "spacegroup_relax": (1, 230),
+    "valence_cell_iupac": (1, 40), "valence_cell_std": (1, 40),
+}
+"""dict: keys are numeric keywords; values are `(low, high)` bounds of their
+values. Other numeric keywords are between 0 and 100.
+"""
+
+peratom = ["bader_atomic_volumes", "bader_net_charges", "spinD"]
+"""list: of `numbers` keywords with one value per atom; the others have one
+value per species.
+"""
+
+files = ["CONTCAR.relax", "aflowlib.json"]
+"""list: of the names of the files that every synthetic entry has.
+"""
+
+def _number(value):
+    return "{0:.6g}".format(value)
+
+def _join(values, sep=','):
+    return sep.join(values)
+
+class Synthetic(object):
+    """Dataset of synthetic AFLOW entries; entry `i` is always the same for
+    the same seed. It can be served by :class:`aflow.testing.server.Emulator`.
+
+    Args:
+        size (int): number of entries in the dataset.
+        seed (int): seed for the random values.
+        keywords (list): of `str` names of the keywords that each entry has
+          (`aurl`, `auid` and `compound` are always included); defaults to all
+          the keywords in :data:`aflow.schema.keywords`.
+        cardinality (dict): keys are keyword names; values are the number of
+          distinct values that the keyword takes across the dataset. For
+          `species`, it is the number of distinct elements. Keywords that
+          aren't listed have continuous (or per-entry) values, except for
+          those in :data:`pools` and :data:`aflow.caster.categorical`, which
+          have at most 16 values.
+        max_atoms (int): maximum number of atoms in a cell.
+        max_species (int): maximum number of species in a compound.
+        missing (float): fraction of the optional keywords (according to the
+          schema) that are left out of each entry.
+
+    Attributes:
+        size (int): number of entries in the dataset.
+        seed (int): seed for the random values.
+        keywords (list): of `str` names of the keywords in each entry.
+    """
+    def __init__(self, size, seed=0, keywords=None, cardinality=None,
+                 max_atoms=8, max_species=3, missing=0.):
+        from aflow.schema import keywords as schema, columns
+        self.size = size
+        self.seed = seed
+        names = sorted(schema) if keywords is None else list(keywords)
+        self.keywords = ["aurl", "auid", "compound"]
+        self.keywords.extend(k for k in names if k not in self.keywords)
+        self.cardinality = dict(cardinality or {})
+        self.max_atoms = max_atoms
+        self.max_species = max_species
+        self.missing = missing
+        self._nullable = set(k for k in self.keywords
+                             if k in columns and columns[k][2])
+        self._nullable -= set(["aurl", "auid", "compound"])
+        self._elements = elements[:self.cardinality.get("species",
+                                                        len(elements))]
+        self._wanted = set(self.keywords)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield self[i]
+
+    def _choice(self, rng, keyword, default=None):
+        """Returns a random string value for a keyword with a limited number
+        of distinct values.
+        """
+        from aflow.caster import categorical
+        n = self.cardinality.get(keyword)
+        pool = pools.get(keyword)
+        if pool is not None:
+            return rng.choice(pool[:n] if n else pool)
+        if n is None and keyword in categorical:
+            n = 16
+        if n is None:
+            return default
+        return "{0}_{1:d}".format(keyword, rng.randrange(n))
+
+    def _scalar(self, rng, keyword, integer):
+        """Returns a random raw value for a numeric keyword.
+        """
+        low, high = ranges.get(keyword, (1, 100) if integer else (0., 100.))
+        n = self.cardinality.get(keyword)
+        if integer:
+            if n:
+                return str(low + rng.randrange(min(n, high - low + 1)))
+            return str(rng.randint(low, high))
+        if n:
+            return _number(low + (high - low)*rng.randrange(n)/float(n))
+        return _number(rng.uniform(low, high))
+
+    def _random(self, i, part):
+        """Returns the random number generator for one part of entry `i`, so
+        that each part is the same whether or not the others are generated.
+        """
+        return Random((self.seed << 42) + (i << 3) + part)
+
+    def _structure(self, i, wanted):
+        """Returns the raw values of the keywords that describe the composition
+        and structure of entry `i`, which have to be consistent with each
+        other. The expensive per-atom values are only generated if they are
+        in `wanted`.
+        """
+        rng = self._random(i, 0)
+        nspecies = rng.randint(1, min(self.max_species, len(self._elements)))
+        species = sorted(rng.sample(self._elements, nspecies))
+        composition = [rng.randint(1, max(1, self.max_atoms//nspecies))
+                       for s in species]
+        natoms = sum(composition)
+        lengths = [rng.uniform(2.5, 8.) for j in range(3)]
+        angles = rng.choice([(90, 90, 90), (60, 60, 60), (90, 90, 120)])
+        spacegroup = str(rng.randint(1, 230))
+
+        values = {
+            "aurl": "aflowlib.duke.edu:AFLOWDATA/SYNTHETIC/{0:09d}".format(i),
+            "auid": "aflow:{0:016x}".format(
+                (i*0x9E3779B97F4A7C15 + self.seed) % (1 << 64)),
+            "compound": ''.join("{0}{1:d}".format(s, c)
+                                for s, c in zip(species, composition)),
+            "species": _join(species),
+            "nspecies": str(nspecies),
+            "natoms": str(natoms),
+            "composition": _join(str(c) for c in composition),
+            "geometry": _join([_number(l) for l in lengths] +
+                              [str(a) for a in angles]),
+            "sg": _join([spacegroup]*3),
+            "sg2": _join([spacegroup]*3),
+            "spacegroup_orig": spacegroup,
+            "spacegroup_relax": spacegroup,
+            "Pearson_symbol_orig": "cF{0:d}".format(natoms),
+            "Pearson_symbol_relax": "cF{0:d}".format(natoms),
+            "files": _join(files),
+        }
+
+        vectors = lambda vs: _join((_join(_number(x) for x in v)
+                                    for v in vs), ';')
+        if "stoichiometry" in wanted or "stoich" in wanted:
+            fractions = [_number(c/float(natoms)) for c in composition]
+            values["stoichiometry"] = _join(fractions)
+            values["stoich"] = _join(fractions, ' ')
+        if "positions_fractional" in wanted or "positions_cartesian" in wanted:
+            prng = self._random(i, 1)
+            fractional = [[prng.random() for j in range(3)]
+                          for a in range(natoms)]
+            values["positions_fractional"] = vectors(fractional)
+            #The cartesian positions are computed from the rounded values so
+            #that they match the keywords as they are parsed.
+            from aflow.structure import lattice
+            geometry = [float(_number(l)) for l in lengths] + list(angles)
+            fractional = [[float(_number(x)) for x in p] for p in fractional]
+            values["positions_cartesian"] = vectors(
+                np.dot(fractional, lattice(geometry)))
+        if "forces" in wanted:
+            frng = self._random(i, 2)
+            values["forces"] = vectors([frng.uniform(-0.1, 0.1)
+                                        for j in range(3)]
+                                       for a in range(natoms))
+        if "stress_tensor" in wanted:
+            srng = self._random(i, 3)
+            values["stress_tensor"] = _join(_number(srng.uniform(-5, 5))
+                                            for j in range(9))
+        if "species_pp" in wanted:
+            srng = self._random(i, 4)
+            values["species_pp"] = _join(s + srng.choice(["", "_pv", "_sv"])
+                                         for s in species)
+        if "kpoints" in wanted:
+            krng = self._random(i, 5)
+            values["kpoints"] = ("{0:d},{0:d},{0:d};{1:d},{1:d},{1:d};"
+                                 "G-X-W-K-G-L-U-W-L-K,U-X;20".format(
+                                     krng.randint(4, 16), krng.randint(8, 24)))
+        if "ldau_TLUJ" in wanted:
+            lrng = self._random(i, 6)
+            values["ldau_TLUJ"] = "2;{0};{1};{2}".format(
+                _join(str(lrng.choice([0, 2])) for s in species),
+                _join(_number(lrng.choice([0, 3, 5])) for s in species),
+                _join('0' for s in species))
+        if "keywords" in wanted:
+            values["keywords"] = _join(self.keywords)
+        return values, nspecies, natoms
+
+    def __getitem__(self, i):
+        from aflow.schema import keywords as schema, casters, columns
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError("Entry {0:d} is out of range.".format(i))
+
+        structure, nspecies, natoms = self._structure(i, self._wanted)
+        rng = self._random(i, 7)
+        raw = OrderedDict()
+        for keyword in self.keywords:
+            if keyword in self._nullable and self.missing > 0:
+                if rng.random() < self.missing:
+                    continue
+
+            caster = casters.get(keyword)
+            dtype = columns[keyword][0] if keyword in columns else None
+            if keyword in structure:
+                raw[keyword] = structure[keyword]
+            elif caster == "number":
+                raw[keyword] = self._scalar(rng, keyword, dtype == "int64")
+            elif caster == "numbers":
+                n = natoms if keyword in peratom else nspecies
+                raw[keyword] = _join(self._scalar(rng, keyword,
+                                                  dtype == "int64")
+                                     for j in range(n))
+            elif caster == "strings":
+                choice = self._choice(rng, keyword)
+                if choice is None:
+                    choice = "{0}_{1:d}".format(keyword, i)
+                raw[keyword] = _join([choice]*nspecies)
+            elif keyword in schema:
+                raw[keyword] = self._choice(rng, keyword,
+                                            "{0}_{1:d}".format(keyword, i))
+        return raw
+
+    def find(self, path):
+        """Returns the index of the entry with the specified `aurl` path, or
+        `None` if it isn't in the dataset.
+        """
+        head, _, index = path.rpartition('/')
+        if head != "AFLOWDATA/SYNTHETIC" or not index.isdigit():
+            return None
+        index = int(index)
+        return index if index < self.size else None
+
+    def file(self, path, filename):
+        """Returns the contents of a file of the entry with the specified
+        `aurl` path: a VASP 4 structure file (`CONTCAR.relax`) or the JSON of
+        the entry (`aflowlib.json`).
+        """
+        import json
+        index = self.find(path)
+        if index is None or filename not in files:
+            return None
+
+        raw = self[index]
+        if filename == "aflowlib.json":
+            return json.dumps(raw).encode("utf-8")
+
+        from aflow.structure import lattice
+        structure, nspecies, natoms = self._structure(
+            index, ["positions_fractional"])
+        geometry = [float(x) for x in structure["geometry"].split(',')]
+        lines = [structure["compound"], "1.0"]
+        lines.extend("{0:.10f} {1:.10f} {2:.10f}".format(*v)
+                     for v in lattice(geometry))
+        lines.append(structure["composition"].replace(',', ' '))
+        lines.append("Direct")
+        lines.extend(p.replace(',', ' ')
+                     for p in structure["positions_fractional"].split(';'))
+        return ('\n'.join(lines) + '\n').encode("utf-8")
+
+    def listing(self, path):
+        """Returns the names of the files of the entry with the specified
+        `aurl` path.
+        """
+        return list(files) if self.find(path) is not None else []
+
+def pages(dataset, k=64, start=0, stop=None):
+    """Yields the entries of a dataset as AFLUX pages (keyed by `i of N`),
+    generating each page only when it is requested.
+
+    Args:
+        dataset: entries to page over, e.g. :class:`Synthetic`.
+        k (int): number of entries per page.
+        start (int): index of the first entry.
+        stop (int): index after the last entry; defaults to the size of the
+          dataset.
+    """
+    N = len(dataset)
+    stop = N if stop is None else min(stop, N)
+    for first in range(start, stop, k):
+        page = OrderedDict()
+        for index in range(first, min(first + k, stop)):
+            page["{0:d} of {1:d}".format(index + 1, N)] = dataset[index]
+        yield page
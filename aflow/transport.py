@@ -0,0 +1,386 @@
+"""Functions for the HTTP requests made against the AFLOW servers. All
+downloads go through this module so that they can be streamed instead of
+being read into memory at once, and so that they can be recorded to an
+archive and replayed from it (see :func:`set_archive`).
+"""
+chunk_size = 1 << 16
+"""int: number of bytes to read at a time from a streaming response.
+"""
+
+decompressors = {
+    ".bz2": lambda: __import__("bz2").BZ2Decompressor(),
+    ".gz": lambda: __import__("zlib").decompressobj(16 + 15),
+    ".xz": lambda: __import__("lzma").LZMADecompressor(),
+}
+"""dict: keys are file extensions of compressed files; values are functions
+that return a new streaming decompressor for that format.
+"""
+
+server = None
+"""str: base URL (e.g. `http://localhost:8000`) of a server that replaces
+the hosts in AFLOW URLs; `None` to request the files from AFLOW itself.
+"""
+
+def set_server(base):
+    """Sends all requests for AFLOW URLs to the specified server instead, for
+    example a local mirror or a test server.
+
+    Args:
+        base (str): base URL of the server; `None` restores the default.
+    """
+    global server
+    server = base.rstrip('/') if base is not None else None
+
+def url(aurl, suffix=''):
+    """Returns the HTTP URL for an AFLOW URL (of the form `host:path`).
+
+    Args:
+        aurl (str): value of the `aurl` keyword for an entry.
+        suffix (str): additional path or query string to append, e.g. a file
+          name (`/CONTCAR.relax`) or keyword request (`?species`).
+    """
+    host, path = aurl.split(':', 1)
+    base = server if server is not None else "http://" + host
+    return "{0}/{1}{2}".format(base, path, suffix)
+
+class Archive(object):
+    """Compressed archive of the responses to HTTP requests, so that runs
+    can be recorded once and replayed without network access. Each response
+    body is a member of a zip file; the URL of the request is stored in the
+    comment of the member.
+
+    Args:
+        path (str): path to the archive file.
+        mode (str): `record` to request URLs that aren't in the archive yet
+          and add their responses to it; `replay` to answer requests only from
+          the archive. URLs that were already recorded are answered from the
+          archive in both modes.
+
+    Attributes:
+        path (str): path to the archive file.
+        mode (str): `record` or `replay`.
+    """
+    def __init__(self, path, mode="replay"):
+        import zipfile
+        from os import path as ospath
+        from threading import Lock
+        if mode not in ("record", "replay"):
+            raise ValueError("Archive mode must be `record` or `replay`.")
+        self.path = ospath.abspath(ospath.expanduser(path))
+        self.mode = mode
+        self._lock = Lock()
+        self._bodies = {}
+        self._zip = None
+        if ospath.isfile(self.path):
+            with zipfile.ZipFile(self.path) as z:
+                #Everything is read at once so that replayed requests are
+                #answered from memory.
+                for info in z.infolist():
+                    self._bodies[info.comment.decode("utf-8")] = z.read(info)
+        if mode == "record":
+            self._zip = zipfile.ZipFile(self.path, 'a', zipfile.ZIP_DEFLATED)
+
+    def __contains__(self, url):
+        return url in self._bodies
+
+    def __len__(self):
+        return len(self._bodies)
+
+    def get(self, url):
+        """Returns the recorded response body for a URL, or `None` if it isn't
+        in the archive.
+        """
+        return self._bodies.get(url)
+
+    def put(self, url, body):
+        """Adds the response body for a URL to the archive.
+
+        Args:
+            url (str): URL of the request.
+            body (bytes): contents of the response.
+        """
+        import zipfile
+        from hashlib import sha1
+        with self._lock:
+            if url in self._bodies or self._zip is None:
+                return
+            name = sha1(url.encode("utf-8")).hexdigest()
+            info = zipfile.ZipInfo(name, (1980, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.comment = url.encode("utf-8")
+            self._zip.writestr(info, body)
+            self._bodies[url] = body
+
+    def close(self):
+        """Writes the pending responses and closes the archive file.
+        """
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+
+archive = None
+""":class:`Archive`: archive that requests are recorded to or replayed from;
+`None` to always request URLs from the servers.
+"""
+
+def set_archive(path, mode="replay"):
+    """Records all the HTTP requests of `aflow` (queries, lazily loaded
+    keywords, structure files and file downloads) to an archive, or replays
+    them from it. The previous archive (if any) is closed.
+
+    Args:
+        path (str): path to the archive file; `None` disables recording and
+          replay.
+        mode (str): `record` or `replay`; see :class:`Archive`.
+
+    Returns:
+        Archive: the new archive, or `None`.
+
+    Examples:
+        Record a query once, then re-run it without network access.
+
+        >>> from aflow import transport
+        >>> transport.set_archive("run.zip", "record")
+        >>> result = list(aflow.search(batch_size=100).filter(K.Egap > 6))
+        >>> transport.set_archive("run.zip", "replay")
+    """
+    global archive
+    if archive is not None:
+        archive.close()
+    archive = Archive(path, mode) if path is not None else None
+    return archive
+
+def _archived(url, fetch, event=None):
+    """Returns the response body for a URL from the archive; if it isn't
+    recorded yet, `fetch()` is called to request it and the body is added to
+    the archive.
+
+    Raises:
+        IOError: if the archive is in replay mode and the URL isn't in it.
+    """
+    body = archive.get(url)
+    if event is not None:
+        event.cache = "miss" if body is None else "hit"
+    if body is None:
+        if archive.mode == "replay":
+            raise IOError("{0} is not in the archive {1}.".format(url,
+                                                                  archive.path))
+        body = fetch()
+        archive.put(url, body)
+    if event is not None:
+        event.bytes = len(body)
+    return body
+
+class _Replayed(object):
+    """Response object (like the one returned by :func:`urlopen`) for a body
+    from the archive.
+    """
+    def __init__(self, body, start=0):
+        from io import BytesIO
+        self._body = BytesIO(body[start:])
+        self._code = 206 if start > 0 else 200
+
+    def read(self, size=-1):
+        return self._body.read(size)
+
+    def getcode(self):
+        return self._code
+
+    def close(self):
+        self._body.close()
+
+_timing = None
+"""threading.local: holds the :class:`aflow.metrics.Event` of the request
+that the current thread is making through the timed opener.
+"""
+
+_timed = None
+"""tuple: `(installed, opener)` where `opener` is the timed opener built from
+the `installed` opener (see :func:`_opener`).
+"""
+
+def _timed_handler(handler):
+    """Returns a copy of a URL handler; HTTP and HTTPS handlers are changed
+    to open connections that record the time to resolve the host name and
+    to connect (including the TLS handshake) in the event of the current
+    thread.
+    """
+    import socket
+    from copy import copy
+    from timeit import default_timer as timer
+    from six.moves import http_client, urllib
+
+    def timed(base):
+        def connect(self):
+            event = getattr(_timing, "event", None)
+            if event is None:
+                return base.connect(self)
+            start = timer()
+            try:
+                socket.getaddrinfo(self.host, self.port, 0, socket.SOCK_STREAM)
+                event.dns = timer() - start
+            except socket.gaierror:
+                #The connection below raises the same error.
+                pass
+            start = timer()
+            base.connect(self)
+            event.connect = timer() - start
+        return type("Timed" + base.__name__, (base,), {"connect": connect})
+
+    connections = {http_client.HTTPConnection:
+                   timed(http_client.HTTPConnection)}
+    if hasattr(http_client, "HTTPSConnection"):
+        connections[http_client.HTTPSConnection] = timed(
+            http_client.HTTPSConnection)
+
+    #The handlers are copied because adding them to an opener changes their
+    #parent.
+    result = copy(handler)
+    bases = tuple(getattr(urllib.request, name) for name in
+                  ("HTTPHandler", "HTTPSHandler") if hasattr(urllib.request,
+                                                              name))
+    if isinstance(handler, bases):
+        cls = type(handler)
+        def do_open(self, http_class, req, **kwargs):
+            http_class = connections.get(http_class, http_class)
+            return cls.do_open(self, http_class, req, **kwargs)
+        result.__class__ = type("Timed" + cls.__name__, (cls,),
+                                {"do_open": do_open})
+    return result
+
+def _opener():
+    """Returns a URL opener with the handlers of the installed opener (see
+    :func:`urllib.request.install_opener`), so that proxies and
+    authentication work the same as without instrumentation, whose HTTP and
+    HTTPS connections record their timings. The opener is only rebuilt when
+    another opener is installed.
+    """
+    global _timing, _timed
+    from threading import local
+    from six.moves import urllib
+    try:
+        from urllib import request as stdlib
+    except ImportError:# pragma: no cover
+        import urllib2 as stdlib
+    installed = getattr(stdlib, "_opener", None)
+    if _timed is None or _timed[0] is not installed:
+        if _timing is None:
+            _timing = local()
+        source = installed or urllib.request.build_opener()
+        opener = urllib.request.OpenerDirector()
+        for handler in source.handlers:
+            opener.add_handler(_timed_handler(handler))
+        _timed = (installed, opener)
+    return _timed[1]
+
+def _urlopen(target, headers=None, event=None):
+    from six.moves import urllib
+    request = urllib.request.Request(target, headers=headers or {})
+    if event is None:
+        return urllib.request.urlopen(request)
+
+    from timeit import default_timer as timer
+    opener = _opener()
+    _timing.event = event
+    try:
+        response = opener.open(request)
+    finally:
+        _timing.event = None
+    event.ttfb = timer() - event.start
+    return response
+
+def _read(target, event=None):
+    from contextlib import closing
+    with closing(_urlopen(target, event=event)) as response:
+        body = response.read()
+    if event is not None:
+        event.bytes = len(body)
+    return body
+
+def urlopen(target, headers=None, event=None):
+    """Opens the specified URL and returns the response object, which can be
+    read incrementally. If an :data:`archive` is set, the response is
+    recorded to (or replayed from) it.
+
+    Args:
+        target (str): URL to request.
+        headers (dict): additional HTTP headers for the request. Range requests
+          are answered from the complete body when an archive is set.
+        event (aflow.metrics.Event): records the timings of the request; the
+          number of bytes is only known here for archived responses.
+    """
+    if archive is None:
+        return _urlopen(target, headers, event)
+
+    body = _archived(target, lambda: _read(target, event), event)
+    start = 0
+    if headers is not None and "Range" in headers:
+        start = int(headers["Range"].split('=')[1].split('-')[0])
+    return _Replayed(body, start)
+
+def read(target, event=None):
+    """Returns the complete body of the response for a URL, e.g. a page of
+    AFLUX results; see :func:`urlopen`.
+    """
+    if archive is None:
+        return _read(target, event)
+    return _archived(target, lambda: _read(target, event), event)
+
+def _get(target, event=None):
+    import requests
+    response = requests.get(target)
+    if event is not None:
+        event.ttfb = response.elapsed.total_seconds()
+        event.bytes = len(response.content)
+    return response
+
+def text(target, event=None):
+    """Returns the body of the response for a URL as text, for lazily loaded
+    keywords and structure files. If an :data:`archive` is set, the response
+    is recorded to (or replayed from) it.
+    """
+    if archive is None:
+        return _get(target, event).text
+    body = _archived(target, lambda: _get(target, event).text.encode("utf-8"),
+                     event)
+    return body.decode("utf-8")
+
+def chunks(response, decompress=None):
+    """Yields the contents of a response in chunks of :data:`chunk_size`
+    bytes.
+
+    Args:
+        response: file-like object returned by :func:`urlopen`.
+        decompress (str): file extension in :data:`decompressors`; if
+          specified, the chunks are decompressed as they are read.
+    """
+    decompressor = decompressors[decompress]() if decompress else None
+    while True:
+        chunk = response.read(chunk_size)
+        if not chunk:
+            break
+        if decompressor is not None:
+            chunk = decompressor.decompress(chunk)
+            if not chunk:
+                continue
+        yield chunk
+
+def compression(filename):
+    """Returns the extension of the specified file if it is one of the
+    compressed formats in :data:`decompressors`; otherwise `None`.
+    """
+    from os import path
+    ext = path.splitext(filename)[1]
+    return ext if ext in decompressors else None
+
+def decode(contents):
+    """Decodes downloaded contents as UTF-8 text.
+
+    Returns:
+        str: decoded text, or `None` if the contents are binary.
+    """
+    try:
+        return contents.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
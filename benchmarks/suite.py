@@ -0,0 +1,352 @@
+"""Offline benchmarks for the `aflow` package. The benchmarks use the
+recorded AFLUX pages in `tests/` so that no network access is needed. Run
+them with::
+
+    python benchmarks/suite.py [names...] [-o results.json]
+
+The results (together with the versions of python and the main
+dependencies) are emitted as JSON so that they can be compared between
+releases.
+"""
+from __future__ import print_function
+import sys
+from collections import OrderedDict
+from os import path
+
+reporoot = path.dirname(path.dirname(path.abspath(__file__)))
+"""str: path to the repository root; the benchmarks run against the working
+tree rather than an installed copy of the package.
+"""
+if reporoot not in sys.path: # pragma: no cover
+    sys.path.insert(0, reporoot)
+
+benchmarks = OrderedDict()
+"""dict: keys are benchmark names; values are the functions that run them and
+return a `dict` of measurements.
+"""
+testdir = path.join(reporoot, "tests")
+"""str: path to the folder with the recorded AFLUX pages.
+"""
+
+def benchmark(func):
+    """Registers the decorated function as a benchmark.
+    """
+    benchmarks[func.__name__] = func
+    return func
+
+def _pages():
+    """Returns the recorded AFLUX pages as a list of python dictionaries.
+    """
+    import json
+    pages = []
+    for name in ["data0.json", "data1.json"]:
+        with open(path.join(testdir, name)) as f:
+            pages.append(json.load(f))
+    return pages
+
+def _records(n):
+    """Returns `n` raw entry dictionaries by cycling over the recorded pages.
+    """
+    from itertools import cycle, islice
+    raws = [raw for page in _pages() for raw in page.values()]
+    return list(islice(cycle(raws), n))
+
+def _allocated(factory):
+    """Returns the objects built by `factory` and the number of bytes that
+    remained allocated for them.
+    """
+    import gc
+    import tracemalloc
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = factory()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+@benchmark
+def entry_memory(n=20000):
+    """Measures the resident memory per :class:`~aflow.entries.Entry`, with and
+    without retention of the raw response.
+    """
+    from aflow.entries import Entry
+    raws = _records(n)
+    result = OrderedDict(entries=n)
+    for keep_raw in (True, False):
+        entries, size = _allocated(lambda: [Entry(keep_raw=keep_raw, **r)
+                                            for r in raws])
+        key = "bytes_per_entry" + ("" if keep_raw else "_no_raw")
+        result[key] = size / float(n)
+        del entries
+    return result
+
+def _page(raws, start, N):
+    """Returns an AFLUX page (keyed by `i of N`) with the specified raw entry
+    dictionaries, numbered from `start`.
+    """
+    return OrderedDict(("{0:d} of {1:d}".format(start + i, N), raw)
+                       for i, raw in enumerate(raws))
+
+def _timed(func, repeat):
+    """Returns the mean wall time in seconds of `repeat` calls to `func`.
+    """
+    from timeit import default_timer
+    start = default_timer()
+    for i in range(repeat):
+        func()
+    return (default_timer() - start)/repeat
+
+def _poscar(natoms):
+    """Returns the contents of a VASP 4 structure file with `natoms` random
+    atomic positions of two species.
+    """
+    import numpy as np
+    rng = np.random.RandomState(0)
+    lines = ["random", "1.0", "10 0 0", "0 10 0", "0 0 10",
+             "{0:d} {1:d}".format(natoms//2, natoms - natoms//2), "Direct"]
+    lines.extend("{0:.8f} {1:.8f} {2:.8f}".format(*p)
+                 for p in rng.random_sample((natoms, 3)))
+    return '\n'.join(lines) + '\n'
+
+@benchmark
+def poscar_parse(natoms=200, repeat=200):
+    """Compares the time to read a structure file with the in-package parser
+    and with :func:`ase.io.read`.
+    """
+    from six import StringIO
+    from ase.io import read
+    from aflow.structure import read_poscar
+    contcar = _poscar(natoms)
+    species = ["Be", "O"]
+    return OrderedDict([
+        ("natoms", natoms),
+        ("seconds_read_poscar", _timed(lambda: read_poscar(contcar, species),
+                                       repeat)),
+        ("seconds_ase", _timed(lambda: read(StringIO("Be O !" + contcar),
+                                            format="vasp"), repeat))
+    ])
+
+samples = {
+    "geometry": "3.867,3.867,3.867,60,60,60",
+    "stress_tensor": "-0.13,0,0,0,-0.13,0,0,0,-0.13",
+    "ldau_TLUJ": "2;2,0;5,0;0,0",
+    "kpoints": "10,10,10;17,17,17;G-X-W-K-G-L-U-W-L-K,U-X;20",
+    "positions_fractional": "0,0,0;0.25,0.25,0.25",
+    "species": "Be,O",
+    "natoms": "2",
+    "composition": "1,1",
+    "forces": "0,0,0;0.01,-0.01,0",
+    "positions_cartesian": "0,0,0;1.34,0.77,1.09",
+    "stoich": "0.5 0.5",
+    "species_pp": "Be_sv,O",
+    "Egap_type": "insulator_direct",
+}
+"""dict: raw values of keywords with complex structure that aren't in the
+recorded pages; used to measure the throughput of their parsers.
+"""
+
+@benchmark
+def parse_throughput(n=20000):
+    """Measures the number of values per second that the generated parser of
+    each keyword (in the recorded pages and :data:`samples`) can cast, and the
+    same for the generic :func:`~aflow.caster.cast` dispatch.
+    """
+    from timeit import default_timer
+    from aflow.caster import parse, cast
+    from aflow.schema import keywords
+    raws = _records(n)
+    values = OrderedDict((k, [r[k] for r in raws if k in r])
+                         for k in sorted(set(k for r in raws for k in r))
+                         if k in keywords)
+    values.update((k, [v]*n) for k, v in sorted(samples.items()))
+
+    result = OrderedDict()
+    for keyword, kwvalues in values.items():
+        atype = keywords[keyword][0]
+        rates = OrderedDict()
+        for name, func in (("parse", lambda v: parse(keyword, v)),
+                           ("cast", lambda v: cast(atype, keyword, v))):
+            func(kwvalues[0])
+            start = default_timer()
+            for value in kwvalues:
+                func(value)
+            rates["{}_per_second".format(name)] = (
+                len(kwvalues)/(default_timer() - start))
+        result[keyword] = rates
+    return result
+
+@benchmark
+def page_parse(repeat=50):
+    """Measures the time to decode a recorded AFLUX page and to construct the
+    :class:`~aflow.entries.Entry` objects for it.
+    """
+    import json
+    from aflow.entries import Entry
+    with open(path.join(testdir, "data0.json")) as f:
+        text = f.read()
+    n = len(json.loads(text))
+    build = lambda: [Entry(**raw) for raw in json.loads(text).values()]
+    return OrderedDict([
+        ("entries", n),
+        ("seconds_decode", _timed(lambda: json.loads(text), repeat)),
+        ("seconds_decode_and_build", _timed(build, repeat))
+    ])
+
+@benchmark
+def entry_construction(n=5000):
+    """Measures the time to construct an :class:`~aflow.entries.Entry` with
+    only the values of one kind of keyword (grouped by their casting rule in
+    :data:`aflow.schema.casters`), using the values in :data:`samples` and the
+    recorded pages.
+    """
+    from aflow.entries import Entry
+    from aflow.schema import casters
+    values = dict(_records(1)[0])
+    values.update(samples)
+    result = OrderedDict()
+    for caster in sorted(set(casters.values()), key=str):
+        raw = dict((k, v) for k, v in values.items()
+                   if casters.get(k) == caster)
+        if len(raw) == 0:
+            continue
+        seconds = _timed(lambda: [Entry(**raw) for i in range(n)], 1)
+        result[str(caster)] = OrderedDict([
+            ("keywords", sorted(raw)),
+            ("seconds_per_entry", seconds/n)
+        ])
+    return result
+
+@benchmark
+def matchbook(repeat=2000):
+    """Measures the time to build the matchbook of a query with filters,
+    selections, exclusions and ordering.
+    """
+    from aflow.control import Query
+    from aflow.keywords import reset
+    import aflow.keywords as K
+
+    def build():
+        query = (Query(catalog="icsd")
+                 .filter((K.Egap > 1) & (K.Egap < 4))
+                 .filter(K.species == "Si")
+                 .select(K.natoms, K.geometry, K.positions_fractional)
+                 .exclude(K.aurl)
+                 .orderby(K.agl_thermal_conductivity_300K, True))
+        result = query.matchbook()
+        reset()
+        return result
+
+    return OrderedDict([("seconds", _timed(build, repeat))])
+
+@benchmark
+def iteration(pages=50, k=100):
+    """Measures the number of entries per second that a query yields when
+    iterating over `pages` synthetic pages (built from the recorded entries)
+    that are already in memory.
+    """
+    from timeit import default_timer
+    from aflow.control import Query
+    N = pages*k
+    raws = _records(N)
+    query = Query(batch_size=k)
+    query._N = N
+    query.responses = dict((n + 1, _page(raws[n*k:(n + 1)*k], n*k + 1, N))
+                           for n in range(pages))
+    start = default_timer()
+    count = sum(1 for entry in query)
+    seconds = default_timer() - start
+    return OrderedDict([("entries", count),
+                        ("entries_per_second", count/seconds)])
+
+heavy = ["numpy", "requests", "ase", "jinja2", "aflow.keywords"]
+"""list: of modules that `import aflow` should *not* import by itself.
+"""
+
+_import_script = """
+import json, sys
+from timeit import default_timer
+start = default_timer()
+import {0}
+seconds = default_timer() - start
+print(json.dumps([seconds, [m for m in {1!r} if m in sys.modules]]))
+"""
+
+def _import(module):
+    """Imports a module in a fresh interpreter and returns the time that it
+    took and the list of :data:`heavy` modules that were imported with it.
+    """
+    import json
+    import subprocess
+    script = _import_script.format(module, heavy)
+    output = subprocess.check_output([sys.executable, "-c", script],
+                                     cwd=reporoot)
+    return json.loads(output.decode("utf-8"))
+
+@benchmark
+def import_time(repeat=5):
+    """Measures the time to `import aflow` (and the entries module that worker
+    processes need) in a fresh interpreter, and lists the heavy dependencies
+    that were imported with them.
+    """
+    result = OrderedDict()
+    for module in ("aflow", "aflow.entries"):
+        runs = [_import(module) for i in range(repeat)]
+        key = module.replace('.', '_')
+        result["seconds_" + key] = sorted(r[0] for r in runs)[repeat//2]
+        result["heavy_" + key] = runs[0][1]
+    return result
+
+def environment():
+    """Returns the versions of python and the main dependencies, so that
+    results from different machines and releases can be told apart.
+    """
+    import platform
+    import numpy
+    import six
+    return OrderedDict([
+        ("python", platform.python_version()),
+        ("platform", platform.platform()),
+        ("numpy", numpy.__version__),
+        ("six", six.__version__)
+    ])
+
+def run(names=None):
+    """Runs the benchmarks and returns the results.
+
+    Args:
+        names (list): of `str` benchmark names to run; if `None`, all the
+          registered benchmarks are run.
+
+    Returns:
+        dict: with the :func:`environment` and the results of each benchmark
+        by name.
+    """
+    names = list(benchmarks.keys()) if not names else names
+    result = OrderedDict(environment=environment())
+    result.update((name, benchmarks[name]()) for name in names)
+    return result
+
+if __name__ == '__main__': # pragma: no cover
+    import argparse
+    import json
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*",
+                        help="Names of the benchmarks to run; one of {}."
+                        .format(', '.join(benchmarks)))
+    parser.add_argument("-o", "--output",
+                        help="Write the results to this JSON file instead of "
+                        "printing them.")
+    args = parser.parse_args()
+    unknown = set(args.names) - set(benchmarks)
+    if unknown:
+        parser.error("Unknown benchmarks: {}".format(', '.join(unknown)))
+    results = run(args.names)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
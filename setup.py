@@ -35,9 +35,10 @@ setup(name='aflow',
           "beautifulsoup4",
           "ase"
       ],
-      packages=['aflow'],
+      packages=['aflow', 'aflow.testing'],
       scripts=[],
-      package_data={'aflow': ['templates/*']},
+      package_data={'aflow': ['templates/*', 'schema.json',
+                              'schema_snapshot.json']},
       include_package_data=True,
       classifiers=[
           'Development Status :: 4 - Beta',
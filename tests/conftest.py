@@ -26,3 +26,60 @@ def paper():
         result.responses[n] = response
 
     return result[0:40]
+
+@pytest.fixture
+def fileserver():
+    """Serves files from a dictionary over HTTP on localhost (with support for
+    range requests) and sends all AFLOW URL requests to it. Keys are paths
+    (e.g. `AFLOWDATA/LIB2_RAW/CeMg_pv/304/CONTCAR.relax`); values are `bytes`.
+    The paths of all requests are recorded in the `requests` attribute.
+    """
+    import threading
+    from six.moves import BaseHTTPServer, socketserver
+    from aflow import transport
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.lstrip('/')
+            Handler.requests.append(path)
+            if path not in Handler.files:
+                self.send_error(404)
+                return
+
+            contents = Handler.files[path]
+            start = 0
+            if "Range" in self.headers:
+                start = int(self.headers["Range"].split('=')[1].split('-')[0])
+                if start >= len(contents):
+                    self.send_response(416)
+                    self.send_header("Content-Range",
+                                     "bytes */{0:d}".format(len(contents)))
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(206)
+            else:
+                self.send_response(200)
+            self.send_header("Content-Length", str(len(contents) - start))
+            self.end_headers()
+            self.wfile.write(contents[start:])
+
+        def log_message(self, *args):
+            pass
+
+    Handler.files = {}
+    Handler.requests = []
+    class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+        daemon_threads = True
+
+    server = Server(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    transport.set_server("http://127.0.0.1:{0:d}".format(server.server_port))
+    try:
+        yield Handler
+    finally:
+        transport.set_server(None)
+        server.shutdown()
+        server.server_close()
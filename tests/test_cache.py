@@ -0,0 +1,152 @@
+"""Tests the process-wide caches.
+"""
+import pytest
+
+def test_lru():
+    """Tests the eviction order of the bounded cache.
+    """
+    from aflow.cache import LRUCache
+    c = LRUCache(2)
+    assert c.setdefault("a", 1) == 1
+    assert c.setdefault("b", 2) == 2
+    assert c.get("a") == 1
+    assert c.setdefault("c", 3) == 3
+    assert "b" not in c
+    assert "a" in c and "c" in c
+    assert c.setdefault("a", 10) == 1
+    assert c.get("b") is None
+    assert len(c) == 2
+    assert (c.hits, c.misses) == (2, 4)
+    c.clear()
+    assert len(c) == 0
+
+def test_identity_map():
+    """Tests that entries for the same material share their attributes.
+    """
+    from aflow import cache
+    from aflow.entries import Entry
+    raw = {"auid": "aflow:ed51b7b3938f117f",
+           "aurl": "aflowlib.duke.edu:AFLOWDATA/ICSD_WEB/HEX/Be1O1_ICSD_15620"}
+
+    A = Entry(Egap="7.4494", **raw)
+    B = Entry(Egap="7.4494", **raw)
+    assert A.attributes is not B.attributes
+
+    cache.enable_identity_map()
+    try:
+        #Values that were cast with another dtype policy aren't shared.
+        import numpy as np
+        from aflow.caster import DtypePolicy
+        single = DtypePolicy(float=np.float32)
+        A = Entry(**raw)
+        B = Entry(dtypes=single, **raw)
+        assert A.attributes is not B.attributes
+        assert Entry(dtypes=single, **raw).attributes is B.attributes
+
+        #Equal policies that were built separately share the attributes.
+        other = DtypePolicy(float="float32")
+        assert other == single and hash(other) == hash(single)
+        assert other != DtypePolicy(float="float32", int="int32")
+        assert Entry(dtypes=other, **raw).attributes is B.attributes
+    finally:
+        cache.disable_identity_map()
+
+    cache.enable_identity_map(maxsize=1)
+    try:
+        A = Entry(Egap="7.4494", **raw)
+        B = Entry(natoms="4", **raw)
+        assert A.attributes is B.attributes
+        assert B.Egap == 7.4494
+        assert A.natoms == 4
+
+        #A lazily loaded value is visible to all the other entries without
+        #another request.
+        A.attributes["energy_atom"] = -7.10342
+        assert Entry(**raw).energy_atom == -7.10342
+
+        #Evicted materials start a new attribute dictionary.
+        Entry(auid="aflow:0", Egap="1")
+        D = Entry(**raw)
+        assert D.attributes is not A.attributes
+        assert A.Egap == 7.4494
+    finally:
+        cache.disable_identity_map()
+
+class _Response(object):
+    def __init__(self, text):
+        self.text = text
+
+def test_structures(monkeypatch, tmpdir):
+    """Tests that structures are cached separately for each pattern, and
+    persisted on disk between sessions.
+    """
+    import requests
+    from aflow import cache
+    from aflow.entries import Entry
+    requested = []
+    def get(url, *args, **kwargs):
+        requested.append(url.split('/')[-1])
+        c = 4.38 if url.endswith("CONTCAR.relax") else 4.0
+        return _Response("BeO\n1.0\n2.7 0 0\n-1.35 2.338 0\n0 0 {}\n1 1\n"
+                         "Direct\n0 0 0\n0.5 0.5 0.5\n".format(c))
+    monkeypatch.setattr(requests, "get", get)
+
+    raw = {"auid": "aflow:0", "species": "Be,O",
+           "aurl": "aflowlib.duke.edu:AFLOWDATA/ICSD_WEB/HEX/BeO",
+           "files": "CONTCAR.relax,POSCAR.orig"}
+    entry = Entry(**raw)
+    relaxed = entry.atoms()
+    original = entry.atoms("POSCAR.orig")
+    assert relaxed.cell[2, 2] == 4.38
+    assert original.cell[2, 2] == 4.0
+    assert entry.atoms() is relaxed
+    assert entry.atoms("POSCAR.orig") is original
+    assert requested == ["CONTCAR.relax", "POSCAR.orig"]
+
+    cache.set_cachedir(str(tmpdir.join("cache")))
+    try:
+        Entry(**raw).atoms()
+        assert requested[-1] == "CONTCAR.relax"
+        del requested[:]
+        at = Entry(**raw).atoms()
+        assert requested == []
+        assert at.get_chemical_symbols() == ["Be", "O"]
+        assert at.cell[2, 2] == 4.38
+        assert tmpdir.join("cache", "structures", "aflow_0",
+                           "CONTCAR.relax.npz").check()
+    finally:
+        cache.set_cachedir(None)
+
+def test_listings(monkeypatch, tmpdir):
+    """Tests that file listings are cached between sessions and that pattern
+    lookups are memoized.
+    """
+    from aflow import cache
+    from aflow.entries import Entry, AflowFiles
+    monkeypatch.setattr(cache, "cachedir", None)
+    cache.set_cachedir(str(tmpdir))
+    auid = "aflow:ed51b7b3938f117f"
+    aurl = "aflowlib.duke.edu:AFLOWDATA/ICSD_WEB/HEX/Be1O1_ICSD_15620"
+    files = "CONTCAR.relax,CONTCAR.relax1, OUTCAR.relax,DOSCAR.static.xz"
+    first = Entry(auid=auid, aurl=aurl, files=files)
+    assert first.files.matches("OUTCAR*") == ["OUTCAR.relax"]
+
+    loads = []
+    def lazy(self, keyword):
+        loads.append(keyword)
+    monkeypatch.setattr(Entry, "_lazy_load", lazy)
+    second = AflowFiles(Entry(auid=auid))
+    assert loads == []
+    assert second.aurl == aurl
+    assert len(second) == 4
+    assert second["DOSCAR*"].filename == "DOSCAR.static.xz"
+    assert second.matches("CONTCAR.relax") == ["CONTCAR.relax"]
+    assert second.matches("CONTCAR.relax*") == ["CONTCAR.relax",
+                                                "CONTCAR.relax1"]
+    assert second.matches("CONTCAR.relax*") is second.matches("CONTCAR.relax*")
+    with pytest.raises(KeyError):
+        second["CONTCAR*"]
+
+    cache.set_cachedir(None)
+    assert AflowFiles(Entry(auid=auid)).aurl is None
+    assert loads == ["files", "aurl"]
@@ -6,3 +6,94 @@ def test_corner():
     assert cast("numbers", "spinD", None) is None
     assert cast("numbers", "spinD", "garbage") is None
     assert cast("numbers", "ldau_TLUJ", "garbage") == {'ldau_params': 'garbage'}
+
+def test_parse():
+    """Tests the parsers that were generated for each keyword.
+    """
+    import numpy as np
+    from aflow.caster import parse, DtypePolicy
+    stress = parse("stress_tensor", "1,0,0,0,2,0,0,0,3.5")
+    assert stress.shape == (3, 3) and stress[2, 2] == 3.5
+    geometry = parse("geometry", "3.8,3.8,3.8,60,60,60")
+    assert geometry.shape == (6,) and geometry.dtype == np.float64
+    assert parse("geometry", "3.8,3.8,60") is None
+    assert parse("stress_tensor", "1,0,x,0,2,0,0,0,3") is None
+    assert parse("natoms", "2") == 2 and isinstance(parse("Egap", "0"), float)
+    assert parse("species", "Be,O") == ["Be", "O"]
+    assert parse("positions_fractional", "0,0,0;0.5,0.5,0.5", 2).shape == (2, 3)
+    assert parse("forces", "0,0,0", natoms=2) is None
+    ldau = parse("ldau_TLUJ", "2;2,0;5,0;0,0")
+    assert ldau["LDAUTYPE"] == 2 and list(ldau["LDAUU"]) == [5, 0]
+    assert parse("Egap", None) is None
+    policy = DtypePolicy(float="float32")
+    assert parse("stress_tensor", "1,0,0,0,2,0,0,0,3", policy=policy).dtype == np.float32
+    with pytest.raises(KeyError):
+        parse("dummy", "1")
+
+    #The general casting gives the same shapes as the generated parsers.
+    from aflow.caster import cast
+    value = "1,0,0,0,2,0,0,0,3.5"
+    assert cast("numbers", "stress_tensor", value).shape == (3, 3)
+    assert np.array_equal(cast("numbers", "stress_tensor", value),
+                          parse("stress_tensor", value))
+    assert cast("numbers", "geometry", "3.8,3.8,3.8,60,60,60").shape == (6,)
+
+def test_forces():
+    """Tests the single-pass parsing of per-atom vector strings.
+    """
+    import numpy as np
+    from aflow.caster import cast
+    value = "0,0,0;0.25,0.25,0.25;-1.5e-3,2,3"
+    expected = np.array([[0, 0, 0], [0.25, 0.25, 0.25], [-1.5e-3, 2, 3]])
+    for keyword in ["forces", "positions_cartesian", "positions_fractional"]:
+        result = cast("numbers", keyword, value)
+        assert result.shape == (3, 3)
+        assert result.dtype == np.float64
+        assert np.allclose(result, expected)
+        assert np.allclose(cast("numbers", keyword, value, natoms=3), expected)
+
+    assert cast("numbers", "forces", value, natoms=2) is None
+    assert cast("numbers", "forces", "0,0,0;0,0") is None
+    assert cast("numbers", "forces", "0,0,0;0,x,0") is None
+
+def test_dtypes():
+    """Tests the global and explicit dtype policies for numeric values.
+    """
+    import numpy as np
+    from aflow.caster import cast, DtypePolicy, set_dtypes
+    policy = DtypePolicy(float="float32", int="int32",
+                         keywords={"natoms": "int16"})
+    forces = cast("numbers", "forces", "0,0,0;1,1,1", policy=policy)
+    assert forces.dtype == np.float32
+    assert cast("numbers", "composition", "1,2,3", policy=policy).dtype == np.int32
+    #Float keywords in the schema stay floats even if the values are integral.
+    assert cast("numbers", "geometry", "1,2,3,90,90,90", policy=policy).dtype == np.float32
+    assert cast("numbers", "energy_cutoff", "1,2,3", policy=policy).dtype == np.float32
+    assert cast("numbers", "energy_cutoff", "1,2.5", policy=policy).dtype == np.float32
+    natoms = cast("number", "natoms", "4", policy=policy)
+    assert natoms == 4 and natoms.dtype == np.int16
+    #Scalars without an override keep their python types.
+    assert isinstance(cast("number", "Egap", "2.5", policy=policy), float)
+    ldau = cast("numbers", "ldau_TLUJ", "2;2,0;5,0;0,0", policy=policy)
+    assert ldau["LDAUU"].dtype == np.int32
+    assert ldau["LDAUTYPE"] == 2
+
+    try:
+        set_dtypes(policy)
+        assert cast("numbers", "forces", "0,0,0").dtype == np.float32
+    finally:
+        set_dtypes(None)
+    assert cast("numbers", "forces", "0,0,0").dtype == np.float64
+
+def test_entry_dtypes():
+    """Tests that entries cast their values using the query's policy.
+    """
+    import numpy as np
+    from aflow.caster import DtypePolicy
+    from aflow.entries import Entry
+    policy = DtypePolicy(float="float32")
+    a = Entry(dtypes=policy, auid="aflow:0", natoms="1",
+              positions_fractional="0,0.5,0.5")
+    assert a.attributes["positions_fractional"].dtype == np.float32
+    assert a.raw == {"auid": "aflow:0", "natoms": "1",
+                     "positions_fractional": "0,0.5,0.5"}
@@ -0,0 +1,92 @@
+"""Tests the columnar materialization of database entries.
+"""
+import numpy as np
+
+def _entries():
+    from aflow.entries import Entry
+    raw = [
+        {"auid": "aflow:0", "Egap": "1.5", "natoms": "2", "species": "Be,O",
+         "Egap_type": "insulator_direct", "geometry": "1,1,1,90,90,90"},
+        {"auid": "aflow:1", "Egap": "0", "natoms": "1", "species": "Si",
+         "Egap_type": "metal", "geometry": "2,2,2,90,90,120"},
+        {"auid": "aflow:2", "natoms": "3", "species": "Be,O,Si",
+         "Egap_type": "insulator_direct", "geometry": "3,3,3,60,60,60"},
+    ]
+    return [Entry(**r) for r in raw]
+
+def test_interning():
+    """Tests that low-cardinality values share a single string object.
+    """
+    a, b, c = _entries()
+    assert a.attributes["Egap_type"] is c.attributes["Egap_type"]
+    assert a.raw["Egap_type"] is c.attributes["Egap_type"]
+    assert a.attributes["species"][0] is c.attributes["species"][0]
+
+def test_categorical():
+    """Tests encoding and decoding of categorical columns.
+    """
+    from aflow.columns import Categorical
+    values = ["metal", None, "insulator_direct", "metal"]
+    cat = Categorical.from_values(values)
+    assert len(cat) == 4
+    assert cat.categories == ["metal", "insulator_direct"]
+    assert list(cat.codes) == [0, -1, 1, 0]
+    assert cat.tolist() == values
+
+    ragged = Categorical.from_values([["Be", "O"], None, ["O"]])
+    assert len(ragged) == 3
+    assert list(ragged.offsets) == [0, 2, 2, 3]
+    assert ragged.tolist() == [["Be", "O"], [], ["O"]]
+
+def test_columns():
+    """Tests materializing numeric, vector and categorical columns.
+    """
+    from aflow.columns import columns, Categorical
+    from aflow.caster import DtypePolicy
+    from aflow import K
+    cols = columns(_entries(), [K.Egap, "natoms", K.species, K.Egap_type,
+                                K.geometry, "auid"])
+    assert list(cols.keys()) == ["Egap", "natoms", "species", "Egap_type",
+                                 "geometry", "auid"]
+    assert cols["Egap"].dtype == np.float64
+    assert np.isnan(cols["Egap"][2])
+    assert cols["natoms"].dtype == np.int64
+    assert list(cols["natoms"]) == [2, 1, 3]
+    assert isinstance(cols["species"], Categorical)
+    assert cols["species"][2] == ["Be", "O", "Si"]
+    assert cols["Egap_type"].categories == ["insulator_direct", "metal"]
+    assert cols["geometry"].shape == (3, 6)
+    assert cols["auid"] == ["aflow:0", "aflow:1", "aflow:2"]
+
+    policy = DtypePolicy(float="float32", int="int32")
+    cols = columns(_entries(), [K.Egap, K.natoms, K.geometry], dtypes=policy)
+    assert cols["Egap"].dtype == np.float32
+    assert cols["natoms"].dtype == np.int32
+    assert cols["geometry"].dtype == np.float32
+
+def test_column_type():
+    """Tests the typed column definitions from the schema.
+    """
+    from aflow.columns import column_type, columns
+    from aflow import K
+    assert column_type(K.Egap) == ("float64", (), False, "eV")
+    assert column_type("natoms").dtype == "int64"
+    assert column_type("geometry").shape == (6,)
+    assert column_type("forces").shape == (None, 3)
+    assert column_type("species") == ("object", (None,), False, "")
+    assert column_type("dummy") is None
+
+    a, b, c = _entries()
+    assert isinstance(b.Egap, float)
+    cols = columns([a, b], ["natoms", "geometry"])
+    assert cols["natoms"].dtype == np.int64
+    assert cols["geometry"].dtype == np.float64
+    assert cols["geometry"][1, 5] == 120.
+
+def test_query_columns(paper):
+    """Tests the columns for a query with pre-loaded responses.
+    """
+    from aflow import K
+    cols = paper.columns(K.Egap, K.agl_thermal_conductivity_300K)
+    assert cols["Egap"].shape == (40,)
+    assert np.all(cols["Egap"] >= 6)
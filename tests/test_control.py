@@ -62,3 +62,63 @@ def test_empty_query_result():
     result = aflow.search(catalog='icsd', batch_size=20
                           ).filter(kw.auid < "aflow")
     assert result.N == 0
+
+def _structures_query():
+    """Returns a query with pre-loaded responses for three entries: one that
+    can be built from keywords, one that needs its CONTCAR downloaded and one
+    whose download fails.
+    """
+    from aflow.control import Query
+    base = "aflowlib.duke.edu:AFLOWDATA/ICSD_WEB/HEX/"
+    raws = [
+        {"auid": "aflow:0", "aurl": base + "Si", "species": "Si",
+         "composition": "2", "geometry": "3.867,3.867,3.867,60,60,60",
+         "positions_fractional": "0,0,0;0.25,0.25,0.25"},
+        {"auid": "aflow:1", "aurl": base + "BeO", "species": "Be,O",
+         "files": "CONTCAR.relax,CONTCAR.relax1,OUTCAR"},
+        {"auid": "aflow:2", "aurl": base + "missing", "species": "Be,O",
+         "files": "CONTCAR.relax"},
+    ]
+    q = Query(batch_size=3)
+    q._N = len(raws)
+    q.responses[1] = {"{} of 3".format(i+1): r for i, r in enumerate(raws)}
+    return q
+
+class _Response(object):
+    def __init__(self, text):
+        self.text = text
+
+def _contcar(url, *args, **kwargs):
+    """Mimics :func:`requests.get` for the structure files.
+    """
+    if "missing" in url:
+        raise IOError("Not found: {}".format(url))
+    assert url.endswith("CONTCAR.relax1")
+    return _Response("BeO\n1.0\n2.7 0 0\n-1.35 2.338 0\n0 0 4.38\n"
+                     "1 1\nDirect\n0.333 0.667 0\n0.333 0.667 0.375\n")
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_atoms(monkeypatch, processes):
+    """Tests the creation of atoms objects for a whole query.
+    """
+    import requests
+    from ase.atoms import Atoms
+    monkeypatch.setattr(requests, "get", _contcar)
+    q = _structures_query()
+    result = q.atoms(processes=processes, from_keywords=True)
+    assert len(result) == 3
+    assert isinstance(result[0], Atoms) and isinstance(result[1], Atoms)
+    assert result[0].get_chemical_symbols() == ["Si", "Si"]
+    assert result[1].get_chemical_symbols() == ["Be", "O"]
+    assert result[2] is None
+    assert list(q.errors.keys()) == [2]
+    assert isinstance(q.errors[2], IOError)
+
+def test_structures():
+    """Tests packing the structures of a query into arrays.
+    """
+    q = _structures_query()
+    packed = q.structures()
+    assert len(packed) == 3
+    assert list(packed.valid) == [True, False, False]
+    assert list(packed.offsets) == [0, 2, 2, 2]
@@ -0,0 +1,110 @@
+"""Tests concurrent bulk downloads of the files for many entries.
+"""
+
+def _entries(fileserver, n=6):
+    """Returns entries whose files are served by the test server.
+    """
+    from aflow.entries import Entry
+    entries = []
+    for i in range(n):
+        aurl = "aflowlib.duke.edu:AFLOWDATA/LIB2_RAW/CeMg_pv/{0:d}".format(i)
+        path = aurl.split(':')[1]
+        files = {"CONTCAR.relax": "contcar {0:d}\n".format(i).encode("utf-8"),
+                 "OUTCAR.relax": b"outcar" * 1000 * (i + 1),
+                 "DOSCAR.static": b"doscar"}
+        for name, contents in files.items():
+            fileserver.files[path + '/' + name] = contents
+        entries.append(Entry(auid="aflow:{0:016x}".format(i), aurl=aurl,
+                             files=','.join(sorted(files))))
+    return entries
+
+def test_download(fileserver, tmpdir):
+    """Tests downloads, skipping of existing files and the manifest.
+    """
+    import json
+    from os import path
+    import aflow
+    from aflow.entries import Entry
+    entries = _entries(fileserver)
+    entries.append(Entry(auid="aflow:ffff", files="OUTCAR.relax",
+                         aurl="aflowlib.duke.edu:AFLOWDATA/x"))
+    dest = str(tmpdir.join("files"))
+    result = aflow.download(entries, ["OUTCAR.relax*", "CONTCAR.*"], dest,
+                            workers=4, per_host=2)
+    assert len(result) == 13
+    assert [r["status"] for r in result].count("downloaded") == 12
+    assert result[-1]["status"] == "failed"
+    assert "404" in result[-1]["error"]
+    target = path.join(dest, "aflow_0000000000000002", "OUTCAR.relax")
+    with open(target, 'rb') as f:
+        assert f.read() == b"outcar" * 3000
+    with open(path.join(dest, "manifest.json")) as f:
+        assert json.load(f) == result
+
+    count = len(fileserver.requests)
+    result = aflow.download(entries[:-1], "CONTCAR.relax", dest)
+    assert all(r["status"] == "skipped" for r in result)
+    assert len(fileserver.requests) == count
+
+def test_resume(fileserver, tmpdir):
+    """Tests that partial downloads are resumed with range requests.
+    """
+    from os import path
+    from aflow import download
+    entries = _entries(fileserver, 1)
+    folder = tmpdir.join("aflow_0000000000000000")
+    folder.ensure(dir=True)
+    folder.join("OUTCAR.relax.part").write_binary(b"outcar" * 400)
+
+    result = download(entries, "OUTCAR.relax", str(tmpdir), manifest=None)
+    assert result[0]["bytes"] == 3600
+    with open(result[0]["path"], 'rb') as f:
+        assert f.read() == b"outcar" * 1000
+    assert not path.isfile(str(folder.join("OUTCAR.relax.part")))
+    assert not path.isfile(str(tmpdir.join("manifest.json")))
+
+def test_complete_part(fileserver, tmpdir):
+    """Tests that a partial file that already has every byte is completed
+    when the server rejects the range request, and that a partial file that
+    is larger than the file on the server is replaced.
+    """
+    from os import path
+    from aflow import download
+    entries = _entries(fileserver, 1)
+    folder = tmpdir.join("aflow_0000000000000000")
+    folder.ensure(dir=True)
+    folder.join("OUTCAR.relax.part").write_binary(b"outcar" * 1000)
+    folder.join("CONTCAR.relax.part").write_binary(b"stale contents\n")
+
+    result = download(entries, ["OUTCAR.relax", "CONTCAR.relax"],
+                      str(tmpdir), manifest=None)
+    assert [r["status"] for r in result] == ["downloaded"]*2
+    assert result[0]["bytes"] == 0
+    with open(result[0]["path"], 'rb') as f:
+        assert f.read() == b"outcar" * 1000
+    with open(result[1]["path"], 'rb') as f:
+        assert f.read() == b"contcar 0\n"
+    assert not path.isfile(str(folder.join("OUTCAR.relax.part")))
+
+def test_folders(fileserver, tmpdir, monkeypatch):
+    """Tests that entries without `auid` are stored by their `aurl` without
+    any requests, and that a failure to list the files of one entry doesn't
+    abort the batch.
+    """
+    from os import path
+    from aflow import download
+    from aflow.entries import Entry
+    def offline(self, keyword):
+        if keyword in self.attributes:
+            return self.attributes[keyword]
+        raise IOError("No requests should be made for {}.".format(keyword))
+    entries = _entries(fileserver, 2)
+    entries[0] = Entry(aurl=entries[0].aurl, files="CONTCAR.relax")
+    entries.append(Entry(Egap="1"))
+    monkeypatch.setattr(Entry, "_lazy_load", offline)
+
+    result = download(entries, "CONTCAR.relax", str(tmpdir))
+    assert [r["status"] for r in result] == ["downloaded"]*2 + ["failed"]
+    assert path.dirname(result[0]["path"]) == str(tmpdir.join(
+        "AFLOWDATA_LIB2_RAW_CeMg_pv_0"))
+    assert "No requests" in result[2]["error"]
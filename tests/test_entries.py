@@ -141,3 +141,146 @@ def test_all():
                 assert getattr(A, kw) is not None
             else:
                 assert getattr(A, kw) is None
+
+def test_compact():
+    """Tests the slots-based entry without retention of the raw response.
+    """
+    from aflow.entries import Entry
+    raw = {"auid": "aflow:ed51b7b3938f117f", "Egap": "7.4494"}
+    a = Entry(keep_raw=False, **raw)
+    assert a.raw is None
+    assert a.Egap == 7.4494
+    assert not hasattr(a, "__dict__")
+    with pytest.raises(AttributeError):
+        a.dummy = 1
+
+    b = Entry(**raw)
+    assert b.raw == raw
+
+def test_identity(monkeypatch):
+    """Tests that hashing and equality use `auid`, and never need an HTTP
+    request when it is available.
+    """
+    from aflow import entries
+    from aflow.entries import Entry
+    auid = "aflow:ed51b7b3938f117f"
+    aurl = "aflowlib.duke.edu:AFLOWDATA/ICSD_WEB/HEX/Be1O1_ICSD_15620"
+    A = Entry(auid=auid, Egap="7.4494")
+    B = Entry(auid=auid, aurl=aurl)
+
+    count = entries.remote_identities
+    assert A == B and not (A != B)
+    assert len(set([A, B])) == 1
+    assert hash(A) == hash(auid)
+    assert A != "aflow:ed51b7b3938f117f"
+    assert entries.remote_identities == count
+
+    #Entries without `auid` request it, so that they are equal to the other
+    #entries for the same material.
+    monkeypatch.setattr(Entry, "_lazy_load", lambda self, k:
+                        self.attributes.setdefault(k, auid))
+    C = Entry(aurl=aurl)
+    D = Entry(aurl=aurl, Egap="7.4494")
+    assert C == D
+    assert A == C and B == C
+    assert len(set([A, B, C, D])) == 1
+    assert entries.remote_identities == count + 2
+
+def test_excluded_auid():
+    """Tests that queries never exclude `auid`.
+    """
+    import aflow
+    from aflow import K
+    query = aflow.search().select(K.Egap).exclude(K.auid, K.aurl)
+    query.finalize()
+    assert query.excludes == ["aurl"]
+    assert "$auid" not in query.matchbook()
+
+def test_remote_identity(monkeypatch):
+    """Tests the counter for identity lookups that require a request.
+    """
+    from aflow import entries
+    from aflow.entries import Entry
+    monkeypatch.setattr(Entry, "_lazy_load", lambda self, k: "aflow:0")
+    count = entries.remote_identities
+    A = Entry(Egap="1")
+    assert hash(A) == hash("aflow:0")
+    assert entries.remote_identities == count + 1
+
+def test_frozen_identity(monkeypatch):
+    """Tests that the hash of an entry doesn't change after it was added to a
+    set.
+    """
+    from aflow.entries import Entry
+    aurl = "aflowlib.duke.edu:AFLOWDATA/ICSD_WEB/HEX/Be1O1_ICSD_15620"
+    monkeypatch.setattr(Entry, "_lazy_load", lambda self, k:
+                        self.attributes.setdefault(k, "aflow:ed51b7b3938f117f"))
+    A = Entry(aurl=aurl)
+    entries = set([A])
+    assert "auid" in A.attributes
+    A.attributes["auid"] = "aflow:0"
+    assert A in entries
+    assert hash(A) == hash("aflow:ed51b7b3938f117f")
+
+class _Stream(object):
+    """Stands in for an HTTP response, counting the chunks read from it.
+    """
+    def __init__(self, contents):
+        from io import BytesIO
+        self.buffer = BytesIO(contents)
+        self.reads = 0
+        self.closed = False
+    def read(self, size):
+        self.reads += 1
+        return self.buffer.read(size)
+    def close(self):
+        self.closed = True
+
+def test_stream(monkeypatch, tmpdir):
+    """Tests streaming downloads of text, binary and compressed files.
+    """
+    import bz2
+    from aflow import transport
+    from aflow.entries import AflowFile
+    aurl = "aflowlib.duke.edu:AFLOWDATA/LIB3_RAW/Bi_dRh_pvTi_sv/T0003.ABC:LDAU2"
+    text = ("line of text\n" * 10000).encode("utf-8")
+    binary = bytes(bytearray(range(256))) * 100
+    files = {"CONTCAR.relax": text, "CHGCAR.bin": binary,
+             "OUTCAR.relax.bz2": bz2.compress(text)}
+    urls = []
+    streams = []
+    def urlopen(url, headers=None, event=None):
+        urls.append(url)
+        streams.append(_Stream(files[url.split('/')[-1]]))
+        return streams[-1]
+    monkeypatch.setattr(transport, "urlopen", urlopen)
+    monkeypatch.setattr(transport, "chunk_size", 4096)
+    monkeypatch.chdir(str(tmpdir))
+
+    assert AflowFile(aurl, "CONTCAR.relax")() == text.decode("utf-8")
+    assert urls[-1] == ("http://aflowlib.duke.edu/AFLOWDATA/LIB3_RAW/"
+                        "Bi_dRh_pvTi_sv/T0003.ABC:LDAU2/CONTCAR.relax")
+    assert streams[-1].reads > 1 and streams[-1].closed
+
+    target = str(tmpdir.join("contcar"))
+    assert AflowFile(aurl, "CONTCAR.relax")(target) == target
+    with open(target, 'rb') as f:
+        assert f.read() == text
+
+    #Binary files are saved without being requested a second time.
+    count = len(urls)
+    saved = AflowFile(aurl, "CHGCAR.bin")()
+    assert len(urls) == count + 1
+    assert saved == str(tmpdir.join("CHGCAR.bin"))
+    with open(saved, 'rb') as f:
+        assert f.read() == binary
+
+    assert AflowFile(aurl, "OUTCAR.relax.bz2")(decompress=True) == text.decode("utf-8")
+    target = str(tmpdir.join("outcar"))
+    AflowFile(aurl, "OUTCAR.relax.bz2")(target, decompress=True)
+    with open(target, 'rb') as f:
+        assert f.read() == text
+    target = str(tmpdir.join("outcar.bz2"))
+    AflowFile(aurl, "OUTCAR.relax.bz2")(target)
+    with open(target, 'rb') as f:
+        assert bz2.decompress(f.read()) == text
@@ -1,17 +1,16 @@
 """Tests the generators to make sure that they produce valid code and
 have all the relevant keywords in them.
 """
-import pytest
 def test_keywords_entries(tmpdir):
     """Makes sure the generated files have all the relevant contents
-    from the keyword templates.
+    from the live schema.
     """
     from aflow.generators import keywords
     keywords(str(tmpdir))
 
     from aflow.utility import load_module
-    modname = "aflow.keywords"
-    modpath = str(tmpdir.join("keywords.py"))
+    modname = "aflow.schema"
+    modpath = str(tmpdir.join("schema.py"))
     modobj = load_module(modname, modpath)
     
     #If we get here, the module was produced correctly. Grab a list of
@@ -23,15 +22,81 @@ def test_keywords_entries(tmpdir):
         if kw[0:2] == "__":
             continue
         
-        assert hasattr(modobj, kw)
-        assert issubclass(getattr(modobj, kw).__class__, modobj.Keyword)
-        
-    modname = "aflow.entries"
-    modpath = str(tmpdir.join("entries.py"))
-    modobj = load_module(modname, modpath)
+        assert kw in modobj.keywords
 
-    for kw in kws:
-        if kw[0:2] == "__":
-            continue
+def test_write_schema(tmpdir):
+    """Tests that the keyword table and documentation are written correctly
+    for the packaged schema.
+    """
+    import json
+    from collections import OrderedDict
+    from aflow import schema
+    from aflow.generators import _write_schema
+    from aflow.utility import load_module
+    from os import path
+    with open(path.join(path.dirname(schema.__file__), "schema.json")) as f:
+        docs = json.load(f, object_pairs_hook=OrderedDict)
+
+    kwdata = OrderedDict()
+    for name, (atype, ptype, units) in sorted(schema.keywords.items()):
+        kwdata[name] = OrderedDict(docs[name], type=atype, ptype=ptype,
+                                   units=units)
+    _write_schema(kwdata, str(tmpdir))
+
+    modobj = load_module("schema_copy", str(tmpdir.join("schema.py")))
+    assert modobj.keywords == schema.keywords
+    from aflow import parsers
+    generated = load_module("parsers_copy", str(tmpdir.join("parsers.py")))
+    assert generated.sources == parsers.sources
+    assert generated.parsers["geometry"]("1,1,1,90,90,90").shape == (6,)
+    with open(str(tmpdir.join("schema.json"))) as f:
+        assert json.load(f) == docs
+
+def test_incremental(tmpdir, monkeypatch):
+    """Tests offline regeneration from the schema snapshot, where only the
+    keywords that changed are regenerated.
+    """
+    from copy import deepcopy
+    from aflow import generators, schema
+    from aflow.utility import load_module
+    snapshot = generators.load_snapshot()
+    assert snapshot["version"] == schema.version
+    root = str(tmpdir)
+    changes = generators.keywords(root, snapshot["keywords"])
+    assert len(changes["added"]) == len(schema.keywords)
+    generated = load_module("schema_copy", str(tmpdir.join("schema.py")))
+    assert generated.keywords == schema.keywords
+    assert generated.casters == schema.casters
+    assert generated.casters["forces"] == "forces"
+    assert generated.version == 1
+
+    helped = []
+    original = generators._get_kw_help
+    def spy(keyword, metadata):
+        helped.append(keyword)
+        return original(keyword, metadata)
+    monkeypatch.setattr(generators, "_get_kw_help", spy)
+
+    mtime = tmpdir.join("schema.py").mtime()
+    changes = generators.keywords(root, snapshot["keywords"])
+    assert changes == {"added": [], "removed": [], "changed": []}
+    assert helped == []
+    assert tmpdir.join("schema.py").mtime() == mtime
 
-        assert hasattr(modobj.Entry, kw)
+    live = deepcopy(snapshot["keywords"])
+    live["Egap"]["units"] = "meV"
+    live["dummy"] = {"type": "number", "title": "dummy keyword"}
+    del live["sg2"]
+    live["__schema^2__"] = {"type": "meta"}
+    changes = generators.keywords(root, live)
+    assert changes == {"added": ["dummy"], "removed": ["sg2"],
+                       "changed": ["Egap"]}
+    assert sorted(helped) == ["Egap", "dummy"]
+    generated = load_module("schema_copy", str(tmpdir.join("schema.py")))
+    assert generated.version == 2
+    assert generated.keywords["Egap"] == ("number", "float", "meV")
+    assert generated.keywords["dummy"] == ("number", "float", "")
+    assert "sg2" not in generated.keywords
+    assert "__schema^2__" not in generated.keywords
+    assert generators.load_snapshot(str(tmpdir.join(
+        generators.snapshot)))["version"] == 2
@@ -176,3 +176,48 @@ def test_corner():
     k = (K.Egap > 0)
     with pytest.raises(ValueError):
         k3 = ((K.Egap < 2) | (K.Egap == 5))
+
+def test_lazy_import():
+    """Tests that `import aflow` doesn't import numpy or the keywords until
+    they are needed.
+    """
+    import sys
+    import subprocess
+    from aflow.utility import reporoot
+    script = ("import sys, aflow; "
+              "print(sorted(m for m in ('numpy', 'aflow.keywords') "
+              "if m in sys.modules)); aflow.K.forces.ptype; "
+              "print(sorted(m for m in ('numpy', 'aflow.keywords') "
+              "if m in sys.modules))")
+    output = subprocess.check_output([sys.executable, "-c", script],
+                                     cwd=reporoot)
+    before, after = output.decode("utf-8").strip().split('\n')
+    assert before == "[]"
+    assert after == "['aflow.keywords', 'numpy']"
+    assert K.forces.ptype.__name__ == "ndarray"
+    with pytest.raises(AttributeError):
+        import aflow
+        aflow.dummy
+
+def test_schema():
+    """Tests that keyword objects are built from the schema table with their
+    documentation loaded on demand.
+    """
+    import aflow
+    from aflow import schema
+    from aflow.entries import Entry
+    assert K.Egap.atype == "number"
+    assert K.Egap.ptype is float
+    assert K.Egap.units == "eV"
+    assert isinstance(K.Egap, K._Egap)
+    assert K.Egap.__doc__ == K._Egap.__doc__
+    assert "electronic energy band gap" in K.Egap.__doc__
+    assert "development level" in K.forces.__doc__
+    assert "'nsamples'" in K.kpoints.__doc__
+
+    assert "Examples:" in Entry.Egap.__doc__
+    assert ":meth:`kpoints`" in Entry.Egap.__doc__
+    assert set(aflow.list_keywords()) == set(schema.keywords)
+    assert "Egap" in dir(K)
+    with pytest.raises(AttributeError):
+        K._dummy
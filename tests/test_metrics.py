@@ -0,0 +1,144 @@
+"""Tests the instrumentation of requests and the summary of the events.
+"""
+import pytest
+
+@pytest.fixture
+def events():
+    """Registers a hook that collects the events while the test runs.
+    """
+    from aflow import metrics
+    result = []
+    metrics.register(result.append)
+    yield result
+    metrics.unregister(result.append)
+
+def test_disabled():
+    """Tests that no events are created while there are no hooks.
+    """
+    from aflow import metrics
+    assert metrics.hooks == []
+    assert metrics.start("page", "http://localhost") is None
+    metrics.finish(None)
+
+def test_events(events, tmpdir):
+    """Tests the events for pages, entries, lazily loaded keywords and files.
+    """
+    import aflow
+    from aflow import store
+    from aflow.testing.server import Emulator
+    from aflow.testing.synthetic import Synthetic
+    dataset = Synthetic(30, keywords=["natoms", "Egap"])
+    with Emulator(dataset):
+        entries = list(aflow.search(batch_size=20))
+        pages = [e for e in events if e.kind == "page"]
+        assert len(pages) == 2
+        for event in pages:
+            assert event.bytes > 0 and event.error is None
+            assert event.dns is not None and event.connect is not None
+            assert 0 < event.ttfb <= event.total
+            assert event.decode > 0
+        assert len([e for e in events if e.kind == "entry"]) == 30
+        assert all(e.cast > 0 for e in events if e.kind == "entry")
+
+        del events[:]
+        entries[0].Egap
+        entries[0].Egap
+        miss, hit = events
+        assert (miss.kind, miss.cache, hit.cache) == ("lazy", "miss", "hit")
+        assert miss.url.endswith("?Egap") and miss.bytes > 0
+        assert miss.cast > 0 and hit.bytes is None
+
+        files = entries[1].files
+        del events[:]
+        store.set_store(str(tmpdir))
+        try:
+            files["CONTCAR.relax"]()
+            files["CONTCAR.relax"]()
+        finally:
+            store.set_store(None)
+        miss, hit = events
+        assert (miss.kind, miss.cache, hit.cache) == ("file", "miss", "hit")
+        assert miss.bytes == hit.bytes > 0
+        assert miss.url.endswith("/CONTCAR.relax")
+
+        missing = aflow.entries.AflowFile(entries[1].aurl, "missing")
+        del events[:]
+        with pytest.raises(Exception):
+            missing()
+        assert events[0].kind == "file" and "404" in events[0].error
+
+def test_summary(capsys):
+    """Tests the aggregation and report of the events.
+    """
+    import aflow
+    from aflow import metrics
+    from aflow.testing.server import Emulator
+    from aflow.testing.synthetic import Synthetic
+    with Emulator(Synthetic(25, keywords=["natoms", "Egap"])):
+        with metrics.Summary() as summary:
+            for entry in aflow.search(batch_size=10):
+                entry.Egap
+    assert metrics.hooks == []
+    assert summary.stats["page"]["count"] == 3
+    assert summary.stats["entry"]["count"] == 25
+    assert summary.stats["lazy"]["misses"] == 25
+    assert summary.stats["page"]["dns"]["count"] == 3
+    assert summary.stats["lazy"]["cast"]["max"] > 0
+
+    output = capsys.readouterr()[0]
+    lines = output.strip().split('\n')
+    assert lines[0].split()[:3] == ["kind", "count", "errors"]
+    assert [l.split()[0] for l in lines[1:4]] == ["page", "lazy", "entry"]
+    assert "Elapsed" in lines[-1]
+
+def test_installed_opener(events):
+    """Tests that instrumented requests go through the handlers of the
+    installed opener.
+    """
+    from six.moves import urllib
+    import aflow
+    from aflow import transport
+    from aflow.testing.server import Emulator
+    from aflow.testing.synthetic import Synthetic
+    class Recorder(urllib.request.BaseHandler):
+        def __init__(self):
+            self.urls = []
+        def http_request(self, request):
+            self.urls.append(request.get_full_url())
+            return request
+    recorder = Recorder()
+    opener = urllib.request.build_opener(recorder)
+    urllib.request.install_opener(opener)
+    try:
+        with Emulator(Synthetic(5, keywords=["natoms"])):
+            assert aflow.search(batch_size=5).N == 5
+            timed = transport._opener()
+            assert aflow.search(batch_size=2).N == 5
+            assert transport._opener() is timed
+            assert len(recorder.urls) == 2
+    finally:
+        urllib.request.install_opener(None)
+    assert recorder.parent is opener
+    assert transport._opener() is not timed
+    assert events[0].dns is not None and events[0].connect is not None
+
+def test_https():
+    """Tests that HTTPS connections are timed too.
+    """
+    import socket
+    import threading
+    from aflow import metrics, transport
+    names = [type(h).__name__ for h in transport._opener().handlers]
+    assert "TimedHTTPSHandler" in names and "TimedHTTPHandler" in names
+
+    #The server accepts the connection but closes it before the TLS
+    #handshake completes.
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    url = "https://127.0.0.1:{0:d}/".format(server.getsockname()[1])
+    event = metrics.Event("file")
+    threading.Timer(0.2, server.close).start()
+    with pytest.raises(Exception):
+        transport._urlopen(url, event=event)
+    assert event.dns is not None
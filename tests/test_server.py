@@ -0,0 +1,87 @@
+"""Tests the local stand-in for the AFLUX API.
+"""
+import pytest
+
+@pytest.fixture
+def dataset(tmpdir):
+    """Returns the recorded entries repeated to 45 entries, with a structure
+    file for the first one.
+    """
+    from aflow.testing.server import Recorded
+    dataset = Recorded(["tests/data0.json", "tests/data1.json"], size=45,
+                       files=str(tmpdir))
+    folder = tmpdir.join(*dataset[0]["aurl"].split(':', 1)[1].split('/'))
+    folder.ensure(dir=True)
+    folder.join("CONTCAR.relax").write("contcar")
+    return dataset
+
+def test_recorded(dataset):
+    """Tests the repetition of the recorded entries to the dataset size.
+    """
+    assert len(dataset) == 45
+    assert len(set(dataset[i]["auid"] for i in range(45))) == 45
+    path = dataset[44]["aurl"].split(':', 1)[1]
+    assert dataset.find(path) == 44
+    assert dataset.find(path + "_x9") is None
+    assert dataset.file(path, "CONTCAR.relax") is None
+    assert dataset.listing(dataset[40]["aurl"].split(':', 1)[1]) == ["CONTCAR.relax"]
+    with pytest.raises(IndexError):
+        dataset[45]
+
+def test_filters():
+    """Tests the evaluation of the filters in the matchbook.
+    """
+    from aflow.testing.server import _evaluate
+    raw = {"Egap": "6.5", "species": "Be,O", "compound": "Be1O1"}
+    assert _evaluate("Egap(6*)", raw)
+    assert not _evaluate("Egap(*6)", raw)
+    assert _evaluate("Egap(!*6)", raw)
+    assert _evaluate("species('O')", raw)
+    assert _evaluate("compound(*'Be'*)", raw)
+    assert _evaluate("Egap(*6):species('O')", raw)
+    assert not _evaluate("Egap(6*),species('Si')", raw)
+    assert _evaluate("Egap((6*),(*7))", raw)
+    assert not _evaluate("natoms(2)", raw)
+
+def test_query(dataset):
+    """Tests queries, lazily loaded keywords and files against the emulator.
+    """
+    import aflow
+    from aflow import K
+    from aflow.testing.server import Emulator
+    with Emulator(dataset) as server:
+        entries = list(aflow.search(batch_size=20))
+        assert len(entries) == 45
+        assert server.requests["page"] == 3
+        assert entries[44].auid == dataset[44]["auid"]
+        assert "Egap" not in entries[0].attributes
+        assert entries[0].Egap == float(dataset[0]["Egap"])
+        assert server.requests["lazy"] == 1
+        assert entries[0].files[0].filename == "CONTCAR.relax"
+        assert entries[0].files["CONTCAR*"]() == "contcar"
+        assert entries[1].natoms is None
+
+        query = aflow.search(batch_size=10).filter(K.Egap > 6.5).orderby(
+            K.agl_thermal_conductivity_300K, reverse=True)
+        values = [e.agl_thermal_conductivity_300K for e in query]
+        expected = [float(dataset[i]["agl_thermal_conductivity_300K"])
+                    for i in range(45) if float(dataset[i]["Egap"]) > 6.5]
+        assert values == sorted(expected, reverse=True)
+        assert aflow.search().filter(K.Egap > 100).N == 0
+
+def test_errors(dataset):
+    """Tests the injected errors and latency.
+    """
+    import time
+    from six.moves import urllib
+    import aflow
+    from aflow.testing.server import Emulator
+    with Emulator(dataset, errors=1., seed=0):
+        with pytest.raises(urllib.error.HTTPError):
+            aflow.search().N
+
+    with Emulator(dataset, latency=0.05, bandwidth=1e5) as server:
+        start = time.time()
+        assert aflow.search(batch_size=45).N == 45
+        assert time.time() - start > 0.05
+        assert server.requests == dict(page=1, lazy=0, file=0, error=0)
@@ -0,0 +1,146 @@
+"""Tests the content-addressed local store for AFLOW files.
+"""
+import pytest
+
+@pytest.fixture
+def files(tmpdir):
+    """Returns an empty store that is enabled for the test.
+    """
+    from aflow import store
+    store.set_store(str(tmpdir.join("store")))
+    yield store.files
+    store.set_store(None)
+
+AURL = "aflowlib.duke.edu:AFLOWDATA/LIB2_RAW/CeMg_pv/304"
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_store(tmpdir, compress):
+    """Tests deduplication, compression, persistence and checksums.
+    """
+    from os import path, listdir
+    from aflow.store import FileStore
+    folder = str(tmpdir.join("store"))
+    store = FileStore(folder, compress=compress)
+    contents = b"contcar\n" * 1000
+    sha = store.put(AURL, "CONTCAR.relax", [contents[:100], contents[100:]])
+    assert store.put(AURL + "/1", "CONTCAR.relax", contents) == sha
+    assert (AURL, "CONTCAR.relax") in store
+    assert store.get(AURL, "CONTCAR.relax") == contents
+    assert store.get(AURL, "OUTCAR.relax") is None
+    assert len(listdir(path.join(folder, "objects", sha[0:2]))) == 1
+    assert (store.size < len(contents)) == compress
+
+    #A new store in the same folder picks up the index once it is written.
+    store.flush()
+    other = FileStore(folder)
+    assert other.get(AURL + "/1", "CONTCAR.relax") == contents
+
+    #Corrupted files are discarded.
+    store.put(AURL, "DOSCAR.static", b"doscar")
+    item = store.index[store._key(AURL, "DOSCAR.static")]
+    with open(store._blob(item["sha256"]), 'wb') as f:
+        f.write(b"other")
+    assert store.get(AURL, "DOSCAR.static") is None
+    assert (AURL, "DOSCAR.static") not in store
+
+def test_evict(tmpdir):
+    """Tests least recently used eviction once the store is full.
+    """
+    from aflow.store import FileStore
+    store = FileStore(str(tmpdir), maxsize=2500)
+    for i in range(3):
+        store.put(AURL, str(i), bytes(bytearray([i])) * 1000)
+        store.index[store._key(AURL, str(i))]["time"] = i
+    assert store.get(AURL, "0") is None
+    assert store.get(AURL, "2") is not None
+    assert store.size == 2000
+
+def test_shared(tmpdir):
+    """Tests batched index writes and two stores that share a folder.
+    """
+    from aflow.store import FileStore
+    first = FileStore(str(tmpdir), batch=2)
+    second = FileStore(str(tmpdir))
+    first.put(AURL, "0", b"0" * 10)
+    assert FileStore(str(tmpdir)).index == {}
+    first.put(AURL, "1", b"1" * 10)
+    assert len(FileStore(str(tmpdir)).index) == 2
+
+    second.put(AURL, "2", b"1" * 10)
+    second.put(AURL, "3", b"3" * 10)
+    second.flush()
+    first.flush()
+    for store in (first, second, FileStore(str(tmpdir))):
+        assert list(store.index) == [store._key(AURL, str(i)) for i in range(4)]
+        assert store.size == 30
+
+    #Reads are recorded in the order of least recently used files.
+    first.get(AURL, "0")
+    first.flush()
+    assert list(FileStore(str(tmpdir)).index)[-1] == first._key(AURL, "0")
+
+def test_oversized(tmpdir, monkeypatch):
+    """Tests that a file larger than the store can still be read after it was
+    downloaded; it is evicted by the next file.
+    """
+    from io import BytesIO
+    from aflow import store, transport
+    from aflow.entries import AflowFile
+    monkeypatch.setattr(transport, "urlopen",
+                        lambda url, headers=None, event=None:
+                        BytesIO(b"outcar\n" * 100))
+    store.set_store(str(tmpdir), maxsize=100)
+    try:
+        assert AflowFile(AURL, "OUTCAR.relax")() == "outcar\n" * 100
+        assert (AURL, "OUTCAR.relax") in store.files
+        store.files.put(AURL, "DOSCAR.static", b"doscar")
+        assert (AURL, "OUTCAR.relax") not in store.files
+        assert store.files.size == 6
+    finally:
+        store.set_store(None)
+
+def test_files(files, monkeypatch, tmpdir):
+    """Tests that file downloads and structures are served from the store.
+    """
+    import requests
+    from aflow import transport
+    from aflow.entries import AflowFile, Entry
+    from io import BytesIO
+    calls = []
+    def urlopen(url, headers=None, event=None):
+        calls.append(url)
+        return BytesIO(b"outcar\n" * 100)
+    monkeypatch.setattr(transport, "urlopen", urlopen)
+
+    assert AflowFile(AURL, "OUTCAR.relax")() == "outcar\n" * 100
+    target = str(tmpdir.join("outcar"))
+    AflowFile(AURL, "OUTCAR.relax")(target)
+    with open(target) as f:
+        assert f.read() == "outcar\n" * 100
+    assert len(calls) == 1
+
+    class Response(object):
+        text = "contcar"
+    monkeypatch.setattr(requests, "get", lambda url: calls.append(url) or Response)
+    entry = Entry(aurl=AURL)
+    assert entry._structure_text("CONTCAR.relax") == "contcar"
+    assert Entry(aurl=AURL)._structure_text("CONTCAR.relax") == "contcar"
+    assert len(calls) == 2
+
+def test_exit(tmpdir):
+    """Tests that only the enabled store is flushed when the interpreter
+    exits.
+    """
+    from aflow import store
+    from aflow.store import FileStore
+    store.set_store(str(tmpdir.join("first")))
+    first = store.files
+    store.set_store(str(tmpdir.join("second")))
+    try:
+        store.files.put(AURL, "CONTCAR.relax", b"contcar")
+        first.put(AURL, "CONTCAR.relax", b"contcar")
+        store._flush()
+        assert len(FileStore(str(tmpdir.join("second"))).index) == 1
+        assert len(FileStore(str(tmpdir.join("first"))).index) == 0
+    finally:
+        store.set_store(None)
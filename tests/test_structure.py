@@ -0,0 +1,166 @@
+"""Tests construction of atomic structures from keyword values.
+"""
+import pytest
+import numpy as np
+
+@pytest.fixture
+def silicon():
+    """Returns the raw keyword values for a diamond silicon entry.
+    """
+    return {
+        "auid": "aflow:0",
+        "aurl": "aflowlib.duke.edu:AFLOWDATA/ICSD_WEB/FCC/Si1_ICSD_0",
+        "geometry": "3.867,3.867,3.867,60,60,60",
+        "positions_fractional": "0,0,0;0.25,0.25,0.25",
+        "species": "Si",
+        "composition": "2",
+        "natoms": "2"
+    }
+
+def test_lattice():
+    """Tests the lattice vectors against the ASE implementation.
+    """
+    from ase.geometry import cellpar_to_cell
+    from aflow.structure import lattice
+    params = np.array([[3.867, 3.867, 3.867, 60, 60, 60],
+                       [2.5, 2.5, 4.1, 90, 90, 120],
+                       [4., 5., 6., 90, 90, 90],
+                       [5.1, 6.2, 7.3, 81.5, 102.3, 95.7]])
+    cells = lattice(params)
+    assert cells.shape == (4, 3, 3)
+    for p, cell in zip(params, cells):
+        assert np.allclose(cell, cellpar_to_cell(p))
+        assert np.allclose(lattice(p), cell)
+
+def test_symbols():
+    """Tests the expansion of species into per-atom symbols.
+    """
+    from aflow.structure import symbols
+    assert symbols({"species": ["Be", "O"], "composition": [2, 2]}) == \
+        ["Be", "Be", "O", "O"]
+    assert symbols({"species": ["Be", "O"], "stoichiometry": [0.25, 0.75],
+                    "natoms": 4}) == ["Be", "O", "O", "O"]
+    assert symbols({"species": ["Be", "O"]}) is None
+    assert symbols({"composition": [1]}) is None
+
+def test_entry_atoms(silicon, monkeypatch):
+    """Tests that the atoms object is built without any HTTP requests when
+    the keywords are available.
+    """
+    from aflow.entries import Entry
+    from aflow.structure import from_keywords
+    import requests
+    def offline(*args, **kwargs):
+        raise AssertionError("No requests should be made.")
+    monkeypatch.setattr(requests, "get", offline)
+
+    entry = Entry(**silicon)
+    at = entry.atoms(from_keywords=True)
+    assert at.get_chemical_symbols() == ["Si", "Si"]
+    assert np.allclose(at.get_scaled_positions(), [[0, 0, 0], [.25, .25, .25]])
+    assert np.allclose(at.cell.cellpar(), [3.867]*3 + [60]*3)
+    assert all(at.pbc)
+    assert entry.atoms() is at
+
+    #Cartesian keywords are in the frame of the structure file, so the file
+    #is needed for them.
+    from aflow import K
+    with pytest.raises(AssertionError):
+        Entry(**silicon).atoms("CONTCAR.relax", from_keywords=True,
+                               keywords={K.forces: "forces"})
+    with pytest.raises(AssertionError):
+        Entry(**silicon).atoms()
+
+    del silicon["composition"]
+    assert from_keywords(Entry(**silicon).attributes) is None
+    with pytest.raises(AssertionError):
+        Entry(**silicon).atoms(from_keywords=True)
+
+def test_pack(silicon, tmpdir):
+    """Tests packing the structures of several entries into arrays and the
+    round trip through memory-mapped files.
+    """
+    from aflow.entries import Entry
+    from aflow.structure import pack, PackedStructures
+    from aflow.caster import DtypePolicy
+    beo = {"auid": "aflow:1", "geometry": "2.7,2.7,4.38,90,90,120",
+           "positions_fractional": "0.333,0.667,0;0.333,0.667,0.375;"
+                                   "0.667,0.333,0.5;0.667,0.333,0.875",
+           "species": "Be,O", "composition": "2,2"}
+    entries = [Entry(**silicon), Entry(auid="aflow:2"), Entry(**beo)]
+    packed = pack(entries)
+    assert len(packed) == 3
+    assert packed.positions.shape == (6, 3)
+    assert list(packed.offsets) == [0, 2, 2, 6]
+    assert packed.lattices.shape == (3, 3, 3)
+    assert list(packed.valid) == [True, False, True]
+    assert packed.elements == ["Si", "Be", "O"]
+    assert list(packed.species) == [0, 0, 1, 1, 2, 2]
+    assert packed[2][2] == ["Be", "Be", "O", "O"]
+    assert packed.atoms(0).get_chemical_symbols() == ["Si", "Si"]
+
+    cartesian = pack(entries, scaled=False)
+    assert np.allclose(cartesian.positions[2:],
+                       np.dot(packed.positions[2:], packed.lattices[2]))
+    assert np.allclose(cartesian.atoms(2).get_scaled_positions(),
+                       packed.atoms(2).get_scaled_positions())
+
+    folder = packed.save(str(tmpdir.join("packed")))
+    loaded = PackedStructures.load(folder)
+    assert isinstance(loaded.positions, np.memmap)
+    assert np.allclose(loaded.positions, packed.positions)
+    assert loaded.elements == packed.elements
+    assert list(loaded.valid) == list(packed.valid)
+
+    single = pack(entries, dtypes=DtypePolicy(float="float32"))
+    assert single.positions.dtype == np.float32
+    assert single.lattices.dtype == np.float32
+
+    empty = pack([])
+    assert len(empty) == 0
+    assert empty.positions.shape == (0, 3)
+
+def test_read_poscar():
+    """Tests the VASP structure parser against ASE for the different flavors
+    of the file format.
+    """
+    from six import StringIO
+    from ase.io import read
+    from aflow.structure import read_poscar
+    header = "Be2O2 comment\n{scale}\n2.7 0 0\n-1.35 2.338 0\n0 0 4.38\n"
+    coords = ["0.333 0.667 0", "0.333 0.667 0.375",
+              "0.667 0.333 0.5", "0.667 0.333 0.875"]
+    variants = [
+        ("1.0", "2 2\nDirect\n", coords),
+        ("1.5", "Be O\n2 2\nDirect\n", [c + " T T F" for c in coords]),
+        ("-40.0", "2 2\nSelective dynamics\nDirect\n",
+         [c + " Be" for c in coords]),
+        ("1.0 1.0 2.0", "2 2\ndirect\n", coords),
+        ("1.2", "Be O\n2 2\nCartesian\n",
+         ["0 0 0", "0.5 0.5 1.1", "1 0 2.5", "0.2 1.4 3"]),
+    ]
+    for scale, middle, lines in variants:
+        text = header.format(scale=scale) + middle + '\n'.join(lines) + '\n'
+        cell, positions, symbols = read_poscar(text, ["Be", "O"])
+        assert symbols == ["Be", "Be", "O", "O"]
+
+        expected = read(StringIO("Be O !" + text), format="vasp")
+        assert np.allclose(cell, expected.cell[:])
+        assert np.allclose(positions, expected.get_scaled_positions(wrap=False))
+
+    with pytest.raises(ValueError):
+        read_poscar(header.format(scale="1.0") + "2 2\nDirect\n" + coords[0])
+    with pytest.raises(ValueError):
+        read_poscar(header.format(scale="1.0") + "2 2\nDirect\n" +
+                    '\n'.join(coords))
+    #Truncated files and missing lines raise ValueError too.
+    malformed = [header.format(scale="1.0") + "Be O\n2 2\nSelective\n",
+                 header.format(scale="1.0") + "Be O\n2 2\n\n" +
+                 '\n'.join(coords),
+                 header.format(scale="1.0") + "\n2 2\nDirect\n" +
+                 '\n'.join(coords),
+                 header.format(scale="1.0") + "2 2\nSelective dynamics\n\n" +
+                 '\n'.join(coords)]
+    for text in malformed:
+        with pytest.raises(ValueError):
+            read_poscar(text, ["Be", "O"])
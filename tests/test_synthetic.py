@@ -0,0 +1,101 @@
+"""Tests the generator of synthetic AFLOW entries.
+"""
+import pytest
+
+def test_entries(capsys):
+    """Tests that synthetic entries are reproducible and that the values of
+    every keyword can be cast.
+    """
+    import numpy as np
+    from aflow.entries import Entry
+    from aflow.schema import keywords
+    from aflow.testing.synthetic import Synthetic
+    dataset = Synthetic(50, seed=3)
+    assert dataset[7] == Synthetic(50, seed=3)[7]
+    assert dataset[7] != Synthetic(50, seed=4)[7]
+    assert dataset[-1] == dataset[49]
+    with pytest.raises(IndexError):
+        dataset[50]
+
+    entries = [Entry(**raw) for raw in dataset]
+    assert "ERROR" not in capsys.readouterr()[0]
+    assert len(set(e.auid for e in entries)) == 50
+    for entry in entries:
+        assert set(entry.attributes) == set(keywords)
+        natoms, nspecies = entry.natoms, entry.nspecies
+        assert entry.forces.shape == (natoms, 3)
+        assert entry.positions_fractional.shape == (natoms, 3)
+        assert entry.stress_tensor.shape == (3, 3)
+        assert entry.geometry.shape == (6,)
+        assert len(entry.species) == nspecies
+        assert np.sum(entry.composition) == natoms
+        assert len(entry.ldau_TLUJ["LDAUU"]) == nspecies
+        assert entry.kpoints["nsamples"] == 20
+
+def test_positions():
+    """Tests that the cartesian positions match the fractional positions in
+    the lattice of every entry, including the non-orthogonal ones.
+    """
+    import numpy as np
+    from aflow.entries import Entry
+    from aflow.structure import lattice
+    from aflow.testing.synthetic import Synthetic
+    dataset = Synthetic(200, keywords=["geometry", "positions_fractional",
+                                       "positions_cartesian"])
+    angles = set()
+    for raw in dataset:
+        entry = Entry(**raw)
+        angles.add(tuple(entry.geometry[3:]))
+        expected = np.dot(entry.positions_fractional, lattice(entry.geometry))
+        assert np.allclose(entry.positions_cartesian, expected, atol=1e-4)
+    assert len(angles) == 3
+
+def test_options():
+    """Tests the keyword selection, cardinalities and missing values.
+    """
+    from aflow.testing.synthetic import Synthetic
+    full = Synthetic(20)
+    dataset = Synthetic(20, keywords=["Egap", "forces"])
+    assert list(dataset[0]) == ["aurl", "auid", "compound", "Egap", "forces"]
+    assert dataset[4]["forces"] == full[4]["forces"]
+
+    dataset = Synthetic(200, keywords=["species", "prototype", "Egap"],
+                        cardinality={"species": 4, "prototype": 2, "Egap": 5})
+    raws = list(dataset)
+    assert len(set(s for r in raws for s in r["species"].split(','))) <= 4
+    assert len(set(r["prototype"] for r in raws)) == 2
+    assert len(set(r["Egap"] for r in raws)) == 5
+
+    dataset = Synthetic(100, keywords=["Egap", "forces", "natoms"], missing=1.)
+    assert all("forces" not in r and "Egap" in r for r in dataset)
+
+def test_pages():
+    """Tests the lazy paging over a large dataset.
+    """
+    import types
+    from aflow.testing.synthetic import Synthetic, pages
+    dataset = Synthetic(10**6, keywords=["Egap"])
+    result = pages(dataset, k=1000, start=999000)
+    assert isinstance(result, types.GeneratorType)
+    result = list(result)
+    assert len(result) == 1
+    assert "1000000 of 1000000" in result[0]
+    assert [len(p) for p in pages(dataset, k=3, stop=7)] == [3, 3, 1]
+
+def test_server():
+    """Tests serving synthetic entries (and their files) with the emulator.
+    """
+    import aflow
+    from aflow import K
+    from aflow.testing.server import Emulator
+    from aflow.testing.synthetic import Synthetic
+    dataset = Synthetic(120)
+    with Emulator(dataset):
+        query = aflow.search(batch_size=50).filter(K.natoms < 3).select(
+            K.natoms, K.species)
+        entries = list(query)
+        assert len(entries) > 0 and all(e.natoms < 3 for e in entries)
+        entry = entries[0]
+        atoms = entry.atoms(from_keywords=False)
+        assert len(atoms) == entry.natoms
+        assert atoms.get_chemical_symbols()[0] in entry.species
@@ -0,0 +1,84 @@
+"""Tests the HTTP helper functions in :mod:`aflow.transport`.
+"""
+import pytest
+
+def test_url():
+    """Tests conversion of AFLOW URLs to HTTP URLs.
+    """
+    from aflow.transport import url
+    aurl = "aflowlib.duke.edu:AFLOWDATA/ICSD_WEB/HEX/Be1O1_ICSD_15620"
+    assert url(aurl) == ("http://aflowlib.duke.edu/AFLOWDATA/ICSD_WEB/HEX/"
+                         "Be1O1_ICSD_15620")
+    assert url(aurl + ":LDAU2", "?species").endswith("_15620:LDAU2?species")
+
+@pytest.mark.parametrize("ext,module", [(".bz2", "bz2"), (".gz", "gzip"),
+                                        (".xz", "lzma")])
+def test_chunks(monkeypatch, ext, module):
+    """Tests chunked reading with streaming decompression.
+    """
+    from io import BytesIO
+    from importlib import import_module
+    from aflow import transport
+    monkeypatch.setattr(transport, "chunk_size", 100)
+    data = b"0123456789" * 1000
+    compressed = import_module(module).compress(data)
+    assert transport.compression("EIGENVAL.bands" + ext) == ext
+    chunks = list(transport.chunks(BytesIO(compressed), ext))
+    assert b''.join(chunks) == data
+
+    chunks = list(transport.chunks(BytesIO(data)))
+    assert len(chunks) == 100
+    assert transport.compression("CONTCAR.relax") is None
+
+def test_decode():
+    """Tests detection of binary contents.
+    """
+    from aflow.transport import decode
+    assert decode(b"text") == "text"
+    assert decode(b"\xff\xfe\x00") is None
+
+def test_archive(tmpdir):
+    """Tests recording the requests of a session and replaying them without
+    the server.
+    """
+    import aflow
+    from aflow import transport, control
+    from aflow.testing.server import Emulator, use
+    from aflow.testing.synthetic import Synthetic
+    target = str(tmpdir.join("session.zip"))
+    default = control.server
+
+    def session():
+        entries = list(aflow.search(batch_size=10).select(aflow.K.natoms))
+        contcar = transport.url(entries[4].aurl, "/CONTCAR.relax")
+        return ([e.auid for e in entries], entries[3].Egap,
+                entries[4].files["CONTCAR*"](), entries[5].atoms().positions,
+                contcar)
+
+    try:
+        with Emulator(Synthetic(25)) as server:
+            transport.set_archive(target, "record")
+            recorded = session()
+            assert transport.archive.get(recorded[4]) is not None
+            count = dict(server.requests)
+            #Requests that are already in the archive aren't repeated.
+            assert session()[0] == recorded[0]
+            assert server.requests == count
+            url = server.url
+        transport.set_archive(target, "replay")
+        assert len(transport.archive) == sum(count.values())
+
+        #The server is gone, so everything has to come from the archive.
+        use(url)
+        replayed = session()
+        assert replayed[:3] == recorded[:3]
+        assert (replayed[3] == recorded[3]).all()
+        response = transport.urlopen(recorded[4], {"Range": "bytes=4-"})
+        assert response.getcode() == 206
+        assert response.read() == recorded[2][4:].encode("utf-8")
+        with pytest.raises(IOError):
+            aflow.search(batch_size=7).N
+    finally:
+        transport.set_archive(None)
+        transport.set_server(None)
+        control.server = default